@@ -0,0 +1,322 @@
+"""
+Micro-benchmarks for the per-section extraction hot paths.
+
+Run with:  python benchmark_extraction.py [iterations]
+
+Each benchmark compares the previous implementation ("before", reproduced
+here) against the current SmartExtractor code ("after") on synthetic
+sections shaped like real WOB report records.
+"""
+
+import logging
+import os
+import queue
+import re
+import shutil
+import sys
+import tempfile
+import timeit
+import tracemalloc
+from logging.handlers import QueueHandler, QueueListener
+
+from config_manager import ConfigManager
+from extractor_engine import SmartExtractor
+from pattern_registry import ExtractionProfile, SOCIAL_MEDIA_PLATFORMS
+from record_splitter import SOCRecordSplitter, SOC_HEADER_PATTERN
+
+
+def build_section(concerns, num_accounts=4):
+    """A synthetic SOC section with every concern listed and several accounts"""
+    lines = [
+        " Jordan Example ..............................",
+        "Location: Kamloops ...........................",
+        "School: Valleyview Secondary School __________",
+        "SOC Affiliation: None Known",
+        "",
+    ]
+    for n, concern in enumerate(concerns):
+        lines.append(f"{'☒' if n % 4 == 0 else '☐'} {concern}")
+    lines.append("☐ Other:")
+    lines.append("")
+    for n in range(num_accounts):
+        platform = SOCIAL_MEDIA_PLATFORMS[n % len(SOCIAL_MEDIA_PLATFORMS)]
+        lines.extend([
+            f"{platform} Information & Activity",
+            f"{platform} Display Name: display_{n}",
+            f"{platform} Username: user_{n}",
+            f"{platform} ID: 10000{n}",
+            f"{platform} URL: https://www.{platform.lower()}.com/user_{n}/",
+            "Activity summary: posts about school events and weekend plans.",
+            "",
+        ])
+    return "\n".join(lines)
+
+
+# ---------------------------------------------------------------------------
+# Previous implementation: pattern strings built on every call
+# ---------------------------------------------------------------------------
+
+def legacy_field_search(section):
+    for patterns in (
+        [r'SOC Affiliation:\s*(.+?)(?:\n|$)', r'Affiliation:\s*(.+?)(?:\n|$)',
+         r'Gang Affiliation:\s*(.+?)(?:\n|$)', r'Group Affiliation:\s*(.+?)(?:\n|$)'],
+        [r'Location:\s*(.+?)(?:\n|$)', r'City/Town:\s*(.+?)(?:\n|$)', r'Municipality:\s*(.+?)(?:\n|$)'],
+        [r'School.*?:\s*(.+?)(?:\n|$)', r'Institution:\s*(.+?)(?:\n|$)', r'School Name:\s*(.+?)(?:\n|$)'],
+    ):
+        for pattern in patterns:
+            if re.search(pattern, section, re.IGNORECASE):
+                break
+
+
+def legacy_is_concern_checked(text, concern):
+    for pattern in [f'☒\\s*{re.escape(concern)}', f'\\[X\\]\\s*{re.escape(concern)}', f'✓\\s*{re.escape(concern)}']:
+        if re.search(pattern, text, re.IGNORECASE):
+            return True
+    return bool(re.search(f'{re.escape(concern)}.*?\\|.*?X', text, re.IGNORECASE))
+
+
+def legacy_is_concern_unchecked(text, concern):
+    for pattern in [f'☐\\s*{re.escape(concern)}', f'\\[\\s\\]\\s*{re.escape(concern)}']:
+        if re.search(pattern, text, re.IGNORECASE):
+            return True
+    return False
+
+
+def legacy_platform_data(content, platform):
+    for patterns in (
+        [f'{platform}\\s+Display\\s+Name:\\s*(.+?)(?:\\n|$)', f'Display\\s+Name:\\s*(.+?)(?:\\n|$)'],
+        [f'{platform}\\s+Username:\\s*(.+?)(?:\\n|$)', f'Username:\\s*(.+?)(?:\\n|$)', f'@(.+?)(?:\\s|\\n|$)'],
+        [f'{platform}\\s+ID:\\s*(.+?)(?:\\n|$)', f'{platform}\\s+User\\s+ID:\\s*(.+?)(?:\\n|$)',
+         f'ID:\\s*(.+?)(?:\\n|$)', f'User\\s+ID:\\s*(.+?)(?:\\n|$)'],
+        [f'{platform}\\s+URL:\\s*(.+?)(?:\\n|$)', f'URL:\\s*(.+?)(?:\\n|$)'],
+    ):
+        for pattern in patterns:
+            if re.search(pattern, content, re.IGNORECASE):
+                break
+
+
+def legacy_extract_social_media(section):
+    platforms = '|'.join(SOCIAL_MEDIA_PLATFORMS)
+    sm_sections = []
+    for pattern in [f'({platforms}).*?Information.*?Activity', f'({platforms})\\s+(?:Display\\s+)?Name:',
+                    f'({platforms})\\s+Username:']:
+        temp_sections = re.split(pattern, section, flags=re.IGNORECASE)
+        if len(temp_sections) > 1:
+            sm_sections = temp_sections
+            break
+    for i in range(1, len(sm_sections), 2):
+        platform = sm_sections[i]
+        content = sm_sections[i + 1] if i + 1 < len(sm_sections) else ""
+        next_platform_idx = len(content)
+        for p in SOCIAL_MEDIA_PLATFORMS:
+            match = re.search(f'{p}.*?(?:Information|Display Name|Username):', content, re.IGNORECASE)
+            if match:
+                next_platform_idx = min(next_platform_idx, match.start())
+        legacy_platform_data(content[:next_platform_idx], platform)
+
+
+def legacy_section(section, concerns):
+    legacy_field_search(section)
+    for concern in concerns:
+        if not legacy_is_concern_checked(section, concern):
+            legacy_is_concern_unchecked(section, concern)
+    for platform in SOCIAL_MEDIA_PLATFORMS:
+        legacy_platform_data(section, platform)
+
+
+def legacy_clean_extracted_text(text):
+    if not text:
+        return text
+    cleaned = re.sub(r'[\.\·_\-\s]+$', '', text)
+    cleaned = re.sub(r'[\.\·]{3,}', '', cleaned)
+    cleaned = re.sub(r'[_]{3,}', '', cleaned)
+    cleaned = re.sub(r'[-]{3,}', '', cleaned)
+    cleaned = re.sub(r'\s+', ' ', cleaned)
+    return cleaned.strip()
+
+
+def current_section(extractor, section):
+    for patterns in (extractor.patterns.soc_affiliation, extractor.patterns.location, extractor.patterns.school):
+        for pattern in patterns:
+            if pattern.search(section):
+                break
+    for concern in extractor.concern_categories:
+        if not extractor.is_concern_checked(section, concern):
+            extractor.is_concern_unchecked(section, concern)
+    for platform in SOCIAL_MEDIA_PLATFORMS:
+        fields = extractor.patterns.platform_fields(platform)
+        for patterns in fields.values():
+            for pattern in patterns:
+                if pattern.search(section):
+                    break
+
+
+def report(name, before, after, iterations):
+    per_before = before / iterations * 1e6
+    per_after = after / iterations * 1e6
+    print(f"{name:40} before {per_before:9.1f} µs   after {per_after:9.1f} µs   "
+          f"speedup {per_before / per_after:5.2f}x")
+
+
+def bench_pattern_registry(extractor, section, iterations):
+    """Per-section pattern matching: per-call pattern strings vs the compiled registry"""
+    concerns = extractor.concern_categories
+    # Other pattern users in the same process compete for re's internal cache
+    before = timeit.timeit(lambda: (legacy_section(section, concerns), re.purge()), number=iterations)
+    after = timeit.timeit(lambda: current_section(extractor, section), number=iterations)
+    report("pattern registry (cold re cache)", before, after, iterations)
+
+    before = timeit.timeit(lambda: legacy_section(section, concerns), number=iterations)
+    report("pattern registry (warm re cache)", before, after, iterations)
+
+
+def bench_concern_scanner(extractor, section, iterations):
+    """Concern flags: 17 categories x checked/unchecked/table searches vs one scanner pass"""
+    def per_category():
+        for concern in extractor.concern_categories:
+            if not legacy_is_concern_checked(section, concern):
+                legacy_is_concern_unchecked(section, concern)
+
+    before = timeit.timeit(per_category, number=iterations)
+    after = timeit.timeit(lambda: extractor.scan_concerns(section), number=iterations)
+    report("concern scanner", before, after, iterations)
+
+
+def bench_social_media(extractor, section, iterations):
+    """Social media accounts: split + per-platform boundary searches vs one tokenizer pass"""
+    accounts_section = build_section(extractor.concern_categories, num_accounts=40)
+    before = timeit.timeit(lambda: legacy_extract_social_media(accounts_section), number=iterations)
+    after = timeit.timeit(lambda: extractor.extract_social_media(accounts_section), number=iterations)
+    report("social media tokenizer (40 accounts)", before, after, iterations)
+
+
+def bench_section_views(extractor, section, iterations):
+    """Record parsing for a 500-record document: re.split section copies vs offset views"""
+    document = "".join(f"Subject of Concern:{section}\n" for _ in range(500))
+    runs = max(1, iterations // 100)
+
+    def copied_sections():
+        for part in re.split(SOC_HEADER_PATTERN, document)[1:]:
+            extractor.extract_record_from_section(part)
+
+    def section_views():
+        splitter = SOCRecordSplitter()
+        for view in splitter.feed(document) + splitter.close():
+            extractor.extract_record_from_section(view)
+
+    before = timeit.timeit(copied_sections, number=runs)
+    after = timeit.timeit(section_views, number=runs)
+    report("section views (500 records)", before, after, runs)
+
+    for name, parse in (("copied sections", copied_sections), ("section views", section_views)):
+        tracemalloc.start()
+        parse()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{'':40} {name:16} peak allocation {peak / 1024:9.1f} KiB")
+
+
+def bench_text_cleaning(extractor, section, iterations):
+    """Field cleaning: five re.sub passes vs the fused cleaner and its batched variant"""
+    fields = [line.split(':', 1)[-1] for line in section.split('\n') if line] * 4
+    before = timeit.timeit(lambda: [legacy_clean_extracted_text(field) for field in fields], number=iterations)
+    after = timeit.timeit(lambda: [extractor.clean_extracted_text(field) for field in fields], number=iterations)
+    report(f"text cleaning ({len(fields)} fields)", before, after, iterations)
+
+    after = timeit.timeit(lambda: extractor.clean_extracted_texts(fields), number=iterations)
+    report(f"text cleaning, batched ({len(fields)} fields)", before, after, iterations)
+
+
+def bench_district_profiles(extractor, section, iterations):
+    """Field variants for a district using the later labels: every variant in order vs its profile"""
+    # A district whose reports say "City/Town:" and "Institution:" and have no affiliation line
+    section = (section.replace("Location:", "City/Town:").replace("School:", "Institution:")
+               .replace("SOC Affiliation: None Known", ""))
+    end = len(section)
+    registry = extractor.patterns
+    fields = ('soc_affiliation', 'location', 'school')
+
+    def every_variant():
+        for field in fields:
+            for pattern in getattr(registry, field):
+                if pattern.search(section, 0, end):
+                    break
+
+    def run(profile):
+        return lambda: [profile.search(field, section, 0, end) for field in fields]
+
+    before = timeit.timeit(every_variant, number=iterations)
+    configured = ExtractionProfile('SD99', 'checkbox', registry.field_variants, {
+        'soc_affiliation': ['SOC Affiliation'], 'location': ['City/Town'], 'school': ['Institution']})
+    after = timeit.timeit(run(configured), number=iterations)
+    report("field variants, configured profile", before, after, iterations)
+
+
+def bench_debug_logging(extractor, section, iterations):
+    """Debug mode on a 500-record document: file handler on the extracting thread vs the log queue"""
+    document = "".join(f"Subject of Concern:{section}\n" for _ in range(500))
+    runs = max(1, iterations // 100)
+    logger = extractor.logger
+    saved_handlers, saved_debug = list(logger.handlers), extractor.debug_mode
+    folder = tempfile.mkdtemp()
+    file_handler = logging.FileHandler(os.path.join(folder, "debug.log"))
+    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+
+    def parse():
+        splitter = SOCRecordSplitter()
+        for view in splitter.feed(document) + splitter.close():
+            extractor.extract_record_from_section(view)
+
+    def use_handler(handler):
+        for existing in list(logger.handlers):
+            logger.removeHandler(existing)
+        logger.addHandler(handler)
+
+    try:
+        use_handler(file_handler)
+        extractor.debug_mode = False
+        quiet = timeit.timeit(parse, number=runs)
+        extractor.debug_mode = True
+        before = timeit.timeit(parse, number=runs)
+
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, file_handler)
+        listener.start()
+        use_handler(QueueHandler(log_queue))
+        after = timeit.timeit(parse, number=runs)
+        listener.stop()
+        report("debug logging (500 records)", before, after, runs)
+        print(f"{'':40} debug off {quiet / runs * 1e3:9.1f} ms   debug on {after / runs * 1e3:9.1f} ms"
+              f"   overhead {(after - quiet) / quiet * 100:5.1f}%")
+    finally:
+        for existing in list(logger.handlers):
+            logger.removeHandler(existing)
+        for handler in saved_handlers:
+            logger.addHandler(handler)
+        extractor.debug_mode = saved_debug
+        file_handler.close()
+        shutil.rmtree(folder)
+
+
+BENCHMARKS = [
+    bench_pattern_registry,
+    bench_concern_scanner,
+    bench_social_media,
+    bench_section_views,
+    bench_text_cleaning,
+    bench_district_profiles,
+    bench_debug_logging,
+]
+
+
+def main(iterations=200):
+    extractor = SmartExtractor(ConfigManager())
+    section = build_section(extractor.concern_categories)
+    print(f"Section length: {len(section)} characters, {iterations} iterations")
+    print("-" * 100)
+    for benchmark in BENCHMARKS:
+        benchmark(extractor, section, iterations)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -6,6 +6,7 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[],
+    # Imported on first use rather than at start-up, so listed explicitly to keep them bundled
     hiddenimports=['pdfplumber', 'pandas', 'openpyxl', 'PIL', 'pdfminer', 'pdfminer.six'],
     hookspath=[],
     hooksconfig={},
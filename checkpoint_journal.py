@@ -0,0 +1,86 @@
+import json
+import os
+
+
+class CheckpointJournal:
+    """Append-only JSONL record of the files a batch run has finished.
+
+    Each line holds one PDF's result and per-file stats together with the
+    file's size/mtime and the extractor fingerprint (version + config hash)
+    it was produced with. A run that is interrupted can be resumed: entries
+    whose file and fingerprint are unchanged are reused instead of
+    re-extracting the PDF. Lines are flushed and fsynced as they are written,
+    so at most the file being written when the process died is lost.
+    """
+
+    def __init__(self, output_folder, month_year, label='Checkpoint'):
+        self.path = os.path.join(output_folder, f".WOB {label} ({month_year}).jsonl")
+        self._entries = {}
+        self._ends_with_newline = True
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except OSError:
+            return
+
+        self._ends_with_newline = not content or content.endswith('\n')
+        for line in content.splitlines():
+            try:
+                entry = json.loads(line)
+                self._entries[entry['path']] = entry
+            except (ValueError, KeyError, TypeError):
+                # A line cut short by a crash; that file is simply extracted again
+                continue
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def _file_signature(pdf_path):
+        stat = os.stat(pdf_path)
+        return stat.st_size, stat.st_mtime_ns
+
+    def get(self, pdf_path, fingerprint):
+        """Return the journaled (result, stats) for pdf_path, or None if it must be extracted"""
+        entry = self._entries.get(os.path.abspath(pdf_path))
+        if entry is None or entry.get('fingerprint') != fingerprint:
+            return None
+        try:
+            if list(self._file_signature(pdf_path)) != [entry['size'], entry['mtime_ns']]:
+                return None
+        except OSError:
+            return None
+        return entry['result'], entry['stats']
+
+    def record(self, pdf_path, fingerprint, result, stats):
+        """Append a finished file and force it to disk"""
+        size, mtime_ns = self._file_signature(pdf_path)
+        entry = {
+            'path': os.path.abspath(pdf_path),
+            'size': size,
+            'mtime_ns': mtime_ns,
+            'fingerprint': fingerprint,
+            'result': result,
+            'stats': stats
+        }
+        line = json.dumps(entry) + '\n'
+        if not self._ends_with_newline:
+            line = '\n' + line
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+        self._ends_with_newline = True
+        self._entries[entry['path']] = entry
+
+    def clear(self):
+        """Forget every entry and delete the journal file"""
+        self._entries = {}
+        self._ends_with_newline = True
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
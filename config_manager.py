@@ -1,20 +1,157 @@
-import pandas as pd
+import hashlib
+import json
+import math
 import os
 
+CONFIG_CACHE_VERSION = 1
+
+
+def _plain(value):
+    """A spreadsheet cell as a JSON value; empty cells (NaN) become None"""
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if hasattr(value, 'item'):
+        return _plain(value.item())  # numpy scalar
+    return value
+
+
 class ConfigManager:
-    def __init__(self):
-        self.config_file = "extraction_config.xlsx"
+    """The extraction settings in extraction_config.xlsx.
+
+    The spreadsheet is compiled once into a JSON cache holding the Patterns
+    and Districts sheets as plain rows, keyed by the workbook's size, mtime
+    and SHA-256, so a normal start reads a small JSON file instead of
+    loading the workbook with pandas and openpyxl. A workbook whose mtime
+    changed but whose contents did not (e.g. copied back from a share) is
+    recognised by its hash. patterns_df and districts_df are still available
+    and built on first use. reload_if_changed() picks up edits to the
+    workbook while the application is running. With use_cache=False the
+    workbook is parsed on every load and no cache file is written.
+    """
+
+    def __init__(self, config_file="extraction_config.xlsx", cache_file=None, use_cache=True):
+        self.config_file = config_file
+        self.cache_file = cache_file or os.path.join('cache', 'extraction_config.json')
+        self.use_cache = use_cache
         self.load_or_create_config()
-    
+
     def load_or_create_config(self):
         if not os.path.exists(self.config_file):
             self.create_default_config()
-        
-        # Load configurations
-        self.patterns_df = pd.read_excel(self.config_file, sheet_name='Patterns')
-        self.districts_df = pd.read_excel(self.config_file, sheet_name='Districts')
-    
+
+        compiled = self._load_compiled()
+        if compiled is None:
+            compiled = self.compile_config()
+            self._save_compiled(compiled)
+        self._apply(compiled)
+
+    def reload_if_changed(self):
+        """Reload the config if the workbook changed on disk; returns True when the config_hash changed.
+
+        Costs one stat when nothing changed, so it can be called before every file.
+        """
+        try:
+            if self._file_signature() == self._signature:
+                return False
+        except OSError:
+            return False  # Workbook missing or being replaced; keep the loaded config
+        previous_hash = self.config_hash
+        self.load_or_create_config()
+        return self.config_hash != previous_hash
+
+    def _apply(self, compiled):
+        self.patterns_columns = compiled['patterns_columns']
+        self.patterns = compiled['patterns']
+        self.districts_columns = compiled['districts_columns']
+        self.districts = compiled['districts']
+        self.config_hash = compiled['config_hash']
+        self._signature = (compiled['size'], compiled['mtime_ns'])
+        self._patterns_df = None
+        self._districts_df = None
+
+    def _file_signature(self):
+        stat = os.stat(self.config_file)
+        return stat.st_size, stat.st_mtime_ns
+
+    def _file_sha256(self):
+        with open(self.config_file, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+
+    def _load_compiled(self):
+        """The cached compiled config if it matches the workbook on disk, else None"""
+        if not self.use_cache:
+            return None
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                compiled = json.load(f)
+            if (compiled.get('version') != CONFIG_CACHE_VERSION
+                    or compiled.get('source') != os.path.abspath(self.config_file)):
+                return None
+            size, mtime_ns = self._file_signature()
+            if (compiled['size'], compiled['mtime_ns']) == (size, mtime_ns):
+                return compiled
+            if compiled['size'] == size and compiled['sha256'] == self._file_sha256():
+                # Touched but unchanged: remember the new mtime so the next start skips the hash
+                compiled['mtime_ns'] = mtime_ns
+                self._save_compiled(compiled)
+                return compiled
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return None
+
+    def _save_compiled(self, compiled):
+        if not self.use_cache:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.cache_file) or '.', exist_ok=True)
+            temp_path = f"{self.cache_file}.{os.getpid()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(compiled, f)
+            os.replace(temp_path, self.cache_file)
+        except OSError:
+            pass  # A read-only cache folder only costs the workbook parse on the next start
+
+    def compile_config(self):
+        """Parse the workbook (the only place pandas/openpyxl are used) into the cached form"""
+        import pandas as pd
+
+        size, mtime_ns = self._file_signature()
+        sha256 = self._file_sha256()
+        patterns_df = pd.read_excel(self.config_file, sheet_name='Patterns')
+        districts_df = pd.read_excel(self.config_file, sheet_name='Districts')
+        return {
+            'version': CONFIG_CACHE_VERSION,
+            'source': os.path.abspath(self.config_file),
+            'size': size,
+            'mtime_ns': mtime_ns,
+            'sha256': sha256,
+            # Same hash as before the cache existed, so cached extraction results stay valid
+            'config_hash': hashlib.sha256(
+                (patterns_df.to_csv(index=False) + districts_df.to_csv(index=False)).encode()
+            ).hexdigest(),
+            'patterns_columns': [str(column) for column in patterns_df.columns],
+            'patterns': [{str(k): _plain(v) for k, v in row.items()} for row in patterns_df.to_dict('records')],
+            'districts_columns': [str(column) for column in districts_df.columns],
+            'districts': [{str(k): _plain(v) for k, v in row.items()} for row in districts_df.to_dict('records')],
+        }
+
+    @property
+    def patterns_df(self):
+        if self._patterns_df is None:
+            import pandas as pd
+            self._patterns_df = pd.DataFrame(self.patterns, columns=self.patterns_columns)
+        return self._patterns_df
+
+    @property
+    def districts_df(self):
+        if self._districts_df is None:
+            import pandas as pd
+            self._districts_df = pd.DataFrame(self.districts, columns=self.districts_columns)
+        return self._districts_df
+
     def create_default_config(self):
+        import pandas as pd
+
         with pd.ExcelWriter(self.config_file) as writer:
             # Patterns sheet
             patterns = pd.DataFrame({
@@ -24,11 +161,15 @@ class ConfigManager:
                 'Alternative_2': ['Subject:', 'Display Name:', '✓', '']
             })
             patterns.to_excel(writer, sheet_name='Patterns', index=False)
-            
-            # Districts sheet  
+
+            # Districts sheet
             districts = pd.DataFrame({
                 'District_Name': ['SD73', 'Dodge County', 'Default'],
                 'Report_Format': ['checkbox', 'table', 'checkbox'],
-                'Special_Rules': ['none', 'concerns_in_table', 'none']
+                'Special_Rules': ['none', 'concerns_in_table', 'none'],
+                # Field labels each district's reports use (comma separated); blank runs every variant
+                'Affiliation_Labels': ['', '', ''],
+                'Location_Labels': ['Location', 'Location', ''],
+                'School_Labels': ['School', 'School', '']
             })
-            districts.to_excel(writer, sheet_name='Districts', index=False)
\ No newline at end of file
+            districts.to_excel(writer, sheet_name='Districts', index=False)
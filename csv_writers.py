@@ -0,0 +1,138 @@
+import csv
+import json
+import os
+import tempfile
+
+# Large buffers keep the number of round trips down when the output folder is a network share
+WRITE_BUFFER_BYTES = 1 << 20
+
+
+def temp_path_for(path):
+    """Temporary name next to path, renamed over it once the file is complete"""
+    return f"{path}.{os.getpid()}.tmp"
+
+
+def write_text_atomic(path, text):
+    """Write a text file under a temporary name and rename it into place"""
+    temp_path = temp_path_for(path)
+    try:
+        with open(temp_path, 'w') as f:
+            f.write(text)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+class StreamingCsvWriter:
+    """Write dict rows to a CSV file as they are produced.
+
+    The file is identical to pd.DataFrame(rows).to_csv(path, index=False),
+    without holding the rows in memory. With a fixed column list every row
+    is written straight through. Without one the header depends on all the
+    rows (pandas orders columns by first appearance and writes an integer
+    column as floats once some row lacks it), so rows are spooled to an
+    anonymous temporary file and the CSV is written on close().
+
+    The rows go to a temporary file that is renamed over path by close(),
+    so readers never see a half-written CSV. Nothing is created when no row
+    is written, as with the DataFrame path.
+    """
+
+    def __init__(self, path, columns=None):
+        self.path = path
+        self.temp_path = temp_path_for(path)
+        self.columns = list(columns) if columns else None
+        self.count = 0
+        self._file = None
+        self._writer = None
+        self._spool = None
+        self._column_state = {}  # column -> [has_missing, all_int], in first-appearance order
+
+    def write(self, row):
+        if self.columns is not None:
+            if self._writer is None:
+                self._file = self._open_output()
+                self._writer = csv.DictWriter(self._file, fieldnames=self.columns, extrasaction='raise',
+                                              lineterminator=os.linesep)
+                self._writer.writeheader()
+            self._writer.writerow(row)
+        else:
+            self._spool_row(row)
+        self.count += 1
+
+    def _open_output(self):
+        # pandas writes UTF-8 with the platform line separator
+        return open(self.temp_path, 'w', encoding='utf-8', newline='', buffering=WRITE_BUFFER_BYTES)
+
+    def _spool_row(self, row):
+        if self._spool is None:
+            self._spool = tempfile.TemporaryFile(mode='w+', encoding='utf-8')
+        state = self._column_state
+        for column, value in row.items():
+            if column not in state:
+                state[column] = [self.count > 0, True]  # Earlier rows lack it
+            if value is None:
+                state[column][0] = True
+            elif not isinstance(value, int) or isinstance(value, bool):
+                state[column][1] = False
+        if len(row) < len(state):
+            for column, column_state in state.items():
+                if column not in row:
+                    column_state[0] = True
+        self._spool.write(json.dumps(row))
+        self._spool.write('\n')
+
+    def close(self):
+        """Finish the file and return the number of rows written"""
+        try:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            elif self._spool is not None:
+                self._write_spooled()
+            else:
+                return self.count  # Nothing was written
+            os.replace(self.temp_path, self.path)
+        except BaseException:
+            self.discard()
+            raise
+        return self.count
+
+    def _write_spooled(self):
+        columns = list(self._column_state)
+        # An integer column with gaps becomes float64 in pandas, so 1 is written as 1.0
+        as_float = {column for column, (has_missing, all_int) in self._column_state.items()
+                    if has_missing and all_int}
+        self._spool.seek(0)
+        with self._open_output() as f:
+            writer = csv.writer(f, lineterminator=os.linesep)
+            writer.writerow(columns)
+            for line in self._spool:
+                row = json.loads(line)
+                values = []
+                for column in columns:
+                    value = row.get(column)
+                    if value is None:
+                        values.append('')
+                    elif column in as_float:
+                        values.append(repr(float(value)))
+                    else:
+                        values.append(value)
+                writer.writerow(values)
+        self._spool.close()
+        self._spool = None
+
+    def discard(self):
+        """Abandon the file, removing anything already written"""
+        if self._spool is not None:
+            self._spool.close()
+            self._spool = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        try:
+            os.remove(self.temp_path)
+        except OSError:
+            pass
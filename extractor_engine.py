@@ -1,48 +1,156 @@
-import pdfplumber
-import re
 import os
 import logging
+import queue
+import signal
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener
+from multiprocessing.util import Finalize
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
+from pattern_registry import CONCERN_CATEGORIES, PatternRegistry, SOCIAL_MEDIA_PLATFORMS
+from output_generator import extract_district
+from record_splitter import SOCRecordSplitter, SectionView
+from result_cache import ResultCache
+from csv_writers import StreamingCsvWriter
+from text_cleaner import clean_text, clean_texts
+
+# Bump whenever a code change alters extraction output so cached results are not reused
+EXTRACTOR_VERSION = '1.4'
+
+# Per-process extractor used by extract_many() worker processes
+_worker_extractor = None
+
+# Writes this process's log records to the log file and console on a background thread
+_log_listener = None
+_log_pid = None
+_log_filename = None  # Chosen by the first extractor created in the process
+
+
+class _InProcessQueueHandler(QueueHandler):
+    """Queue the record as logged; the listener thread formats it.
+
+    The stock prepare() formats the message and traceback on the logging
+    thread so the record can be pickled. The queue never leaves this
+    process, so that work is left to the listener's handlers.
+    """
+
+    def prepare(self, record):
+        return record
+
+
+def flush_logs():
+    """Wait until every record logged so far has been written by the listener"""
+    if _log_listener is not None and _log_pid == os.getpid():
+        _log_listener.stop()
+        _log_listener.start()
+
+
+def _init_worker(config_manager, extractor_options):
+    """Create the extractor each worker process reuses for its PDFs"""
+    global _worker_extractor
+    # Ctrl+C is handled by the parent, which cancels the batch; workers finish their file
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _worker_extractor = SmartExtractor(config_manager, **extractor_options)
+
+
+def _extract_in_worker(pdf_path):
+    """Extract a single PDF in a worker process and return (result, stats)"""
+    return _worker_extractor.extract_with_stats(pdf_path)
+
 
 class SmartExtractor:
-    def __init__(self, config_manager, debug_mode=False):
+    def __init__(self, config_manager, debug_mode=False, cache=None, page_cache=None,
+                 max_resident_pages=1, hot_reload=True, log_dir='logs'):
         self.config = config_manager
-        self.debug_mode = debug_mode
-        self.concern_categories = [
-            'Mental Health Concerns', 'Firearms', 'Weapons',
-            'Threat-Related Behavior', 'Physical Violence',
-            'Substance Use Concerns', 'Suicidal Ideation',
-            'Gang-Associated Behavior', 'Bullying/Cyberbullying',
-            'School Community Concerns', 'Risk of Sextortion',
-            'Sexual Assault', 'Non-Suicidal Self-Harm',
-            'Negative Digital Climate/Culture', 'Hate/Racism or Radicalization',
-            'Illegal Activity Misc.', 'Passed Away'
-        ]
+        self.log_dir = log_dir
+        # Reload the config before each file when the workbook was edited (off while a batch runs)
+        self.hot_reload = hot_reload
+        # Pages whose layout objects are kept alive while streaming (None keeps every page)
+        self.max_resident_pages = max_resident_pages
+        self.cache = cache  # Optional ResultCache shared across runs
+        self.page_cache = page_cache  # Optional PageTextCache of raw page text
+        self._file_hashes = {}
+        self.concern_categories = list(CONCERN_CATEGORIES)
+        
+        # Compile every extraction pattern once up front
+        self.patterns = None
+        self.reload_patterns()
         
         # Initialize extraction statistics
-        self.extraction_stats = {
-            'total_records': 0,
-            'field_extraction_counts': {},
-            'field_missing_counts': {},
-            'extraction_warnings': []
-        }
+        self.extraction_stats = self._empty_stats()
         
         # Set up logging
         self.setup_logging()
+        self.debug_mode = debug_mode
+    
+    @property
+    def debug_mode(self):
+        return self.logger.isEnabledFor(logging.DEBUG)
+    
+    @debug_mode.setter
+    def debug_mode(self, enabled):
+        # Debug records are filtered by the logger itself, so disabled ones cost one cached check
+        self.logger.setLevel(logging.DEBUG if enabled else logging.INFO)
+    
+    def reload_patterns(self):
+        """(Re)build the compiled pattern registry for the current configuration"""
+        self.patterns = PatternRegistry(
+            self.concern_categories,
+            SOCIAL_MEDIA_PLATFORMS,
+            config_hash=getattr(self.config, 'config_hash', None),
+            config=self.config
+        )
+    
+    def _ensure_current_patterns(self):
+        # Pick up edits to the config workbook made since the last file (one stat when unchanged)
+        if not self.hot_reload:
+            return
+        if hasattr(self.config, 'reload_if_changed'):
+            self.config.reload_if_changed()
+        if self.patterns.config_hash != getattr(self.config, 'config_hash', None):
+            self.reload_patterns()
+            self.logger.info("Configuration changed; extraction patterns recompiled")
+    
+    @contextmanager
+    def _pinned_config(self):
+        """Reload an edited config once, then keep it until the batch ends.
+        
+        Cache keys and journal fingerprints are computed before the files are
+        extracted, so a reload part way through would store results parsed
+        with the new config under the old config's key.
+        """
+        self._ensure_current_patterns()
+        hot_reload, self.hot_reload = self.hot_reload, False
+        try:
+            yield
+        finally:
+            self.hot_reload = hot_reload
     
     def setup_logging(self):
-        """Set up logging configuration for error tracking"""
-        # Create logs directory if it doesn't exist
-        log_dir = 'logs'
-        if not os.path.exists(log_dir):
-            os.makedirs(log_dir)
+        """Set up logging configuration for error tracking.
         
-        # Configure logging
-        log_filename = os.path.join(log_dir, f'wob_extractor_{datetime.now().strftime("%Y%m%d")}.log')
+        The logger only puts records on a queue; a QueueListener thread in
+        each process formats them and writes them to the log file and
+        console, so extraction never waits on the disk or the formatter. Call flush_logs() before reading the file.
+        """
+        global _log_listener, _log_pid, _log_filename
         
         # Create logger
         self.logger = logging.getLogger('WOBExtractor')
-        self.logger.setLevel(logging.DEBUG)
+        
+        # Once per process; a forked worker inherits the handlers but not the listener thread
+        if _log_pid == os.getpid():
+            return
+        for handler in list(self.logger.handlers):
+            self.logger.removeHandler(handler)
+        
+        # Create logs directory if it doesn't exist
+        os.makedirs(self.log_dir, exist_ok=True)
+        
+        # Configure logging
+        log_filename = os.path.join(self.log_dir, f'wob_extractor_{datetime.now().strftime("%Y%m%d")}.log')
+        _log_filename = log_filename
         
         # Create file handler
         file_handler = logging.FileHandler(log_filename)
@@ -57,53 +165,59 @@ class SmartExtractor:
         file_handler.setFormatter(formatter)
         console_handler.setFormatter(formatter)
         
-        # Add handlers to logger
-        if not self.logger.handlers:  # Avoid adding duplicate handlers
-            self.logger.addHandler(file_handler)
-            self.logger.addHandler(console_handler)
+        # Hand records to the listener thread
+        log_queue = queue.SimpleQueue()
+        _log_listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+        _log_listener.start()
+        _log_pid = os.getpid()
+        self.logger.addHandler(_InProcessQueueHandler(log_queue))
+        # Drain the queue at exit; unlike atexit, this also runs when a worker process exits
+        Finalize(None, _log_listener.stop, exitpriority=10)
     
-    def extract_from_pdf(self, pdf_path):
+    def extract_from_pdf(self, pdf_path, record_callback=None):
+        """Extract all SOC records from a PDF.
+        
+        Records are parsed as pages stream in; record_callback(record) is
+        called for each one as soon as it is complete.
+        """
         results = {
             'file_name': os.path.basename(pdf_path),
             'records': []
         }
         
         try:
-            self.logger.info(f"Processing PDF: {pdf_path}")
+            self.logger.info("Processing PDF: %s", pdf_path)
+            self._ensure_current_patterns()
+            
+            # The district's profile decides which concern parser and field variants run
+            district = extract_district(os.path.basename(pdf_path))
+            profile = self.patterns.profile_for(district)
+            report_format = profile.report_format
+            self.logger.debug("Using '%s' report format for district %s", report_format, district)
+            
+            page_state = {'locked': False, 'has_text': False}
+            page_chunks = self._document_page_chunks(pdf_path, page_state)
+            for record in self.iter_records(page_chunks, report_format, profile):
+                results['records'].append(record)
+                if record_callback:
+                    record_callback(record)
+            
+            if page_state['locked']:
+                error_msg = f"PDF is password-protected/encrypted: {os.path.basename(pdf_path)}"
+                self.logger.error(error_msg)
+                results['error'] = error_msg
+                results['error_type'] = 'locked_pdf'
+                return results
+            
+            if not page_state['has_text']:
+                error_msg = f"No text could be extracted from PDF: {os.path.basename(pdf_path)}"
+                self.logger.warning(error_msg)
+                results['error'] = error_msg
+                results['error_type'] = 'no_text'
+                return results
+            
+            self.logger.info(f"Successfully extracted {len(results['records'])} records from {os.path.basename(pdf_path)}")
             
-            with pdfplumber.open(pdf_path) as pdf:
-                # Check if PDF is encrypted/locked
-                if hasattr(pdf, 'is_encrypted') and pdf.is_encrypted:
-                    error_msg = f"PDF is password-protected/encrypted: {os.path.basename(pdf_path)}"
-                    self.logger.error(error_msg)
-                    results['error'] = error_msg
-                    results['error_type'] = 'locked_pdf'
-                    return results
-                
-                full_text = ""
-                for page_num, page in enumerate(pdf.pages, 1):
-                    try:
-                        page_text = page.extract_text()
-                        if page_text:
-                            full_text += page_text + "\n"
-                        else:
-                            self.logger.warning(f"No text extracted from page {page_num} in {os.path.basename(pdf_path)}")
-                    except Exception as page_error:
-                        self.logger.error(f"Error extracting page {page_num} from {os.path.basename(pdf_path)}: {str(page_error)}")
-                
-                if not full_text.strip():
-                    error_msg = f"No text could be extracted from PDF: {os.path.basename(pdf_path)}"
-                    self.logger.warning(error_msg)
-                    results['error'] = error_msg
-                    results['error_type'] = 'no_text'
-                    return results
-                
-                # Extract records
-                records = self.extract_records(full_text)
-                results['records'] = records
-                
-                self.logger.info(f"Successfully extracted {len(records)} records from {os.path.basename(pdf_path)}")
-                
         except PermissionError as e:
             error_msg = f"Permission denied - PDF may be locked or in use: {os.path.basename(pdf_path)}"
             self.logger.error(error_msg)
@@ -131,208 +245,443 @@ class SmartExtractor:
             
         return results
     
-    def extract_records(self, text):
+    def _document_page_chunks(self, pdf_path, page_state):
+        """Yield each page's text (newline-terminated) from the page cache or the PDF itself"""
+        pdf_name = os.path.basename(pdf_path)
+        file_hash = self._file_hash(pdf_path) if self.page_cache else None
+        cached_pages = self.page_cache.get_pages(file_hash) if file_hash else None
+        
+        if cached_pages is not None:
+            self.logger.info(f"Using cached page text for {pdf_name}")
+            for page_text in cached_pages:
+                if page_text:
+                    page_state['has_text'] = page_state['has_text'] or bool(page_text.strip())
+                    yield page_text + "\n"
+            return
+        
+        # Imported on first use: pdfplumber and pdfminer take longer to import
+        # than the rest of the application, and the window should not wait for them
+        import pdfplumber
+
+        page_texts = []
+        page_errors = False
+        with pdfplumber.open(pdf_path) as pdf:
+            # Check if PDF is encrypted/locked
+            if hasattr(pdf, 'is_encrypted') and pdf.is_encrypted:
+                page_state['locked'] = True
+                return
+            
+            for page_num, page_text, page_ok in self.iter_page_text(pdf, pdf_name):
+                page_errors = page_errors or not page_ok
+                if file_hash:
+                    page_texts.append(page_text)
+                if page_text:
+                    page_state['has_text'] = page_state['has_text'] or bool(page_text.strip())
+                    yield page_text + "\n"
+        
+        # Only cache complete documents so a failed page gets another try next run
+        if file_hash and not page_errors:
+            try:
+                self.page_cache.put_pages(file_hash, page_texts)
+            except OSError as e:
+                self.logger.warning(f"Could not write page text cache: {str(e)}")
+    
+    def iter_page_text(self, pdf, pdf_name):
+        """Yield (page_num, page_text, ok) for each page of an open pdfplumber document.
+        
+        Each page's cached layout objects are released once more than
+        max_resident_pages pages have been read, so memory scales with the
+        page size rather than the document size.
+        """
+        resident_pages = deque()
+        try:
+            for page_num, page in enumerate(pdf.pages, 1):
+                page_text = ''
+                page_ok = True
+                try:
+                    page_text = page.extract_text() or ''
+                    if not page_text:
+                        self.logger.warning("No text extracted from page %d in %s", page_num, pdf_name)
+                except Exception as page_error:
+                    page_ok = False
+                    self.logger.error("Error extracting page %d from %s: %s", page_num, pdf_name, page_error)
+                
+                resident_pages.append(page)
+                while self.max_resident_pages is not None and len(resident_pages) > self.max_resident_pages:
+                    self._release_page(resident_pages.popleft())
+                
+                yield page_num, page_text, page_ok
+        finally:
+            while resident_pages:
+                self._release_page(resident_pages.popleft())
+    
+    @staticmethod
+    def _release_page(page):
+        """Drop the layout objects pdfplumber caches on a page"""
+        page.flush_cache()
+        # Newer pdfplumber releases also free the underlying pdfminer page
+        close = getattr(page, 'close', None)
+        if close:
+            close()
+    
+    def extract_with_stats(self, pdf_path):
+        """Extract a PDF and return (result, stats) where stats only covers this file.
+        
+        The per-file statistics are also merged into this extractor's running totals.
+        Results are served from / stored in the result cache when one is configured.
+        """
+        with self._pinned_config():  # The cache key and the extraction use the same config
+            cache_key = self._cache_key(pdf_path)
+            cached = self._get_cached(cache_key, pdf_path)
+            if cached:
+                return cached
+            return self._extract_uncached(pdf_path, cache_key)
+    
+    def _cache_key(self, pdf_path):
+        if self.cache is None:
+            return None
+        file_hash = self._file_hash(pdf_path)
+        if file_hash is None:
+            return None
+        # The district picks the report format and field labels, so the same content can parse differently
+        district = extract_district(os.path.basename(pdf_path))
+        return self.cache.make_key(file_hash, EXTRACTOR_VERSION, self.config.config_hash, district)
+    
+    def _file_hash(self, pdf_path):
+        """SHA-256 of the PDF, remembered while the file's size and mtime are unchanged"""
+        try:
+            stat = os.stat(pdf_path)
+            memo_key = (os.path.abspath(pdf_path), stat.st_size, stat.st_mtime_ns)
+            if memo_key not in self._file_hashes:
+                self._file_hashes[memo_key] = ResultCache.file_hash(pdf_path)
+            return self._file_hashes[memo_key]
+        except OSError:
+            # Let the normal extraction path report missing/locked files
+            return None
+    
+    def _get_cached(self, cache_key, pdf_path):
+        if cache_key is None:
+            return None
+        cached = self.cache.get(cache_key)
+        if cached is None:
+            return None
+        result, file_stats = cached
+        # Same content may have been renamed or copied (within the district) since it was cached
+        result['file_name'] = os.path.basename(pdf_path)
+        self.merge_extraction_stats(file_stats)
+        self.logger.info(f"Using cached result for {os.path.basename(pdf_path)}")
+        return result, file_stats
+    
+    def _store_cached(self, cache_key, result, file_stats):
+        # Errors such as "file in use" are transient, so only successful results are cached
+        if cache_key is None or 'error' in result:
+            return
+        try:
+            self.cache.put(cache_key, result, file_stats)
+        except OSError as e:
+            self.logger.warning(f"Could not write result cache entry: {str(e)}")
+    
+    def extract_many(self, pdf_paths, workers=None, progress_callback=None, journal=None,
+                     cancel_event=None):
+        """Extract a batch of PDFs, fanning them out to a process pool.
+        
+        Results are returned in the same order as pdf_paths and each worker's
+        statistics are merged back so get_extraction_quality_report() covers
+        the whole batch. Cached files are answered in this process and never
+        reach the pool. progress_callback(index, pdf_path, result) is called
+        in this process as each file finishes (in completion order).
+        
+        With a CheckpointJournal, files it already holds are reused and every
+        successfully extracted file is appended to it. Setting cancel_event
+        (a threading.Event) stops the batch: files already running finish and
+        are journaled, the rest are left as None in the returned list.
+        
+        Workbook edits are picked up when the batch starts; every file in
+        the batch, including those in worker processes, uses that config.
+        """
+        with self._pinned_config():
+            return self._extract_many(pdf_paths, workers, progress_callback, journal, cancel_event)
+    
+    def _extract_many(self, pdf_paths, workers, progress_callback, journal, cancel_event):
+        pdf_paths = list(pdf_paths)
+        results = [None] * len(pdf_paths)
+        fingerprint = self.result_fingerprint()
+        
+        def file_done(i, pdf_path, result, file_stats=None):
+            results[i] = result
+            if journal is not None and file_stats is not None and 'error' not in result:
+                try:
+                    journal.record(pdf_path, fingerprint, result, file_stats)
+                except OSError as e:
+                    self.logger.warning(f"Could not write checkpoint for {os.path.basename(pdf_path)}: {str(e)}")
+            if progress_callback:
+                progress_callback(i, pdf_path, result)
+        
+        # Serve journaled and unchanged files before starting any workers
+        pending = []
+        for i, pdf_path in enumerate(pdf_paths):
+            journaled = journal.get(pdf_path, fingerprint) if journal is not None else None
+            if journaled:
+                result, file_stats = journaled
+                result['file_name'] = os.path.basename(pdf_path)
+                self.merge_extraction_stats(file_stats)
+                self.logger.info(f"Resuming with checkpointed result for {os.path.basename(pdf_path)}")
+                file_done(i, pdf_path, result)
+                continue
+            
+            cache_key = self._cache_key(pdf_path)
+            cached = self._get_cached(cache_key, pdf_path)
+            if cached:
+                file_done(i, pdf_path, *cached)
+            else:
+                pending.append((i, pdf_path, cache_key))
+        
+        if not pending or (cancel_event is not None and cancel_event.is_set()):
+            return results
+        
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = max(1, min(workers, len(pending)))
+        
+        if workers == 1:
+            for i, pdf_path, cache_key in pending:
+                if cancel_event is not None and cancel_event.is_set():
+                    break
+                file_done(i, pdf_path, *self._extract_uncached(pdf_path, cache_key))
+            return results
+        
+        self.logger.info(f"Extracting {len(pending)} PDFs with {workers} worker processes")
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(self.config, self._worker_options())) as executor:
+            futures = {executor.submit(_extract_in_worker, pdf_path): (i, pdf_path, cache_key)
+                       for i, pdf_path, cache_key in pending}
+            cancelled = False
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+                if not cancelled and cancel_event is not None and cancel_event.is_set():
+                    cancelled = True
+                    self.logger.info("Batch cancelled; waiting for files already being extracted")
+                    for other in futures:
+                        other.cancel()
+                
+                i, pdf_path, cache_key = futures[future]
+                file_stats = None
+                try:
+                    result, file_stats = future.result()
+                    self.merge_extraction_stats(file_stats)
+                    self._store_cached(cache_key, result, file_stats)
+                except Exception as e:
+                    # A crashed worker should not take the rest of the batch down with it
+                    error_msg = f"Unexpected error processing {os.path.basename(pdf_path)}: {str(e)}"
+                    self.logger.error(error_msg)
+                    result = {
+                        'file_name': os.path.basename(pdf_path),
+                        'records': [],
+                        'error': error_msg,
+                        'error_type': 'general_error'
+                    }
+                file_done(i, pdf_path, result, file_stats)
+        
+        return results
+    
+    def result_fingerprint(self):
+        """Identifies the extraction rules a journaled result was produced with.
+        
+        Reloads the config first if the workbook changed, so the fingerprint
+        is that of the rules the next extraction will use.
+        """
+        self._ensure_current_patterns()
+        return f"{EXTRACTOR_VERSION}:{getattr(self.config, 'config_hash', None)}"
+    
+    def _worker_options(self):
+        """Keyword arguments that recreate this extractor's settings in a worker process"""
+        return {
+            'debug_mode': self.debug_mode,
+            'page_cache': self.page_cache,
+            'max_resident_pages': self.max_resident_pages,
+            'hot_reload': False,  # Workers keep the batch's config
+            'log_dir': self.log_dir
+        }
+    
+    def _extract_uncached(self, pdf_path, cache_key):
+        batch_stats = self.extraction_stats
+        self.extraction_stats = self._empty_stats()
+        try:
+            result = self.extract_from_pdf(pdf_path)
+            file_stats = self.extraction_stats
+        finally:
+            self.extraction_stats = batch_stats
+        self.merge_extraction_stats(file_stats)
+        self._store_cached(cache_key, result, file_stats)
+        return result, file_stats
+    
+    def extract_records(self, text, report_format='checkbox'):
         records = []
         
         try:
-            # Split by SOC patterns
-            soc_pattern = r'Subject of Concern.*?:|SOC:|Subject:'
-            sections = re.split(soc_pattern, text)
-            
-            for section in sections[1:]:  # Skip first empty section
-                record = self.extract_record_from_section(section)
-                if record and record.get('name'):
-                    records.append(record)
-                    
+            for record in self.iter_records([text], report_format):
+                records.append(record)
         except Exception as e:
             self.logger.error(f"Error extracting records from text: {str(e)}")
         
         return records
     
+    def iter_records(self, text_chunks, report_format='checkbox', profile=None):
+        """Yield records from an iterable of text chunks as soon as each SOC section is complete"""
+        splitter = SOCRecordSplitter(self.patterns.soc_header)
+        for chunk in text_chunks:
+            yield from self._records_from_sections(splitter.feed(chunk), report_format, profile)
+        yield from self._records_from_sections(splitter.close(), report_format, profile)
+    
+    def _records_from_sections(self, sections, report_format, profile=None):
+        for section in sections:
+            record = self.extract_record_from_section(section, report_format, profile)
+            if record and record.get('name'):
+                yield record
+    
     def clean_extracted_text(self, text):
         """Clean extracted text by removing PDF formatting characters like trailing periods, underscores, etc."""
-        if not text:
-            return text
-        
-        # Remove trailing periods, dots, underscores, dashes, and spaces
-        # Pattern matches: multiple periods, dots (·), underscores, dashes, or spaces at the end
-        cleaned = re.sub(r'[\.\·_\-\s]+$', '', text)
-        
-        # Also remove these characters if they appear in sequences in the middle
-        # but only if they're clearly separators (3 or more in a row)
-        cleaned = re.sub(r'[\.\·]{3,}', '', cleaned)
-        cleaned = re.sub(r'[_]{3,}', '', cleaned)
-        cleaned = re.sub(r'[-]{3,}', '', cleaned)
-        
-        # Clean up any resulting multiple spaces
-        cleaned = re.sub(r'\s+', ' ', cleaned)
-        
-        return cleaned.strip()
+        return clean_text(text)
     
-    def extract_record_from_section(self, section):
+    def clean_extracted_texts(self, texts):
+        """Clean a list of extracted fields in one pass, returning them in the same order"""
+        return clean_texts(texts)
+    
+    def extract_record_from_section(self, section, report_format='checkbox', profile=None):
+        """Parse one SOC section, given as a string or a SectionView.
+        
+        Patterns are run over the view's offsets into the document text, so
+        only the matched field values are copied out of it. profile is the
+        district's ExtractionProfile; without one the shared profile for
+        unknown districts is used.
+        """
         record = {}
         missing_fields = []
+        view = SectionView.of(section)
+        text, start, end = view.text, view.start, view.end
+        if profile is None:
+            profile = self.patterns.profile_for(None)
+        # Checked once per record; debug messages below only format their arguments when enabled
+        debug = self.logger.isEnabledFor(logging.DEBUG)
         
         try:
             self.extraction_stats['total_records'] += 1
             
-            # Extract name (first line after SOC:)
-            lines = section.strip().split('\n')
-            if lines and lines[0].strip():
+            # Extract name (first non-blank line after SOC:)
+            name_start = self.patterns.non_space.search(text, start, end)
+            if name_start:
+                line_end = text.find('\n', name_start.start(), end)
                 # Clean the extracted name to remove formatting characters
-                raw_name = lines[0].strip()
+                raw_name = text[name_start.start():end if line_end == -1 else line_end].strip()
                 record['name'] = self.clean_extracted_text(raw_name)
                 self._track_field_extraction('name', True)
-                if self.debug_mode:
+                if debug:
                     if raw_name != record['name']:
-                        self.logger.debug(f"Cleaned name from '{raw_name}' to '{record['name']}'")
+                        self.logger.debug("Cleaned name from '%s' to '%s'", raw_name, record['name'])
                     else:
-                        self.logger.debug(f"Extracted name: {record['name']}")
+                        self.logger.debug("Extracted name: %s", record['name'])
             else:
                 missing_fields.append('name')
                 self._track_field_extraction('name', False)
-                self.logger.warning(f"Failed to extract name from section starting with: {section[:100]}")
-            
-            # Extract SOC affiliation with multiple patterns
-            soc_affiliation_patterns = [
-                r'SOC Affiliation:\s*(.+?)(?:\n|$)',
-                r'Affiliation:\s*(.+?)(?:\n|$)',
-                r'Gang Affiliation:\s*(.+?)(?:\n|$)',
-                r'Group Affiliation:\s*(.+?)(?:\n|$)'
-            ]
-            soc_affiliation_found = False
-            for pattern in soc_affiliation_patterns:
-                soc_match = re.search(pattern, section, re.IGNORECASE)
-                if soc_match:
-                    # Clean the extracted SOC affiliation
-                    raw_affiliation = soc_match.group(1).strip()
-                    record['soc_affiliation'] = self.clean_extracted_text(raw_affiliation)
-                    soc_affiliation_found = True
-                    self._track_field_extraction('soc_affiliation', True)
-                    if self.debug_mode:
-                        if raw_affiliation != record['soc_affiliation']:
-                            self.logger.debug(f"Cleaned SOC affiliation from '{raw_affiliation}' to '{record['soc_affiliation']}' using pattern: {pattern}")
-                        else:
-                            self.logger.debug(f"Extracted SOC affiliation: {record['soc_affiliation']} using pattern: {pattern}")
-                    break
+                self.logger.warning("Failed to extract name from section starting with: %s", view.preview(100))
             
-            if not soc_affiliation_found:
+            # Extract SOC affiliation with the district's pattern variants
+            soc_match, pattern = profile.search('soc_affiliation', text, start, end)
+            if soc_match:
+                # Clean the extracted SOC affiliation
+                raw_affiliation = soc_match.group(1).strip()
+                record['soc_affiliation'] = self.clean_extracted_text(raw_affiliation)
+                self._track_field_extraction('soc_affiliation', True)
+                if debug:
+                    if raw_affiliation != record['soc_affiliation']:
+                        self.logger.debug("Cleaned SOC affiliation from '%s' to '%s' using pattern: %s",
+                                          raw_affiliation, record['soc_affiliation'], pattern.pattern)
+                    else:
+                        self.logger.debug("Extracted SOC affiliation: %s using pattern: %s", record['soc_affiliation'], pattern.pattern)
+            else:
                 # Not all records have SOC affiliation, so we don't add to missing_fields
                 # but we still track it
                 record['soc_affiliation'] = ''
                 self._track_field_extraction('soc_affiliation', False)
-                if self.debug_mode:
-                    self.logger.debug(f"No SOC affiliation found in section")
-            
-            # Extract location with multiple patterns
-            location_patterns = [
-                r'Location:\s*(.+?)(?:\n|$)',
-                r'City/Town:\s*(.+?)(?:\n|$)',
-                r'Municipality:\s*(.+?)(?:\n|$)'
-            ]
-            location_found = False
-            for pattern in location_patterns:
-                location_match = re.search(pattern, section, re.IGNORECASE)
-                if location_match:
-                    # Clean the extracted location
-                    raw_location = location_match.group(1).strip()
-                    record['location'] = self.clean_extracted_text(raw_location)
-                    location_found = True
-                    self._track_field_extraction('location', True)
-                    if self.debug_mode:
-                        if raw_location != record['location']:
-                            self.logger.debug(f"Cleaned location from '{raw_location}' to '{record['location']}' using pattern: {pattern}")
-                        else:
-                            self.logger.debug(f"Extracted location: {record['location']} using pattern: {pattern}")
-                    break
+                if debug:
+                    self.logger.debug("No SOC affiliation found in section")
             
-            if not location_found:
+            # Extract location with the district's pattern variants
+            location_match, pattern = profile.search('location', text, start, end)
+            if location_match:
+                # Clean the extracted location
+                raw_location = location_match.group(1).strip()
+                record['location'] = self.clean_extracted_text(raw_location)
+                self._track_field_extraction('location', True)
+                if debug:
+                    if raw_location != record['location']:
+                        self.logger.debug("Cleaned location from '%s' to '%s' using pattern: %s",
+                                          raw_location, record['location'], pattern.pattern)
+                    else:
+                        self.logger.debug("Extracted location: %s using pattern: %s", record['location'], pattern.pattern)
+            else:
                 missing_fields.append('location')
                 self._track_field_extraction('location', False)
-                if self.debug_mode:
-                    self.logger.debug(f"No location found in section. Searched text: {section[:200]}")
-            
-            # Extract school with multiple patterns
-            school_patterns = [
-                r'School.*?:\s*(.+?)(?:\n|$)',
-                r'Institution:\s*(.+?)(?:\n|$)',
-                r'School Name:\s*(.+?)(?:\n|$)'
-            ]
-            school_found = False
-            for pattern in school_patterns:
-                school_match = re.search(pattern, section, re.IGNORECASE)
-                if school_match:
-                    # Clean the extracted school name
-                    raw_school = school_match.group(1).strip()
-                    record['school'] = self.clean_extracted_text(raw_school)
-                    school_found = True
-                    self._track_field_extraction('school', True)
-                    if self.debug_mode:
-                        if raw_school != record['school']:
-                            self.logger.debug(f"Cleaned school from '{raw_school}' to '{record['school']}' using pattern: {pattern}")
-                        else:
-                            self.logger.debug(f"Extracted school: {record['school']} using pattern: {pattern}")
-                    break
+                if debug:
+                    self.logger.debug("No location found in section. Searched text: %s", view.preview(200))
             
-            if not school_found:
+            # Extract school with the district's pattern variants
+            school_match, pattern = profile.search('school', text, start, end)
+            if school_match:
+                # Clean the extracted school name
+                raw_school = school_match.group(1).strip()
+                record['school'] = self.clean_extracted_text(raw_school)
+                self._track_field_extraction('school', True)
+                if debug:
+                    if raw_school != record['school']:
+                        self.logger.debug("Cleaned school from '%s' to '%s' using pattern: %s",
+                                          raw_school, record['school'], pattern.pattern)
+                    else:
+                        self.logger.debug("Extracted school: %s using pattern: %s", record['school'], pattern.pattern)
+            else:
                 missing_fields.append('school')
                 self._track_field_extraction('school', False)
-                if self.debug_mode:
-                    self.logger.debug(f"No school found in section. Searched text: {section[:200]}")
-            
-            # Extract concerns
-            record['concerns'] = {}
-            concerns_found = 0
-            for concern in self.concern_categories:
-                # Check if concern is marked
-                if self.is_concern_checked(section, concern):
-                    record['concerns'][concern] = True
-                    concerns_found += 1
-                elif self.is_concern_unchecked(section, concern):
-                    record['concerns'][concern] = False
+                if debug:
+                    self.logger.debug("No school found in section. Searched text: %s", view.preview(200))
+            
+            # Extract concerns in a single pass over the section
+            record['concerns'] = self.scan_concerns(view, report_format)
+            concerns_found = sum(1 for is_checked in record['concerns'].values() if is_checked)
             
             # Check for "Other" concern with custom text
-            other_patterns = [
-                r'☒\s*Other:\s*(.+?)(?:\n|$)',
-                r'\[X\]\s*Other:\s*(.+?)(?:\n|$)',
-                r'✓\s*Other:\s*(.+?)(?:\n|$)'
-            ]
             
             record['other_concern'] = False
             record['other_concern_text'] = ''
             
-            for pattern in other_patterns:
-                other_match = re.search(pattern, section, re.IGNORECASE)
+            for pattern in self.patterns.other_checked:
+                other_match = pattern.search(text, start, end)
                 if other_match:
                     record['other_concern'] = True
                     record['other_concern_text'] = self.clean_extracted_text(other_match.group(1))
                     concerns_found += 1
-                    if self.debug_mode:
-                        self.logger.debug(f"Found 'Other' concern: {record['other_concern_text']}")
+                    if debug:
+                        self.logger.debug("Found 'Other' concern: %s", record['other_concern_text'])
                     break
             
             # If Other not checked, look for unchecked pattern
             if not record['other_concern']:
-                unchecked_other_patterns = [
-                    r'☐\s*Other:',
-                    r'\[\s\]\s*Other:'
-                ]
-                for pattern in unchecked_other_patterns:
-                    if re.search(pattern, section, re.IGNORECASE):
+                for pattern in self.patterns.other_unchecked:
+                    if pattern.search(text, start, end):
                         record['other_concern'] = False
                         break
             
             if concerns_found == 0:
                 missing_fields.append('concerns')
                 self._track_field_extraction('concerns', False)
-                self.logger.warning(f"No concerns found for record: {record.get('name', 'Unknown')}")
+                self.logger.warning("No concerns found for record: %s", record.get('name', 'Unknown'))
             else:
                 self._track_field_extraction('concerns', True)
-                if self.debug_mode:
-                    self.logger.debug(f"Found {concerns_found} concerns marked")
+                if debug:
+                    self.logger.debug("Found %d concerns marked", concerns_found)
             
             # Extract social media
-            record['social_media'] = self.extract_social_media(section)
+            record['social_media'] = self.extract_social_media(view)
             if record['social_media']:
                 self._track_field_extraction('social_media', True)
             else:
@@ -345,134 +694,227 @@ class SmartExtractor:
                 self.logger.warning(warning_msg)
             
         except Exception as e:
-            self.logger.error(f"Error extracting record from section: {str(e)}", exc_info=True)
+            self.logger.error("Error extracting record from section: %s", e, exc_info=True)
         
         return record
     
-    def _track_field_extraction(self, field_name, success):
+    def _track_field_extraction(self, field_name, success, count=1):
         """Track field extraction success/failure statistics"""
         if field_name not in self.extraction_stats['field_extraction_counts']:
             self.extraction_stats['field_extraction_counts'][field_name] = 0
             self.extraction_stats['field_missing_counts'][field_name] = 0
         
         if success:
-            self.extraction_stats['field_extraction_counts'][field_name] += 1
+            self.extraction_stats['field_extraction_counts'][field_name] += count
         else:
-            self.extraction_stats['field_missing_counts'][field_name] += 1
+            self.extraction_stats['field_missing_counts'][field_name] += count
+    
+    def scan_concerns(self, text, report_format='checkbox'):
+        """Return {concern: True/False} for every category marked checked or unchecked in text.
+        
+        Equivalent to calling is_concern_checked and then is_concern_unchecked
+        for every category, but the text is scanned once. Districts configured
+        with the 'table' report format also have their concern table parsed.
+        text may be a string or a SectionView.
+        """
+        patterns = self.patterns
+        view = SectionView.of(text)
+        text, start, end = view.text, view.start, view.end
+        checked = set()
+        unchecked = set()
+        
+        for marker in patterns.concern_marker.finditer(text, start, end):
+            name = patterns.concern_name.match(text, marker.end(), end)
+            if name:
+                names = patterns.concern_lookup[name.group().casefold()]
+                if marker.group('checked'):
+                    checked.update(names)
+                else:
+                    unchecked.update(names)
+        
+        if report_format == 'table':
+            for concern, is_checked in self.parse_table_concerns(view).items():
+                if is_checked:
+                    checked.add(concern)
+                else:
+                    unchecked.add(concern)
+        
+        concerns = {}
+        for concern in self.concern_categories:
+            if concern in checked:
+                concerns[concern] = True
+            elif concern in unchecked:
+                concerns[concern] = False
+        return concerns
+    
+    def parse_table_concerns(self, text):
+        """Parse table-format concern rows (Dodge County style), e.g. "Weapons | X |".
+        
+        Rows are read line by line: the first cell must be a concern category
+        and the concern is checked when a later cell on the same row is an X,
+        unless the table's header row labels that column "No". Only lines that
+        contain a '|' are copied out of the text.
+        """
+        view = SectionView.of(text)
+        text, start, end = view.text, view.start, view.end
+        categories = {concern.casefold(): concern for concern in self.concern_categories}
+        concerns = {}
+        header = []
+        
+        pipe = text.find('|', start, end)
+        while pipe != -1:
+            line_start = text.rfind('\n', start, pipe)
+            line_start = start if line_start == -1 else line_start + 1
+            line_end = text.find('\n', pipe, end)
+            if line_end == -1:
+                line_end = end
+            line = text[line_start:line_end]
+            pipe = text.find('|', line_end, end)
+            
+            cells = [cell.strip() for cell in line.split('|')]
+            if not cells[0] and len(cells) > 1:
+                cells = cells[1:]  # Row written with a leading border: "| Weapons | X |"
+            concern = categories.get(cells[0].casefold())
+            if concern is None:
+                labels = [cell.casefold() for cell in cells]
+                if 'yes' in labels or 'no' in labels:
+                    header = labels
+                continue
+            
+            is_checked = False
+            for column, cell in enumerate(cells[1:], 1):
+                if cell.upper() == 'X':
+                    label = header[column] if column < len(header) else ''
+                    if label != 'no':
+                        is_checked = True
+            concerns[concern] = concerns.get(concern, False) or is_checked
+        
+        return concerns
     
     def is_concern_checked(self, text, concern):
-        patterns = [
-            f'☒\\s*{re.escape(concern)}',
-            f'\\[X\\]\\s*{re.escape(concern)}',
-            f'✓\\s*{re.escape(concern)}'
-        ]
-        
-        for pattern in patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return True
+        checked_patterns, _ = self.patterns.concern_patterns(concern)
         
-        # Also check for table format (Dodge County style)
-        table_pattern = f'{re.escape(concern)}.*?\\|.*?X'
-        if re.search(table_pattern, text, re.IGNORECASE):
-            return True
+        for pattern in checked_patterns:
+            if pattern.search(text):
+                return True
             
         return False
     
     def is_concern_unchecked(self, text, concern):
-        patterns = [
-            f'☐\\s*{re.escape(concern)}',
-            f'\\[\\s\\]\\s*{re.escape(concern)}'
-        ]
+        _, unchecked_patterns = self.patterns.concern_patterns(concern)
         
-        for pattern in patterns:
-            if re.search(pattern, text, re.IGNORECASE):
+        for pattern in unchecked_patterns:
+            if pattern.search(text):
                 return True
         return False
     
     def extract_social_media(self, section):
+        """Extract every social media account in a section in a single pass.
+        
+        The section is tokenized once: a platform header ("Instagram
+        Information & Activity"), a platform-prefixed field ("TikTok Username:")
+        or a platform mentioned before a field on the same line starts an
+        account, and the following Display Name/Username/ID/URL fields, profile
+        URLs and @handles fill it in. The first value found for a field wins.
+        section may be a string or a SectionView.
+        """
         social_media = []
         
         try:
-            # Look for social media sections - updated pattern to be more flexible
-            sm_patterns = [
-                r'(Instagram|TikTok|Snapchat|Facebook|Twitter|Discord|YouTube|Reddit|Telegram|WhatsApp).*?Information.*?Activity',
-                r'(Instagram|TikTok|Snapchat|Facebook|Twitter|Discord|YouTube|Reddit|Telegram|WhatsApp)\s+(?:Display\s+)?Name:',
-                r'(Instagram|TikTok|Snapchat|Facebook|Twitter|Discord|YouTube|Reddit|Telegram|WhatsApp)\s+Username:'
-            ]
-            
-            # Try each pattern
-            sm_sections = []
-            for pattern in sm_patterns:
-                temp_sections = re.split(pattern, section, flags=re.IGNORECASE)
-                if len(temp_sections) > 1:
-                    sm_sections = temp_sections
-                    break
+            patterns = self.patterns
+            view = SectionView.of(section)
+            text, start, end = view.text, view.start, view.end
+            account = None
             
-            # If no sections found, try to find individual platform mentions
-            if len(sm_sections) <= 1:
-                # Look for individual platform data
-                platforms = ['Instagram', 'TikTok', 'Snapchat', 'Facebook', 'Twitter', 
-                           'Discord', 'YouTube', 'Reddit', 'Telegram', 'WhatsApp']
+            for token in patterns.social_media_token.finditer(text, start, end):
+                kind = token.lastgroup
                 
-                for platform in platforms:
-                    # Check if platform data exists in section
-                    platform_pattern = f'{platform}.*?(?:Display Name|Username|ID|URL):'
-                    if re.search(platform_pattern, section, re.IGNORECASE):
-                        sm_data = self.extract_platform_data(section, platform)
-                        if sm_data:
-                            social_media.append(sm_data)
-            else:
-                # Process sections as before
-                for i in range(1, len(sm_sections), 2):
-                    platform = sm_sections[i]
-                    content = sm_sections[i+1] if i+1 < len(sm_sections) else ""
-                    
-                    # Combine with remaining text if needed
-                    if i+1 < len(sm_sections):
-                        # Get text until next platform or end
-                        next_platform_idx = len(content)
-                        for p in ['Instagram', 'TikTok', 'Snapchat', 'Facebook', 'Twitter', 
-                                'Discord', 'YouTube', 'Reddit', 'Telegram', 'WhatsApp']:
-                            pattern = f'{p}.*?(?:Information|Display Name|Username):'
-                            match = re.search(pattern, content, re.IGNORECASE)
-                            if match:
-                                next_platform_idx = min(next_platform_idx, match.start())
-                        content = content[:next_platform_idx]
-                    
-                    sm_data = self.extract_platform_data(content, platform)
-                    if sm_data:
-                        social_media.append(sm_data)
+                if kind == 'header' or kind == 'mention':
+                    platform = patterns.platform_names[token.group(kind).casefold()]
+                    if kind == 'header' or account is None or account['platform'] != platform:
+                        account = self._finish_account(account, social_media)
+                        account = {'platform': platform}
+                    continue
+                
+                if kind == 'value':
+                    field_platform = token.group('field_platform')
+                    field = self._social_media_field(token.group('prefixed_key') or token.group('key'))
+                    if field_platform:
+                        platform = patterns.platform_names[field_platform.casefold()]
+                        # A prefixed field for another platform, or a repeated field, starts a new account
+                        if account is None or account['platform'] != platform or field in account:
+                            account = self._finish_account(account, social_media)
+                            account = {'platform': platform}
+                    if account is not None and field not in account:
+                        value = self._clean_social_media_value(field, token.group('value'))
+                        if value:
+                            account[field] = value
+                elif account is not None:
+                    if kind == 'url' and 'url' not in account:
+                        account['url'] = patterns.url_trailing.sub('', token.group('url'))
+                    elif kind == 'handle' and '_handle' not in account:
+                        # Only a standalone @handle, not the domain part of an email address
+                        if token.start() == start or text[token.start() - 1].isspace():
+                            account['_handle'] = self.clean_extracted_text(token.group('handle'))
+            
+            self._finish_account(account, social_media)
                     
         except Exception as e:
-            self.logger.warning(f"Error extracting social media data: {str(e)}")
+            self.logger.warning("Error extracting social media data: %s", e)
         
         return social_media
     
+    @staticmethod
+    def _social_media_field(key):
+        key = ' '.join(key.lower().split())
+        if key in ('display name', 'name'):
+            return 'display_name'
+        if key in ('user id', 'id'):
+            return 'user_id'
+        return key  # 'username' or 'url'
+    
+    def _clean_social_media_value(self, field, raw_value):
+        raw_value = raw_value.strip()
+        if field == 'user_id':
+            # Clean but preserve numbers
+            return self.patterns.user_id_cleanup.sub('', raw_value)
+        if field == 'url':
+            # Remove only trailing formatting characters
+            return self.patterns.url_trailing.sub('', raw_value)
+        if field == 'username':
+            # Remove @ if present at start
+            raw_value = raw_value.lstrip('@')
+        return self.clean_extracted_text(raw_value)
+    
+    @staticmethod
+    def _finish_account(account, social_media):
+        """Add a completed account (with at least one field besides platform) to the list"""
+        if account is not None:
+            handle = account.pop('_handle', None)
+            if handle and 'username' not in account:
+                account['username'] = handle
+            if len(account) > 1:
+                social_media.append(account)
+        return None
+    
     def extract_platform_data(self, content, platform):
         """Extract social media data for a specific platform"""
         sm_data = {'platform': platform}
         
         try:
+            field_patterns = self.patterns.platform_fields(platform)
+            
             # Extract Display Name
-            display_patterns = [
-                f'{platform}\\s+Display\\s+Name:\\s*(.+?)(?:\\n|$)',
-                f'Display\\s+Name:\\s*(.+?)(?:\\n|$)'
-            ]
-            for pattern in display_patterns:
-                display_match = re.search(pattern, content, re.IGNORECASE)
+            for pattern in field_patterns['display_name']:
+                display_match = pattern.search(content)
                 if display_match:
                     raw_display = display_match.group(1).strip()
                     sm_data['display_name'] = self.clean_extracted_text(raw_display)
                     break
             
             # Extract Username
-            username_patterns = [
-                f'{platform}\\s+Username:\\s*(.+?)(?:\\n|$)',
-                f'Username:\\s*(.+?)(?:\\n|$)',
-                f'@(.+?)(?:\\s|\\n|$)'  # Handle @username format
-            ]
-            for pattern in username_patterns:
-                username_match = re.search(pattern, content, re.IGNORECASE)
+            for pattern in field_patterns['username']:
+                username_match = pattern.search(content)
                 if username_match:
                     raw_username = username_match.group(1).strip()
                     # Remove @ if present at start
@@ -481,34 +923,23 @@ class SmartExtractor:
                     break
             
             # Extract User ID (platform-specific ID number)
-            id_patterns = [
-                f'{platform}\\s+ID:\\s*(.+?)(?:\\n|$)',
-                f'{platform}\\s+User\\s+ID:\\s*(.+?)(?:\\n|$)',
-                f'ID:\\s*(.+?)(?:\\n|$)',
-                f'User\\s+ID:\\s*(.+?)(?:\\n|$)'
-            ]
-            for pattern in id_patterns:
-                id_match = re.search(pattern, content, re.IGNORECASE)
+            for pattern in field_patterns['user_id']:
+                id_match = pattern.search(content)
                 if id_match:
                     raw_id = id_match.group(1).strip()
                     # Clean but preserve numbers
-                    cleaned_id = re.sub(r'[^\d\w\-_]', '', raw_id)
+                    cleaned_id = self.patterns.user_id_cleanup.sub('', raw_id)
                     if cleaned_id:
                         sm_data['user_id'] = cleaned_id
                         break
             
             # Extract URL
-            url_patterns = [
-                f'{platform}\\s+URL:\\s*(.+?)(?:\\n|$)',
-                f'URL:\\s*(.+?)(?:\\n|$)',
-                r'(https?://(?:www\.)?(?:instagram|tiktok|snapchat|facebook|twitter|discord|youtube|reddit|telegram|whatsapp)[^\s]+)'
-            ]
-            for pattern in url_patterns:
-                url_match = re.search(pattern, content, re.IGNORECASE)
+            for pattern in field_patterns['url']:
+                url_match = pattern.search(content)
                 if url_match:
                     raw_url = url_match.group(1).strip()
                     # Remove only trailing formatting characters
-                    cleaned_url = re.sub(r'[\.\·_\-\s]+$', '', raw_url)
+                    cleaned_url = self.patterns.url_trailing.sub('', raw_url)
                     sm_data['url'] = cleaned_url
                     break
             
@@ -517,7 +948,7 @@ class SmartExtractor:
                 return sm_data
                 
         except Exception as e:
-            self.logger.warning(f"Error extracting {platform} data: {str(e)}")
+            self.logger.warning("Error extracting %s data: %s", platform, e)
         
         return None
     
@@ -530,7 +961,9 @@ class SmartExtractor:
         }
         
         try:
-            log_filename = os.path.join('logs', f'wob_extractor_{datetime.now().strftime("%Y%m%d")}.log')
+            flush_logs()
+            log_filename = _log_filename or os.path.join(
+                self.log_dir, f'wob_extractor_{datetime.now().strftime("%Y%m%d")}.log')
             if os.path.exists(log_filename):
                 with open(log_filename, 'r') as f:
                     for line in f:
@@ -599,13 +1032,26 @@ class SmartExtractor:
     
     def reset_extraction_stats(self):
         """Reset extraction statistics for a new batch"""
-        self.extraction_stats = {
+        self.extraction_stats = self._empty_stats()
+        self.logger.info("Extraction statistics reset")
+    
+    @staticmethod
+    def _empty_stats():
+        return {
             'total_records': 0,
             'field_extraction_counts': {},
             'field_missing_counts': {},
             'extraction_warnings': []
         }
-        self.logger.info("Extraction statistics reset")
+    
+    def merge_extraction_stats(self, stats):
+        """Add the statistics collected elsewhere (e.g. a worker process) to this extractor"""
+        self.extraction_stats['total_records'] += stats['total_records']
+        for field, count in stats['field_extraction_counts'].items():
+            self._track_field_extraction(field, True, count)
+        for field, count in stats['field_missing_counts'].items():
+            self._track_field_extraction(field, False, count)
+        self.extraction_stats['extraction_warnings'].extend(stats['extraction_warnings'])
     
     def save_extraction_quality_report(self, output_folder, month_year):
         """Save extraction quality report to a CSV file"""
@@ -652,10 +1098,12 @@ class SmartExtractor:
                 })
             
             if quality_data:
-                import pandas as pd
-                df = pd.DataFrame(quality_data)
                 quality_file = os.path.join(output_folder, f"{timestamp} - Extraction Quality Report ({month_year}).csv")
-                df.to_csv(quality_file, index=False)
+                # Warning/Recommendation columns only exist on some rows, so the column list is left open
+                writer = StreamingCsvWriter(quality_file)
+                for row in quality_data:
+                    writer.write(row)
+                writer.close()
                 self.logger.info(f"Extraction quality report saved to: {quality_file}")
                 return quality_file
             
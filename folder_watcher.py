@@ -0,0 +1,186 @@
+import os
+import threading
+import time
+from checkpoint_journal import CheckpointJournal
+from output_generator import OutputGenerator, QualityReportSink
+from pdf_discovery import scan_pdfs
+
+try:
+    # Optional: wake up as soon as a file lands instead of waiting for the next poll
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:
+    INotify = None
+
+
+class FolderWatcher:
+    """Extract a month's reports as they arrive in one or more shared folders.
+
+    The folders are polled with os.scandir and each new or changed PDF is
+    extracted once its size and mtime have settled (so half-copied files are
+    not read). Results are appended to a journal in the output folder as they
+    are produced, so regenerate() writes the month's CSVs and analytics from
+    the journal without re-extracting anything. When the optional
+    inotify_simple package is installed the watcher wakes up on file events
+    instead of sleeping for the whole poll interval.
+    """
+
+    def __init__(self, folders, month_year, extractor, output_folder=None, poll_interval=30,
+                 settle_seconds=2, workers=None, auto_regenerate=False, event_callback=None, formats=None):
+        self.folders = [folders] if isinstance(folders, str) else list(folders)
+        self.month_year = month_year
+        self.extractor = extractor
+        self.output_folder = output_folder or self.folders[0]
+        self.poll_interval = poll_interval
+        self.settle_seconds = settle_seconds
+        self.workers = workers
+        self.auto_regenerate = auto_regenerate
+        self.event_callback = event_callback  # event_callback(event_dict) for each batch/regeneration
+        self.formats = list(formats or ['csv', 'quality'])  # As the CLI's --formats
+
+        self.journal = CheckpointJournal(self.output_folder, month_year, label='Watch Results')
+        self.files = {}      # Current PDFs: path -> (size, mtime_ns)
+        self.processed = {}  # Signature each PDF was last extracted at
+        self.failures = {}   # path -> error message, retried when the file changes
+        self._unsettled = {}  # Signature seen on the previous scan for files still being written
+        self.regenerate_requested = threading.Event()
+        self._stopped = threading.Event()
+        self._wake = threading.Event()
+
+        self._inotify = None
+        if INotify is not None:
+            try:
+                self._inotify = INotify()
+                for folder in self.folders:
+                    self._inotify.add_watch(folder, inotify_flags.CLOSE_WRITE | inotify_flags.MOVED_TO
+                                            | inotify_flags.CREATE | inotify_flags.DELETE)
+            except OSError:
+                self._inotify = None
+
+    def _emit(self, event):
+        if self.event_callback:
+            self.event_callback(event)
+
+    def poll_once(self):
+        """Scan the folders once and extract every settled new or changed PDF; returns their paths"""
+        self.files = {}
+        for folder in self.folders:
+            self.files.update(scan_pdfs(folder, self.month_year))
+        now_ns = time.time_ns()
+
+        ready = []
+        for path, signature in self.files.items():
+            if self.processed.get(path) == signature:
+                continue
+            old_enough = now_ns - signature[1] >= self.settle_seconds * 1_000_000_000
+            if old_enough or self._unsettled.get(path) == signature:
+                ready.append(path)
+                self._unsettled.pop(path, None)
+            else:
+                self._unsettled[path] = signature
+        for path in list(self._unsettled):
+            if path not in self.files:
+                del self._unsettled[path]
+        for path in list(self.processed):
+            if path not in self.files:
+                del self.processed[path]
+                self.failures.pop(path, None)
+
+        if not ready:
+            return []
+
+        results = self.extractor.extract_many(ready, workers=self.workers, journal=self.journal)
+        records = 0
+        for path, result in zip(ready, results):
+            self.processed[path] = self.files[path]
+            if 'error' in result:
+                self.failures[path] = result['error']
+            else:
+                self.failures.pop(path, None)
+                records += len(result.get('records', []))
+
+        self._emit({
+            'event': 'extracted',
+            'files': [os.path.basename(path) for path in ready],
+            'records': records,
+            'failed': [os.path.basename(path) for path in ready if path in self.failures]
+        })
+        if self.auto_regenerate:
+            self.regenerate_requested.set()
+        return ready
+
+    def current_results(self):
+        """Journaled results for the PDFs currently in the folders, with their stats merged.
+
+        PDFs extracted under an older config (the workbook was edited since)
+        are extracted again first, so they are not silently left out.
+        """
+        fingerprint = self.extractor.result_fingerprint()
+        stale = [path for path in sorted(self.processed)
+                 if path not in self.failures and self.journal.get(path, fingerprint) is None]
+        if stale:
+            for path, result in zip(stale, self.extractor.extract_many(stale, workers=self.workers,
+                                                                       journal=self.journal)):
+                if 'error' in result:
+                    self.failures[path] = result['error']
+        self.extractor.reset_extraction_stats()
+        results = []
+        for path in sorted(self.files):
+            journaled = self.journal.get(path, fingerprint)
+            if journaled is None:
+                continue
+            result, stats = journaled
+            result['file_name'] = os.path.basename(path)
+            self.extractor.merge_extraction_stats(stats)
+            results.append(result)
+        return results
+
+    def regenerate(self):
+        """Write the month's reports from the journaled results; returns (files_created, platform_stats)"""
+        self.regenerate_requested.clear()
+        results = self.current_results()
+        quality_sinks = []
+        if 'quality' in self.formats:
+            quality_sinks.append(QualityReportSink(self.extractor, self.output_folder, self.month_year))
+        files_created, platform_stats = OutputGenerator().generate_reports(
+            results, self.output_folder, self.month_year, extra_sinks=quality_sinks,
+            formats=[fmt for fmt in self.formats if fmt in ('csv', 'parquet')]
+        )
+
+        self._emit({
+            'event': 'regenerated',
+            'files': len(results),
+            'records': sum(len(result.get('records', [])) for result in results),
+            'outputs': [filepath for _, _, filepath in files_created]
+        })
+        return files_created, platform_stats
+
+    def request_regenerate(self):
+        """Ask the running watcher to rewrite the reports; safe to call from a signal handler"""
+        self.regenerate_requested.set()
+        self._wake.set()
+
+    def stop(self):
+        """Ask the running watcher to return from run(); safe to call from a signal handler"""
+        self._stopped.set()
+        self._wake.set()
+
+    def run(self):
+        """Poll until stop() is called, regenerating whenever it is requested"""
+        while not self._stopped.is_set():
+            self.poll_once()
+            if self.regenerate_requested.is_set():
+                self.regenerate()
+            self._wait()
+
+    def _wait(self):
+        # Files still being written are rechecked after settle_seconds rather than the full interval
+        timeout = self.settle_seconds if self._unsettled else self.poll_interval
+        if self._inotify is None:
+            self._wake.wait(timeout)
+        else:
+            deadline = time.monotonic() + timeout
+            # Read in short slices so stop/regenerate requests are still noticed promptly
+            while not self._wake.is_set() and time.monotonic() < deadline:
+                if self._inotify.read(timeout=1000):
+                    break
+        self._wake.clear()
@@ -1,158 +1,280 @@
-import pandas as pd
 import os
 import re
 from datetime import datetime
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from csv_writers import StreamingCsvWriter, write_text_atomic
 
-class OutputGenerator:
-    def generate_reports(self, extracted_data, output_folder, month_year):
-        timestamp = datetime.now().strftime("%Y%m%d")
+SOCIAL_MEDIA_COLUMNS = ['SOC_Name', 'District', 'School', 'Location', 'SOC_Affiliation',
+                        'Platform', 'Display_Name', 'Username', 'User_ID', 'URL']
+ACCOUNT_TRACKER_COLUMNS = ['month', 'district', 'entity_nam', 'school', 'soc_affiliation', 'concerns',
+                           'sm_typ', 'us', 'user_id', 'url']
+ANALYTICS_COLUMNS = ['Category', 'Item', 'Count', 'Percentage']
+
+# 'parquet' needs the optional pyarrow package
+OUTPUT_FORMATS = ['csv', 'parquet']
+
+
+class ReportSink:
+    """One output fed by OutputGenerator.generate_reports.
+
+    add_record() is called once per SOC record, in report order, during the
+    single pass over the extraction results; close() finishes the output and
+    returns the (name, count, filepath) entries it created. discard() is
+    called instead of close() when generation fails part way.
+    """
+
+    def add_record(self, record, district):
+        raise NotImplementedError
+
+    def close(self):
+        return []
+
+    def discard(self):
+        pass
+
+
+class CsvSink(ReportSink):
+    """A sink that writes its rows to one streamed CSV file"""
+
+    name = None
+
+    def __init__(self, filepath, columns=None):
+        self.filepath = filepath
+        self.writer = StreamingCsvWriter(filepath, columns)
+
+    def close(self):
+        count = self.writer.close()
+        return [(self.name, count, self.filepath)] if count else []
+
+    def discard(self):
+        self.writer.discard()
+
+
+class SocialMediaSink(CsvSink):
+    """Social Media Data: one row per account, or one blank-account row for a SOC without any"""
+
+    name = 'Social Media Data'
+
+    def __init__(self, filepath):
+        super().__init__(filepath, SOCIAL_MEDIA_COLUMNS)
+
+    def add_record(self, record, district):
+        base_row = {
+            'SOC_Name': record.get('name', ''),
+            'District': district,
+            'School': record.get('school', ''),
+            'Location': record.get('location', ''),
+            'SOC_Affiliation': record.get('soc_affiliation', '')
+        }
+        social_media_accounts = record.get('social_media', [])
+        if social_media_accounts:
+            for sm in social_media_accounts:
+                self.writer.write({
+                    **base_row,
+                    'Platform': sm.get('platform', ''),
+                    'Display_Name': sm.get('display_name', ''),
+                    'Username': sm.get('username', ''),
+                    'User_ID': sm.get('user_id', ''),
+                    'URL': sm.get('url', '')
+                })
+        else:
+            # Add record even if no social media (with empty social media fields)
+            self.writer.write({**base_row, 'Platform': '', 'Display_Name': '', 'Username': '',
+                               'User_ID': '', 'URL': ''})
+
+
+class ConcernsSink(CsvSink):
+    """WOB Concerns Data: one row per SOC with a 0/1 column per concern category"""
+
+    name = 'Concerns Data'
+
+    def __init__(self, filepath):
+        # Concern columns depend on the records, so there is no fixed column list
+        super().__init__(filepath)
+
+    def add_record(self, record, district):
+        concern_row = {
+            'SOC_Name': record.get('name', ''),
+            'District': district,
+            'School': record.get('school', ''),
+            'Location': record.get('location', ''),
+            'SOC_Affiliation': record.get('soc_affiliation', '')
+        }
         
-        # Initialize data collections
-        social_media_data = []
-        concerns_data = []
-        platform_stats = Counter()
-        soc_with_multiple_accounts = {}
-        total_socs = 0
+        # Add all standard concern categories as columns
+        for concern_name, is_checked in record.get('concerns', {}).items():
+            concern_row[concern_name] = 1 if is_checked else 0
         
-        # Process all extracted data
-        for file_data in extracted_data:
-            if 'error' not in file_data:
-                district = self.extract_district(file_data['file_name'])
-                
-                for record in file_data.get('records', []):
-                    total_socs += 1
-                    soc_name = record.get('name', '')
-                    
-                    # Track SOCs with multiple accounts
-                    if soc_name not in soc_with_multiple_accounts:
-                        soc_with_multiple_accounts[soc_name] = 0
-                    
-                    # 1. Process Social Media Data (with duplication per account)
-                    social_media_accounts = record.get('social_media', [])
-                    
-                    if social_media_accounts:
-                        for sm in social_media_accounts:
-                            platform = sm.get('platform', '')
-                            if platform:
-                                platform_stats[platform] += 1
-                                soc_with_multiple_accounts[soc_name] += 1
-                            
-                            social_media_data.append({
-                                'SOC_Name': soc_name,
-                                'District': district,
-                                'School': record.get('school', ''),
-                                'Location': record.get('location', ''),
-                                'SOC_Affiliation': record.get('soc_affiliation', ''),
-                                'Platform': platform,
-                                'Display_Name': sm.get('display_name', ''),
-                                'Username': sm.get('username', ''),
-                                'User_ID': sm.get('user_id', ''),
-                                'URL': sm.get('url', '')
-                            })
-                    else:
-                        # Add record even if no social media (with empty social media fields)
-                        social_media_data.append({
-                            'SOC_Name': soc_name,
-                            'District': district,
-                            'School': record.get('school', ''),
-                            'Location': record.get('location', ''),
-                            'SOC_Affiliation': record.get('soc_affiliation', ''),
-                            'Platform': '',
-                            'Display_Name': '',
-                            'Username': '',
-                            'User_ID': '',
-                            'URL': ''
-                        })
-                    
-                    # 2. Process Concerns Data
-                    concern_row = {
-                        'SOC_Name': soc_name,
-                        'District': district,
-                        'School': record.get('school', ''),
-                        'Location': record.get('location', ''),
-                        'SOC_Affiliation': record.get('soc_affiliation', '')
-                    }
-                    
-                    # Add all standard concern categories as columns
-                    all_concerns = record.get('concerns', {})
-                    for concern_name, is_checked in all_concerns.items():
-                        concern_row[concern_name] = 1 if is_checked else 0
-                    
-                    # Add "Other" concern columns
-                    concern_row['Other'] = 1 if record.get('other_concern', False) else 0
-                    concern_row['Other_Text'] = record.get('other_concern_text', '')
-                    
-                    concerns_data.append(concern_row)
+        # Add "Other" concern columns
+        concern_row['Other'] = 1 if record.get('other_concern', False) else 0
+        concern_row['Other_Text'] = record.get('other_concern_text', '')
         
-        # Generate CSV files
-        files_created = []
+        self.writer.write(concern_row)
+
+
+class AccountTrackerSink(CsvSink):
+    """Legacy Account Tracker, kept for backward compatibility"""
+
+    name = 'Account Tracker (Legacy)'
+
+    def __init__(self, filepath, month_year):
+        super().__init__(filepath, ACCOUNT_TRACKER_COLUMNS)
+        self.month_year = month_year
+
+    def add_record(self, record, district):
+        base_info = {
+            'month': self.month_year,
+            'district': district,
+            'entity_nam': record.get('name', ''),
+            'school': record.get('school', ''),
+            'soc_affiliation': record.get('soc_affiliation', ''),
+            'concerns': ', '.join([k for k, v in record.get('concerns', {}).items() if v])
+        }
         
-        # 1. Social Media Data CSV
-        if social_media_data:
-            sm_df = pd.DataFrame(social_media_data)
-            sm_file = os.path.join(output_folder, f"{timestamp} - Social Media Data ({month_year}).csv")
-            sm_df.to_csv(sm_file, index=False)
-            files_created.append(('Social Media Data', len(social_media_data), sm_file))
+        # Add social media records
+        for sm in record.get('social_media', []):
+            self.writer.write({
+                **base_info,
+                'sm_typ': sm.get('platform', ''),
+                'us': sm.get('username', ''),
+                'user_id': sm.get('user_id', ''),
+                'url': sm.get('url', '')
+            })
         
-        # 2. Concerns Summary CSV
-        if concerns_data:
-            concerns_df = pd.DataFrame(concerns_data)
-            concerns_file = os.path.join(output_folder, f"{timestamp} - WOB Concerns Data ({month_year}).csv")
-            concerns_df.to_csv(concerns_file, index=False)
-            files_created.append(('Concerns Data', len(concerns_data), concerns_file))
+        # If no social media, still add the record
+        if not record.get('social_media'):
+            self.writer.write({**base_info, 'sm_typ': '', 'us': '', 'user_id': '', 'url': ''})
+
+
+class AnalyticsSink(ReportSink):
+    """Counts platforms and accounts per SOC, then writes the Analytics Summary.
+
+    With write_summary=False it only counts, for the platform stats returned
+    by generate_reports when the CSV outputs are not requested.
+    """
+
+    def __init__(self, generator, output_folder, month_year, timestamp, write_summary=True):
+        self.generator = generator
+        self.write_summary = write_summary
+        self.output_folder = output_folder
+        self.month_year = month_year
+        self.timestamp = timestamp
+        self.platform_stats = Counter()
+        self.soc_with_multiple_accounts = {}
+        self.total_socs = 0
+
+    def add_record(self, record, district):
+        self.total_socs += 1
+        soc_name = record.get('name', '')
         
-        # 3. Generate Social Media Analytics Summary
-        analytics_data = self.generate_analytics_summary(
-            platform_stats, 
-            soc_with_multiple_accounts, 
-            total_socs,
-            month_year,
-            output_folder,
-            timestamp
-        )
+        # Track SOCs with multiple accounts
+        if soc_name not in self.soc_with_multiple_accounts:
+            self.soc_with_multiple_accounts[soc_name] = 0
         
-        if analytics_data:
-            files_created.append(('Analytics Summary', 1, analytics_data))
+        for sm in record.get('social_media', []):
+            platform = sm.get('platform', '')
+            if platform:
+                self.platform_stats[platform] += 1
+                self.soc_with_multiple_accounts[soc_name] += 1
+
+    def close(self):
+        if not self.write_summary:
+            return []
+        summary_file = self.generator.generate_analytics_summary(
+            self.platform_stats, 
+            self.soc_with_multiple_accounts, 
+            self.total_socs,
+            self.month_year,
+            self.output_folder,
+            self.timestamp
+        )
+        return [('Analytics Summary', 1, summary_file)] if summary_file else []
+
+
+class QualityReportSink(ReportSink):
+    """The extractor's Extraction Quality Report, written alongside the other outputs"""
+
+    def __init__(self, extractor, output_folder, month_year):
+        self.extractor = extractor
+        self.output_folder = output_folder
+        self.month_year = month_year
+
+    def add_record(self, record, district):
+        pass
+
+    def close(self):
+        quality_file = self.extractor.save_extraction_quality_report(self.output_folder, self.month_year)
+        return [('Extraction Quality Report', 1, quality_file)] if quality_file else []
+
+
+class OutputGenerator:
+    def generate_reports(self, extracted_data, output_folder, month_year, extra_sinks=None, formats=None):
+        """Write the month's CSVs and analytics from extraction results.
+
+        formats is a list from OUTPUT_FORMATS (default ['csv']); 'parquet'
+        adds the Parquet datasets written by parquet_output.ParquetSink.
+
+        extracted_data may be any iterable, including a generator. It is read
+        once and each record is handed to every sink from create_sinks() plus
+        any extra_sinks, so a new output does not add another traversal and
+        memory does not grow with the number of SOCs.
+
+        The sinks are then closed concurrently on a thread pool. Every file is
+        written under a temporary name and renamed into place, so on a
+        network share the final phase takes as long as the slowest file
+        rather than the sum of them.
+        """
+        timestamp = datetime.now().strftime("%Y%m%d")
+        formats = ['csv'] if formats is None else list(formats)
+        unknown = [fmt for fmt in formats if fmt not in OUTPUT_FORMATS]
+        if unknown:
+            raise ValueError(f"Unknown output format(s): {', '.join(unknown)}")
+        sinks = self.create_sinks(output_folder, month_year, timestamp, formats) + list(extra_sinks or [])
         
-        # 4. Also generate legacy Account Tracker for backward compatibility (optional)
-        account_data = []
-        for file_data in extracted_data:
-            if 'error' not in file_data:
+        try:
+            for file_data in extracted_data:
+                if 'error' in file_data:
+                    continue
+                district = self.extract_district(file_data['file_name'])
                 for record in file_data.get('records', []):
-                    base_info = {
-                        'month': month_year,
-                        'district': self.extract_district(file_data['file_name']),
-                        'entity_nam': record.get('name', ''),
-                        'school': record.get('school', ''),
-                        'soc_affiliation': record.get('soc_affiliation', ''),
-                        'concerns': ', '.join([k for k, v in record.get('concerns', {}).items() if v])
-                    }
-                    
-                    # Add social media records
-                    for sm in record.get('social_media', []):
-                        sm_record = base_info.copy()
-                        sm_record.update({
-                            'sm_typ': sm.get('platform', ''),
-                            'us': sm.get('username', ''),
-                            'user_id': sm.get('user_id', ''),  # Added user ID
-                            'url': sm.get('url', '')
-                        })
-                        account_data.append(sm_record)
-                    
-                    # If no social media, still add the record
-                    if not record.get('social_media'):
-                        base_info.update({'sm_typ': '', 'us': '', 'user_id': '', 'url': ''})
-                        account_data.append(base_info)
+                    for sink in sinks:
+                        sink.add_record(record, district)
+        except BaseException:
+            for sink in sinks:
+                sink.discard()
+            raise
         
-        if account_data:
-            account_df = pd.DataFrame(account_data)
-            account_file = os.path.join(output_folder, f"{timestamp} - Account Tracker ({month_year}).csv")
-            account_df.to_csv(account_file, index=False)
-            files_created.append(('Account Tracker (Legacy)', len(account_data), account_file))
+        with ThreadPoolExecutor(max_workers=len(sinks), thread_name_prefix='report-writer') as pool:
+            futures = [pool.submit(sink.close) for sink in sinks]
+        files_created = []
+        for future in futures:
+            files_created.extend(future.result())
         
+        platform_stats = Counter()
+        for sink in sinks:
+            if isinstance(sink, AnalyticsSink):
+                platform_stats = sink.platform_stats
         return files_created, platform_stats
     
+    def create_sinks(self, output_folder, month_year, timestamp, formats=('csv',)):
+        """The standard outputs for formats, in the order they are listed in files_created"""
+        if 'csv' not in formats:
+            sinks = [AnalyticsSink(self, output_folder, month_year, timestamp, write_summary=False)]
+        else:
+            sinks = [
+                SocialMediaSink(os.path.join(output_folder, f"{timestamp} - Social Media Data ({month_year}).csv")),
+                ConcernsSink(os.path.join(output_folder, f"{timestamp} - WOB Concerns Data ({month_year}).csv")),
+                AnalyticsSink(self, output_folder, month_year, timestamp),
+                AccountTrackerSink(os.path.join(output_folder, f"{timestamp} - Account Tracker ({month_year}).csv"),
+                                   month_year),
+            ]
+        if 'parquet' in formats:
+            # Imported here so pyarrow stays optional
+            from parquet_output import ParquetSink
+            sinks.append(ParquetSink(output_folder, month_year))
+        return sinks
+    
     def generate_analytics_summary(self, platform_stats, soc_with_multiple_accounts, 
                                   total_socs, month_year, output_folder, timestamp):
         """Generate a summary report with social media analytics"""
@@ -221,16 +343,16 @@ class OutputGenerator:
             
             # Save summary to file
             summary_file = os.path.join(output_folder, f"{timestamp} - Analytics Summary ({month_year}).txt")
-            with open(summary_file, 'w') as f:
-                f.write('\n'.join(summary_lines))
+            write_text_atomic(summary_file, '\n'.join(summary_lines))
             
             # Also create a CSV version for easier analysis
-            analytics_csv_data = []
+            analytics_csv_file = os.path.join(output_folder, f"{timestamp} - Analytics Data ({month_year}).csv")
+            analytics_writer = StreamingCsvWriter(analytics_csv_file, ANALYTICS_COLUMNS)
             
             # Platform statistics for CSV
             for platform, count in platform_stats.items():
                 percentage = (count / sum(platform_stats.values())) * 100 if platform_stats else 0
-                analytics_csv_data.append({
+                analytics_writer.write({
                     'Category': 'Platform Statistics',
                     'Item': platform,
                     'Count': count,
@@ -239,17 +361,14 @@ class OutputGenerator:
             
             # SOCs with multiple accounts for CSV
             for name, count in multi_account_socs[:20]:  # Top 20 for CSV
-                analytics_csv_data.append({
+                analytics_writer.write({
                     'Category': 'Multiple Accounts',
                     'Item': name,
                     'Count': count,
                     'Percentage': ''
                 })
             
-            if analytics_csv_data:
-                analytics_df = pd.DataFrame(analytics_csv_data)
-                analytics_csv_file = os.path.join(output_folder, f"{timestamp} - Analytics Data ({month_year}).csv")
-                analytics_df.to_csv(analytics_csv_file, index=False)
+            analytics_writer.close()
             
             return summary_file
             
@@ -258,18 +377,22 @@ class OutputGenerator:
             return None
     
     def extract_district(self, filename):
-        # Extract district from filename
-        # Examples: "SD73 WOB Report - January 2025.pdf"
-        #          "Dodge County WOB Report - January 2025.pdf"
-        
-        if 'SD' in filename and filename.index('SD') < 10:
-            # Extract SD##
-            match = re.search(r'SD\d+', filename)
-            if match:
-                return match.group()
-        
-        # Otherwise, extract everything before "WOB"
-        if 'WOB' in filename:
-            return filename.split('WOB')[0].strip()
-        
-        return 'Unknown'
+        return extract_district(filename)
+
+
+def extract_district(filename):
+    # Extract district from filename
+    # Examples: "SD73 WOB Report - January 2025.pdf"
+    #          "Dodge County WOB Report - January 2025.pdf"
+    
+    if 'SD' in filename and filename.index('SD') < 10:
+        # Extract SD##
+        match = re.search(r'SD\d+', filename)
+        if match:
+            return match.group()
+    
+    # Otherwise, extract everything before "WOB"
+    if 'WOB' in filename:
+        return filename.split('WOB')[0].strip()
+    
+    return 'Unknown'
@@ -0,0 +1,166 @@
+import os
+import shutil
+from urllib.parse import quote
+from output_generator import ReportSink
+from pattern_registry import CONCERN_CATEGORIES
+from pdf_discovery import MONTHS, split_month_year
+
+PARQUET_FOLDER = 'WOB Parquet'
+
+# Rows buffered per district before a row group is written
+BATCH_ROWS = 10000
+
+
+def import_pyarrow():
+    """Return (pyarrow, pyarrow.parquet); pyarrow is only needed for Parquet output"""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError(
+            "Parquet output needs the optional 'pyarrow' package. Install it with: pip install pyarrow"
+        ) from None
+    return pyarrow, pyarrow.parquet
+
+
+def month_partition(month_year):
+    """"August 2025" -> "2025-08", so partitions sort by date; other labels are used as they are"""
+    try:
+        month, year = split_month_year(month_year)
+    except ValueError:
+        return month_year.strip()
+    return f"{year}-{MONTHS.index(month) + 1:02d}"
+
+
+def _none_if_empty(value):
+    return value if value not in ('', None) else None
+
+
+class ParquetSink(ReportSink):
+    """Social Media Data and WOB Concerns Data as Parquet datasets.
+
+    Rows are written to <output>/WOB Parquet/<dataset>/Month=2025-08/District=SD73/
+    (hive partitioning, so pd.read_parquet() on a dataset folder restores
+    Month and District as categorical columns). Each concern category is a
+    nullable boolean column (null when the report did not list it), empty
+    text is stored as null rather than '', and School, SOC_Affiliation and
+    Platform are dictionary-encoded.
+
+    A month is staged in a hidden folder and swapped in on close(), so
+    re-running a month replaces its partitions and readers never see a
+    half-written month.
+    """
+
+    DATASETS = {'social_media': 'Social Media Data (Parquet)', 'concerns': 'Concerns Data (Parquet)'}
+
+    def __init__(self, output_folder, month_year, concern_categories=None, batch_rows=BATCH_ROWS):
+        # Fail before any output is written when pyarrow is missing
+        self.pa, self.pq = import_pyarrow()
+        self.root = os.path.join(output_folder, PARQUET_FOLDER)
+        self.month = month_partition(month_year)
+        self.concern_categories = list(concern_categories or CONCERN_CATEGORIES)
+        self.batch_rows = batch_rows
+        self.staging = os.path.join(self.root, f".staging-{os.getpid()}")
+        self.schemas = self._build_schemas()
+        self.counts = dict.fromkeys(self.DATASETS, 0)
+        self._buffers = {}  # (dataset, district) -> {column: [values]}
+        self._writers = {}  # (dataset, district) -> ParquetWriter
+
+    def _build_schemas(self):
+        pa = self.pa
+        text = pa.string()
+        category = pa.dictionary(pa.int32(), pa.string())
+        identity = [
+            ('SOC_Name', text), ('School', category), ('Location', text), ('SOC_Affiliation', category)
+        ]
+        return {
+            'social_media': pa.schema(identity + [
+                ('Platform', category), ('Display_Name', text), ('Username', text),
+                ('User_ID', text), ('URL', text)
+            ]),
+            'concerns': pa.schema(identity + [(concern, pa.bool_()) for concern in self.concern_categories] + [
+                ('Other', pa.bool_()), ('Other_Text', text)
+            ]),
+        }
+
+    def add_record(self, record, district):
+        identity = {
+            'SOC_Name': _none_if_empty(record.get('name')),
+            'School': _none_if_empty(record.get('school')),
+            'Location': _none_if_empty(record.get('location')),
+            'SOC_Affiliation': _none_if_empty(record.get('soc_affiliation'))
+        }
+        for sm in record.get('social_media', []) or [{}]:
+            self._append('social_media', district, {
+                **identity,
+                'Platform': _none_if_empty(sm.get('platform')),
+                'Display_Name': _none_if_empty(sm.get('display_name')),
+                'Username': _none_if_empty(sm.get('username')),
+                'User_ID': _none_if_empty(sm.get('user_id')),
+                'URL': _none_if_empty(sm.get('url'))
+            })
+
+        concerns = record.get('concerns', {})
+        concern_row = dict(identity)
+        for concern in self.concern_categories:
+            concern_row[concern] = bool(concerns[concern]) if concern in concerns else None
+        concern_row['Other'] = bool(record.get('other_concern', False))
+        concern_row['Other_Text'] = _none_if_empty(record.get('other_concern_text'))
+        self._append('concerns', district, concern_row)
+
+    def _append(self, dataset, district, row):
+        key = (dataset, district)
+        buffer = self._buffers.get(key)
+        if buffer is None:
+            buffer = self._buffers[key] = {name: [] for name in self.schemas[dataset].names}
+        for name, values in buffer.items():
+            values.append(row[name])
+        self.counts[dataset] += 1
+        if len(buffer['SOC_Name']) >= self.batch_rows:
+            self._flush(key)
+
+    def _flush(self, key):
+        dataset, district = key
+        buffer = self._buffers[key]
+        if not buffer['SOC_Name']:
+            return
+        schema = self.schemas[dataset]
+        writer = self._writers.get(key)
+        if writer is None:
+            folder = os.path.join(self.staging, dataset, f"Month={quote(self.month, safe=' ')}",
+                                  f"District={quote(district, safe=' ')}")
+            os.makedirs(folder, exist_ok=True)
+            writer = self._writers[key] = self.pq.ParquetWriter(os.path.join(folder, 'part-0.parquet'), schema)
+        writer.write_table(self.pa.Table.from_pydict(buffer, schema=schema))
+        for values in buffer.values():
+            values.clear()
+
+    def close(self):
+        for key in self._buffers:
+            self._flush(key)
+        for writer in self._writers.values():
+            writer.close()
+        self._writers = {}
+
+        files_created = []
+        month_folder = f"Month={quote(self.month, safe=' ')}"
+        for dataset, name in self.DATASETS.items():
+            if not self.counts[dataset]:
+                continue
+            target = os.path.join(self.root, dataset, month_folder)
+            if os.path.isdir(target):
+                shutil.rmtree(target)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            os.replace(os.path.join(self.staging, dataset, month_folder), target)
+            files_created.append((name, self.counts[dataset], os.path.join(self.root, dataset)))
+        shutil.rmtree(self.staging, ignore_errors=True)
+        return files_created
+
+    def discard(self):
+        for writer in self._writers.values():
+            try:
+                writer.close()
+            except Exception:
+                pass
+        self._writers = {}
+        shutil.rmtree(self.staging, ignore_errors=True)
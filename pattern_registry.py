@@ -0,0 +1,320 @@
+import re
+
+from record_splitter import SOC_HEADER_PATTERN
+
+SOCIAL_MEDIA_PLATFORMS = [
+    'Instagram', 'TikTok', 'Snapchat', 'Facebook', 'Twitter',
+    'Discord', 'YouTube', 'Reddit', 'Telegram', 'WhatsApp'
+]
+
+CONCERN_CATEGORIES = [
+    'Mental Health Concerns', 'Firearms', 'Weapons',
+    'Threat-Related Behavior', 'Physical Violence',
+    'Substance Use Concerns', 'Suicidal Ideation',
+    'Gang-Associated Behavior', 'Bullying/Cyberbullying',
+    'School Community Concerns', 'Risk of Sextortion',
+    'Sexual Assault', 'Non-Suicidal Self-Harm',
+    'Negative Digital Climate/Culture', 'Hate/Racism or Radicalization',
+    'Illegal Activity Misc.', 'Passed Away'
+]
+
+# Used when the config's Patterns sheet has no row of that name
+DEFAULT_CHECKED_MARKERS = ['☒', '[X]', '✓']
+DEFAULT_UNCHECKED_MARKERS = ['☐', '[ ]']
+DEFAULT_SOCIAL_MEDIA_HEADER = 'Information & Activity'
+DEFAULT_REPORT_FORMAT = 'checkbox'
+
+
+def profile_url_pattern(platforms):
+    """Profile links on any of the platforms' domains, e.g. https://www.tiktok.com/@someone"""
+    domains = '|'.join(re.escape(re.sub(r'[^a-z0-9]', '', platform.lower())) for platform in platforms)
+    return rf'https?://(?:www\.)?(?:{domains})[^\s]+'
+
+
+PROFILE_URL_PATTERN = profile_url_pattern(SOCIAL_MEDIA_PLATFORMS)
+
+
+def _compile_all(patterns, flags=re.IGNORECASE):
+    return [re.compile(pattern, flags) for pattern in patterns]
+
+
+def config_pattern_texts(config):
+    """Pattern_Name -> [Pattern_Text, Alternative_1, ...] from the config's Patterns sheet, blanks dropped"""
+    texts = {}
+    for row in getattr(config, 'patterns', None) or []:
+        name = row.get('Pattern_Name')
+        if not name:
+            continue
+        values = [row.get('Pattern_Text')] + [value for column, value in row.items()
+                                              if str(column).startswith('Alternative')]
+        values = [str(value) for value in values if value is not None and str(value).strip()]
+        if values:
+            texts.setdefault(str(name).strip(), []).extend(values)
+    return texts
+
+
+# Record field label variants, tried in order unless a district profile narrows them
+FIELD_VARIANTS = {
+    'soc_affiliation': [
+        ('SOC Affiliation', r'SOC Affiliation:\s*(.+?)(?:\n|$)'),
+        ('Affiliation', r'Affiliation:\s*(.+?)(?:\n|$)'),
+        ('Gang Affiliation', r'Gang Affiliation:\s*(.+?)(?:\n|$)'),
+        ('Group Affiliation', r'Group Affiliation:\s*(.+?)(?:\n|$)')
+    ],
+    'location': [
+        ('Location', r'Location:\s*(.+?)(?:\n|$)'),
+        ('City/Town', r'City/Town:\s*(.+?)(?:\n|$)'),
+        ('Municipality', r'Municipality:\s*(.+?)(?:\n|$)')
+    ],
+    'school': [
+        ('School', r'School.*?:\s*(.+?)(?:\n|$)'),
+        ('Institution', r'Institution:\s*(.+?)(?:\n|$)'),
+        ('School Name', r'School Name:\s*(.+?)(?:\n|$)')
+    ],
+}
+
+# Optional Districts sheet columns naming the label variants a district's reports use
+FIELD_LABEL_COLUMNS = {
+    'Affiliation_Labels': 'soc_affiliation',
+    'Location_Labels': 'location',
+    'School_Labels': 'school',
+}
+
+
+def config_district_rules(config):
+    """District_Name -> {'report_format', 'special_rules', 'field_labels'} from the config's Districts sheet"""
+    rules = {}
+    for row in getattr(config, 'districts', None) or []:
+        name = row.get('District_Name')
+        if name is None:
+            continue
+        special_rules = str(row.get('Special_Rules') or '').strip().lower()
+        special_rules = {rule.strip() for rule in special_rules.split(',') if rule.strip() not in ('', 'none')}
+        report_format = str(row.get('Report_Format') or DEFAULT_REPORT_FORMAT).strip().lower()
+        if 'concerns_in_table' in special_rules:
+            report_format = 'table'
+        field_labels = {}
+        for column, field in FIELD_LABEL_COLUMNS.items():
+            labels = [label.strip() for label in str(row.get(column) or '').split(',') if label.strip()]
+            if labels:
+                field_labels[field] = labels
+        rules[str(name).strip()] = {
+            'report_format': report_format, 'special_rules': special_rules, 'field_labels': field_labels
+        }
+    return rules
+
+
+def _header_regex(text):
+    """A header label: matched literally, and up to the next colon on its line unless it ends with one"""
+    escaped = re.escape(text.strip())
+    return escaped if text.strip().endswith(':') else escaped + '.*?:'
+
+
+def _marker_regex(marker):
+    """A checkbox marker; a space inside it (as in "[ ]") matches any whitespace"""
+    return re.escape(marker.strip()).replace('\\ ', r'\s')
+
+
+class PatternRegistry:
+    """All regular expressions used by SmartExtractor, compiled once.
+
+    Field extractors look their patterns up here instead of building pattern
+    strings with f-strings and re.escape on every call. The registry records
+    the config hash it was built for so the extractor can rebuild it when the
+    configuration changes.
+
+    With a config, the SOC header (SOC_Header), checkbox markers
+    (Checkbox_Checked / Checkbox_Unchecked), the social media block header
+    (Social_Media, first text only) and optionally the platform list
+    (Platforms) come from its Patterns sheet, and each district's report
+    format from its Districts sheet, so a new report layout is a config
+    change. Missing rows fall back to the built-in defaults.
+    """
+
+    def __init__(self, concern_categories, platforms=None, config_hash=None, config=None):
+        texts = config_pattern_texts(config)
+        self.concern_categories = list(concern_categories)
+        self.platforms = list(texts.get('Platforms') or platforms or SOCIAL_MEDIA_PLATFORMS)
+        self.config_hash = config_hash
+        self.district_rules = config_district_rules(config)
+
+        if texts.get('SOC_Header'):
+            self.soc_header = re.compile('|'.join(_header_regex(text) for text in texts['SOC_Header']))
+        else:
+            self.soc_header = SOC_HEADER_PATTERN
+        self.checked_markers = [_marker_regex(m) for m in texts.get('Checkbox_Checked') or DEFAULT_CHECKED_MARKERS]
+        self.unchecked_markers = [_marker_regex(m) for m in
+                                  texts.get('Checkbox_Unchecked') or DEFAULT_UNCHECKED_MARKERS]
+        # "Information & Activity" -> Information[^\n]*?Activity
+        header_words = re.findall(r'\w+', (texts.get('Social_Media') or [DEFAULT_SOCIAL_MEDIA_HEADER])[0])
+        social_media_header = r'[^\n]*?'.join(re.escape(word) for word in header_words)
+        profile_url = profile_url_pattern(self.platforms)
+        # Start of the name line, searched within a section's offsets
+        self.non_space = re.compile(r'\S')
+
+        # Record fields: (label, compiled pattern) variants, tried in order
+        self.field_variants = {
+            field: [(label, re.compile(pattern, re.IGNORECASE)) for label, pattern in variants]
+            for field, variants in FIELD_VARIANTS.items()
+        }
+        self.soc_affiliation = [pattern for _, pattern in self.field_variants['soc_affiliation']]
+        self.location = [pattern for _, pattern in self.field_variants['location']]
+        self.school = [pattern for _, pattern in self.field_variants['school']]
+        self._profiles = {}
+
+        # "Other" concern with custom text
+        self.other_checked = _compile_all([
+            marker + r'\s*Other:\s*(.+?)(?:\n|$)' for marker in self.checked_markers
+        ])
+        self.other_unchecked = _compile_all([marker + r'\s*Other:' for marker in self.unchecked_markers])
+
+        # Per-concern checkbox patterns
+        self.concern_checked = {}
+        self.concern_unchecked = {}
+        for concern in self.concern_categories:
+            self._compile_concern(concern)
+        self._compile_concern_scanner()
+
+        # Social media tokenizer: one pass recognizes platform headers, account
+        # field keys (optionally prefixed with the platform), bare profile URLs
+        # and @handles
+        platform_group = '|'.join(re.escape(platform) for platform in self.platforms)
+        self.platform_names = {platform.casefold(): platform for platform in self.platforms}
+        # Every token starts with one of these characters; checking that first lets
+        # the regex engine skip most positions without trying each alternative
+        token_starts = {name[0] for name in self.platforms} | set('DUINh@')
+        token_start_class = ''.join(sorted(re.escape(char) for char in token_starts))
+        self.social_media_token = re.compile(
+            rf'(?=[{token_start_class}])(?:'
+            rf'(?P<header>{platform_group})[^\n]*?{social_media_header}'
+            rf'|(?:(?P<field_platform>{platform_group})\s+(?P<prefixed_key>Display\s+Name|Name|Username|User\s+ID|ID|URL)'
+            rf'|(?P<key>Display\s+Name|Username|User\s+ID|ID|URL)):[ \t]*(?P<value>[^\n]*)'
+            rf'|(?P<mention>{platform_group})(?=[^\n]*?(?:Display Name|Username|ID|URL):)'
+            rf'|(?P<url>{profile_url})'
+            rf'|@(?P<handle>\w[\w.]*))',
+            re.IGNORECASE
+        )
+
+        # Platform account fields, compiled per platform name on first use
+        self._platform_fields = {}
+        self.platform_url = re.compile(f'({profile_url})', re.IGNORECASE)
+        self.user_id_cleanup = re.compile(r'[^\d\w\-_]')
+        self.url_trailing = re.compile(r'[\.\·_\-\s]+$')
+
+    def _compile_concern(self, concern):
+        escaped = re.escape(concern)
+        self.concern_checked[concern] = _compile_all([f'{marker}\\s*{escaped}' for marker in self.checked_markers])
+        self.concern_unchecked[concern] = _compile_all([
+            f'{marker}\\s*{escaped}' for marker in self.unchecked_markers
+        ])
+
+    def _compile_concern_scanner(self):
+        """Patterns for scanning a section's concern checkboxes in a single pass.
+
+        concern_marker finds every checkbox marker and concern_name is matched
+        right after it, so the section is walked once instead of once per
+        category and marker.
+        """
+        # Longest names first so a category that is a prefix of another cannot shadow it
+        names = sorted(self.concern_categories, key=len, reverse=True)
+        name_group = '|'.join(re.escape(name) for name in names)
+        self.concern_marker = re.compile(
+            f"(?:(?P<checked>{'|'.join(self.checked_markers)})|(?P<unchecked>{'|'.join(self.unchecked_markers)}))\\s*",
+            re.IGNORECASE
+        )
+        self.concern_name = re.compile(name_group, re.IGNORECASE)
+
+        # A matched name also counts for every category it starts with, as the
+        # per-category searches would have found those too
+        self.concern_lookup = {}
+        for name in names:
+            self.concern_lookup[name.casefold()] = [
+                other for other in self.concern_categories if name.casefold().startswith(other.casefold())
+            ]
+
+    def report_format(self, district):
+        """The district's concern layout ('checkbox' or 'table'), falling back to the Default row"""
+        rules = self.district_rules.get(district) or self.district_rules.get('Default')
+        return rules['report_format'] if rules else DEFAULT_REPORT_FORMAT
+
+    def profile_for(self, district):
+        """The district's ExtractionProfile, created on first use and kept while this config is current"""
+        profile = self._profiles.get(district)
+        if profile is None:
+            rules = self.district_rules.get(district) or {}
+            profile = ExtractionProfile(district, self.report_format(district), self.field_variants,
+                                        rules.get('field_labels'))
+            self._profiles[district] = profile
+        return profile
+
+    def concern_patterns(self, concern):
+        """Return (checked, unchecked) patterns, compiling unknown concerns on first use"""
+        if concern not in self.concern_checked:
+            self._compile_concern(concern)
+        return self.concern_checked[concern], self.concern_unchecked[concern]
+
+    def platform_fields(self, platform):
+        """Display name, username, ID and URL patterns for a platform label as found in the text"""
+        fields = self._platform_fields.get(platform)
+        if fields is None:
+            fields = {
+                'display_name': _compile_all([
+                    f'{platform}\\s+Display\\s+Name:\\s*(.+?)(?:\\n|$)',
+                    f'Display\\s+Name:\\s*(.+?)(?:\\n|$)'
+                ]),
+                'username': _compile_all([
+                    f'{platform}\\s+Username:\\s*(.+?)(?:\\n|$)',
+                    f'Username:\\s*(.+?)(?:\\n|$)',
+                    f'@(.+?)(?:\\s|\\n|$)'  # Handle @username format
+                ]),
+                'user_id': _compile_all([
+                    f'{platform}\\s+ID:\\s*(.+?)(?:\\n|$)',
+                    f'{platform}\\s+User\\s+ID:\\s*(.+?)(?:\\n|$)',
+                    f'ID:\\s*(.+?)(?:\\n|$)',
+                    f'User\\s+ID:\\s*(.+?)(?:\\n|$)'
+                ]),
+                'url': _compile_all([
+                    f'{platform}\\s+URL:\\s*(.+?)(?:\\n|$)',
+                    f'URL:\\s*(.+?)(?:\\n|$)'
+                ]) + [self.platform_url]
+            }
+            self._platform_fields[platform] = fields
+        return fields
+
+
+class ExtractionProfile:
+    """How one district's reports are parsed: its concern layout and field variants.
+
+    Selected once per file. A field whose labels are named in the district's
+    Districts sheet row (e.g. Location_Labels = "City/Town") only runs those
+    variants, so the variants that would fail before it are skipped. Every
+    other field runs all variants in the registry's priority order; the
+    first match wins, so a record's values never depend on what was parsed
+    before it.
+    """
+
+    def __init__(self, district, report_format, field_variants, field_labels=None):
+        self.district = district
+        self.report_format = report_format
+        self.configured_fields = set()
+        self._variants = {}  # field -> patterns in the order they are tried
+        for field, variants in field_variants.items():
+            labels = {label.casefold() for label in (field_labels or {}).get(field, [])}
+            chosen = [pattern for label, pattern in variants if label.casefold() in labels]
+            if chosen:
+                self.configured_fields.add(field)
+            else:
+                chosen = [pattern for _, pattern in variants]  # Unconfigured or unknown labels
+            self._variants[field] = chosen
+
+    def patterns(self, field):
+        """The field's patterns in the order they are tried"""
+        return list(self._variants[field])
+
+    def search(self, field, text, start, end):
+        """Return (match, pattern) for the first variant matching text[start:end], or (None, None)"""
+        for pattern in self._variants[field]:
+            match = pattern.search(text, start, end)
+            if match:
+                return match, pattern
+        return None, None
@@ -0,0 +1,248 @@
+import json
+import os
+import re
+from output_generator import extract_district
+
+MONTHS = [
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December"
+]
+
+# "SD73 WOB Report - August 2025.pdf" -> ('August', 2025); also "Report_August 2025_final.pdf"
+MONTH_YEAR_PATTERN = re.compile(r'(?<![A-Za-z])(' + '|'.join(MONTHS) + r')\s+(\d{4})(?!\d)', re.IGNORECASE)
+
+INDEX_VERSION = 2
+
+
+def parse_month_years(filename):
+    """Every (month, year) named in a report file name, in order, e.g. both months of "July 2025 - August 2025" """
+    periods = []
+    for match in MONTH_YEAR_PATTERN.finditer(filename):
+        period = (match.group(1).capitalize(), int(match.group(2)))
+        if period not in periods:
+            periods.append(period)
+    return periods
+
+
+def parse_month_year(filename):
+    """Return the first (month, year) named in a report file name, or (None, None)"""
+    periods = parse_month_years(filename)
+    return periods[0] if periods else (None, None)
+
+
+def parse_report_name(filename):
+    """Return (district, month, year) parsed from a report file name; month/year are None if absent"""
+    return (extract_district(filename), *parse_month_year(filename))
+
+
+def split_month_year(month_year):
+    """"August 2025" -> ('August', 2025)"""
+    match = MONTH_YEAR_PATTERN.fullmatch(month_year.strip())
+    if not match:
+        raise ValueError(f"Expected '<Month> <Year>', got {month_year!r}")
+    return match.group(1).capitalize(), int(match.group(2))
+
+
+class PdfIndex:
+    """Index of the PDF reports under one or more folders, including subfolders.
+
+    Each directory's listing is stored with the directory's mtime; a refresh
+    only re-lists directories whose mtime changed (files added, removed or
+    renamed) and otherwise just stats the directory, so refreshing an
+    archive of thousands of reports is cheap. Every file carries its size,
+    mtime and the district/month/year parsed from its name, so selecting a
+    month, several months or several years is a lookup rather than a scan.
+    With index_path the index is saved as JSON and reused between runs.
+
+    Sizes and mtimes are as of the last listing of their directory; callers
+    that need them exact (the result cache, the checkpoint journal) stat the
+    file themselves.
+    """
+
+    def __init__(self, index_path=None):
+        self.index_path = index_path
+        self.dirs = {}  # dir path -> {'mtime_ns', 'files': {name: [size, mtime_ns, district, [[month, year], ...]]}, 'subdirs'}
+        self._by_month = {}
+        self._visited = set()
+        self._visited_real = set()
+        self._changed = False
+        self._load()
+
+    def _load(self):
+        if not self.index_path:
+            return
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == INDEX_VERSION:
+                self.dirs = data['dirs']
+        except (OSError, ValueError, KeyError, AttributeError):
+            self.dirs = {}
+        self._build_lookup()
+
+    def save(self):
+        if not self.index_path:
+            return
+        os.makedirs(os.path.dirname(self.index_path) or '.', exist_ok=True)
+        temp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': INDEX_VERSION, 'dirs': self.dirs}, f)
+        os.replace(temp_path, self.index_path)
+
+    def refresh(self, folders, full_rescan=False):
+        """Bring the index up to date for folders (recursively), saving it if anything changed"""
+        self._visited = set()
+        self._visited_real = set()
+        self._changed = False
+        for folder in folders:
+            self._refresh_dir(os.path.abspath(folder), full_rescan)
+        # Forget directories under these folders that no longer exist
+        roots = [os.path.join(os.path.abspath(folder), '') for folder in folders]
+        for path in list(self.dirs):
+            if path not in self._visited and any(os.path.join(path, '').startswith(root) for root in roots):
+                del self.dirs[path]
+                self._changed = True
+        if self._changed:
+            self._build_lookup()
+            self.save()
+
+    def _refresh_dir(self, path, full_rescan):
+        # A symlinked folder already listed under another path (or a link back up the tree) is skipped
+        real_path = os.path.realpath(path)
+        if path in self._visited or real_path in self._visited_real:
+            return
+        self._visited.add(path)
+        self._visited_real.add(real_path)
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            return
+
+        cached = self.dirs.get(path)
+        if full_rescan or cached is None or cached['mtime_ns'] != mtime_ns:
+            cached = self._list_dir(path, mtime_ns)
+            if cached is None:
+                return
+            self.dirs[path] = cached
+            self._changed = True
+        for name in cached['subdirs']:
+            self._refresh_dir(os.path.join(path, name), full_rescan)
+
+    def _list_dir(self, path, mtime_ns):
+        previous = self.dirs.get(path, {}).get('files', {})
+        files = {}
+        subdirs = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir():
+                            subdirs.append(entry.name)
+                        elif entry.name.lower().endswith('.pdf') and entry.is_file():
+                            stat = entry.stat()
+                            known = previous.get(entry.name)
+                            # Names don't change meaning, so the parse is reused for known files
+                            parsed = known[2:] if known else [extract_district(entry.name),
+                                                              [list(period) for period in parse_month_years(entry.name)]]
+                            files[entry.name] = [stat.st_size, stat.st_mtime_ns] + parsed
+                    except OSError:
+                        continue
+        except OSError:
+            return None
+        return {'mtime_ns': mtime_ns, 'files': files, 'subdirs': sorted(subdirs)}
+
+    def _build_lookup(self):
+        self._by_month = {}
+        for dir_path, listing in self.dirs.items():
+            for name, (size, mtime_ns, district, periods) in listing['files'].items():
+                for month, year in periods:
+                    self._by_month.setdefault((year, month), []).append(os.path.join(dir_path, name))
+        for paths in self._by_month.values():
+            paths.sort()
+
+    def entries(self, folders=None):
+        """Yield (path, size, mtime_ns, district, periods) for every indexed PDF under folders"""
+        roots = None if folders is None else [os.path.join(os.path.abspath(folder), '') for folder in folders]
+        for dir_path, listing in self.dirs.items():
+            if roots is not None and not any(os.path.join(dir_path, '').startswith(root) for root in roots):
+                continue
+            for name, info in listing['files'].items():
+                yield (os.path.join(dir_path, name), *info)
+
+    def select(self, folders=None, months=None, years=None, districts=None):
+        """Sorted paths of the indexed PDFs matching every given filter.
+
+        months are month names, years are ints; either may be None for "any".
+        """
+        if months is not None and years is not None:
+            candidates = set()
+            for year in years:
+                for month in months:
+                    candidates.update(self._by_month.get((int(year), month.capitalize()), []))
+        else:
+            candidates = [entry[0] for entry in self.entries()]
+
+        roots = None if folders is None else [os.path.join(os.path.abspath(folder), '') for folder in folders]
+        month_set = None if months is None else {month.capitalize() for month in months}
+        year_set = None if years is None else {int(year) for year in years}
+        district_set = None if districts is None else set(districts)
+
+        selected = []
+        for path in candidates:
+            if roots is not None and not any(path.startswith(root) for root in roots):
+                continue
+            dir_path, name = os.path.split(path)
+            _, _, district, periods = self.dirs[dir_path]['files'][name]
+            if district_set is not None and district not in district_set:
+                continue
+            # A file naming several months matches if any of them fits both filters
+            if (month_set is not None or year_set is not None) and not any(
+                    (month_set is None or month in month_set) and (year_set is None or year in year_set)
+                    for month, year in periods):
+                continue
+            selected.append(path)
+        return sorted(selected)
+
+
+def find_pdfs(folder, month_year, index=None):
+    """PDF reports for month_year (e.g. "August 2025") in folder and its subfolders.
+
+    Pass a persistent PdfIndex to reuse directory listings between calls.
+    """
+    month, year = split_month_year(month_year)
+    index = index if index is not None else PdfIndex()
+    index.refresh([folder])
+    return index.select([folder], months=[month], years=[year])
+
+
+def scan_pdfs(folder, month_year):
+    """Map each PDF for month_year in folder and its subfolders to its current (size, mtime_ns).
+
+    Unlike PdfIndex every file is stat'ed on each call, so in-place changes are seen.
+    """
+    period = split_month_year(month_year)
+    pdf_files = {}
+    pending = [folder]
+    visited = set()
+    while pending:
+        path = pending.pop()
+        # Each real directory once, so symlinked folders neither repeat files nor loop
+        real_path = os.path.realpath(path)
+        if real_path in visited:
+            continue
+        visited.add(real_path)
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir():
+                            pending.append(entry.path)
+                        elif entry.name.lower().endswith('.pdf') and entry.is_file():
+                            if period in parse_month_years(entry.name):
+                                stat = entry.stat()
+                                pdf_files[entry.path] = (stat.st_size, stat.st_mtime_ns)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return pdf_files
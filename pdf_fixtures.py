@@ -0,0 +1,68 @@
+"""
+Helpers for the test scripts: write small text-only PDFs without extra dependencies
+"""
+
+import os
+
+
+def _escape(line):
+    return line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def write_text_pdf(path, pages):
+    """Write a PDF where each item of pages is a list of text lines (ASCII, Helvetica)"""
+    objects = []
+    page_ids = []
+    font_id = 3
+    objects.append(None)  # 1: catalog, filled in below
+    objects.append(None)  # 2: page tree, filled in below
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    for lines in pages:
+        stream_lines = ["BT", "/F1 10 Tf", "14 TL", "50 750 Td"]
+        for line in lines:
+            stream_lines.append(f"({_escape(line)}) Tj T*")
+        stream_lines.append("ET")
+        stream = "\n".join(stream_lines).encode('latin-1')
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        content_id = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 %d 0 R >> >> /Contents %d 0 R >>" % (font_id, content_id)
+        )
+        page_ids.append(len(objects))
+
+    kids = " ".join(f"{page_id} 0 R" for page_id in page_ids).encode()
+    objects[0] = b"<< /Type /Catalog /Pages 2 0 R >>"
+    objects[1] = b"<< /Type /Pages /Kids [" + kids + b"] /Count %d >>" % len(page_ids)
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(output))
+        output += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref_offset = len(output)
+    output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        output += b"%010d 00000 n \n" % offset
+    output += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref_offset)
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(output)
+    return path
+
+
+def soc_lines(name, location='Vancouver', school='Central High School', concerns=('Weapons',),
+              platform='Instagram', username=None):
+    """Text lines for one Subject of Concern block as it appears in a WOB report"""
+    lines = [
+        f"Subject of Concern: {name}",
+        f"Location: {location}",
+        f"School: {school}",
+    ]
+    lines.extend(f"[X] {concern}" for concern in concerns)
+    if platform:
+        lines.append(f"{platform} Information & Activity")
+        lines.append(f"Username: {username or name.lower().replace(' ', '')}")
+    return lines
@@ -0,0 +1,97 @@
+import re
+
+# Header that starts each Subject of Concern block in a WOB report
+SOC_HEADER_PATTERN = re.compile(r'Subject of Concern.*?:|SOC:|Subject:')
+
+
+class SectionView:
+    """A section of report text as (start, end) offsets into the document text.
+
+    Record parsing runs compiled patterns with pattern.search(text, start, end)
+    so no copy of the section is made. str(view) returns the section text.
+    """
+
+    __slots__ = ('text', 'start', 'end')
+
+    def __init__(self, text, start=0, end=None):
+        self.text = text
+        self.start = start
+        self.end = len(text) if end is None else end
+
+    @classmethod
+    def of(cls, section):
+        """Wrap a plain string; views are returned unchanged"""
+        return section if isinstance(section, cls) else cls(section)
+
+    def __len__(self):
+        return self.end - self.start
+
+    def __str__(self):
+        return self.text[self.start:self.end]
+
+    def __eq__(self, other):
+        if isinstance(other, (SectionView, str)):
+            return str(self) == str(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"SectionView({self.preview(40)!r}, start={self.start}, end={self.end})"
+
+    def preview(self, length):
+        """The first length characters of the section, for log messages"""
+        return self.text[self.start:min(self.end, self.start + length)]
+
+
+class SOCRecordSplitter:
+    """Incrementally split report text into Subject of Concern sections.
+
+    Text is fed in chunks (normally one page at a time) and each section is
+    returned as soon as the header of the next one has been seen, so records
+    can be parsed while the rest of the PDF is still being read. Sections are
+    returned as SectionView offsets into the buffered text and match
+    re.split(SOC_HEADER_PATTERN, full_text)[1:].
+
+    SOC headers never span a line break, so only complete lines are scanned
+    and a header split across two chunks is found once its line is complete.
+    """
+
+    def __init__(self, pattern=SOC_HEADER_PATTERN):
+        self.pattern = pattern
+        self._buffer = ''
+        self._scan_pos = 0          # Next offset in the buffer to search for a header
+        self._section_start = None  # Offset where the current section's text begins
+
+    def feed(self, chunk):
+        """Add a chunk of text and return the list of sections completed by it"""
+        self._buffer += chunk
+        return self._scan(self._buffer.rfind('\n') + 1)
+
+    def close(self):
+        """Return the remaining sections once all text has been fed"""
+        sections = self._scan(len(self._buffer))
+        if self._section_start is not None:
+            sections.append(SectionView(self._buffer, self._section_start))
+        self._buffer = ''
+        self._scan_pos = 0
+        self._section_start = None
+        return sections
+
+    def _scan(self, scan_end):
+        sections = []
+        if scan_end <= self._scan_pos:
+            return sections
+
+        for match in self.pattern.finditer(self._buffer, self._scan_pos, scan_end):
+            if self._section_start is not None:
+                sections.append(SectionView(self._buffer, self._section_start, match.start()))
+            self._section_start = match.end()
+        self._scan_pos = scan_end
+
+        # Drop text that can no longer be part of a section
+        keep_from = self._scan_pos if self._section_start is None else self._section_start
+        if keep_from:
+            self._buffer = self._buffer[keep_from:]
+            self._scan_pos -= keep_from
+            if self._section_start is not None:
+                self._section_start = 0
+        return sections
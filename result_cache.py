@@ -0,0 +1,213 @@
+import hashlib
+import json
+import os
+import shutil
+import zlib
+
+
+def _evict_lru(entries, total_size, max_size_bytes, remove):
+    """Remove (mtime, size, path) entries oldest first until total_size fits; returns the new total"""
+    for _, size, path in sorted(entries):
+        if total_size <= max_size_bytes:
+            break
+        try:
+            remove(path)
+        except OSError:
+            continue
+        total_size -= size
+    return total_size
+
+
+def _write_atomic(path, data):
+    """Write bytes to path via a temporary file so readers never see a partial file"""
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(data)
+    os.replace(temp_path, path)
+    return len(data)
+
+
+class ResultCache:
+    """Persistent on-disk cache of extract_from_pdf results.
+
+    Entries are keyed by the PDF's SHA-256 plus the extractor version, the
+    pattern configuration hash and the district named in the file name (which
+    selects the report format and field labels), so a rerun only re-parses
+    files whose content (or the extraction rules) actually changed.
+
+    The cache is bounded by max_size_mb and evicts the least recently used
+    entries first. The size is counted once and then kept as a running
+    total, so the directory is only scanned again when a put takes the
+    total over the bound.
+    """
+
+    def __init__(self, cache_dir='cache', max_size_mb=500):
+        self.cache_dir = os.path.join(cache_dir, 'results')
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self._total_size = None  # Counted by the first evict()
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def file_hash(file_path):
+        """SHA-256 of the file contents"""
+        sha = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                sha.update(chunk)
+        return sha.hexdigest()
+
+    @staticmethod
+    def make_key(file_hash, extractor_version, config_hash, district=None):
+        return hashlib.sha256(f"{file_hash}:{extractor_version}:{config_hash}:{district}".encode()).hexdigest()
+
+    def _entry_path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key):
+        """Return the cached (result, stats) for key, or None on a miss"""
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            # Touch the entry so eviction treats it as recently used
+            os.utime(entry_path)
+        except (OSError, ValueError):
+            return None
+        return entry['result'], entry['stats']
+
+    def put(self, key, result, stats):
+        """Store the result dict and its per-file stats delta, then enforce the size bound"""
+        entry_path = self._entry_path(key)
+        try:
+            replaced = os.path.getsize(entry_path)
+        except OSError:
+            replaced = 0
+        size = _write_atomic(entry_path, json.dumps({'result': result, 'stats': stats}).encode('utf-8'))
+        if self._total_size is None:
+            self.evict()
+        else:
+            self._total_size += size - replaced
+            if self._total_size > self.max_size_bytes:
+                self.evict()
+
+    def evict(self):
+        """Remove least recently used entries until the cache fits in max_size_bytes"""
+        entries = []
+        total_size = 0
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith('.json') and entry.is_file():
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total_size += stat.st_size
+        self._total_size = _evict_lru(entries, total_size, self.max_size_bytes, os.remove)
+
+    def clear(self):
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith('.json'):
+                    os.remove(entry.path)
+        self._total_size = 0
+
+
+class PageTextCache:
+    """Persistent cache of the raw text of each PDF page.
+
+    page.extract_text() is the expensive part of extraction, while record
+    parsing changes whenever patterns are tuned. Page text is stored
+    zlib-compressed under the file's SHA-256 and page index, so a pattern
+    change only re-runs the record parsing over cached text. Like
+    ResultCache it is bounded by max_size_mb, evicting the least recently
+    used documents first.
+    """
+
+    def __init__(self, cache_dir='cache', max_size_mb=500):
+        self.cache_dir = os.path.join(cache_dir, 'pages')
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self._total_size = None  # Counted by the first evict()
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _file_dir(self, file_hash):
+        return os.path.join(self.cache_dir, file_hash)
+
+    def _page_path(self, file_hash, page_index):
+        return os.path.join(self._file_dir(file_hash), f"{page_index:05d}.z")
+
+    def _manifest_path(self, file_hash):
+        return os.path.join(self._file_dir(file_hash), 'manifest.json')
+
+    @staticmethod
+    def _dir_size(path):
+        try:
+            with os.scandir(path) as it:
+                return sum(entry.stat().st_size for entry in it if entry.is_file())
+        except OSError:
+            return 0
+
+    def get_page(self, file_hash, page_index):
+        try:
+            with open(self._page_path(file_hash, page_index), 'rb') as f:
+                return zlib.decompress(f.read()).decode('utf-8')
+        except (OSError, zlib.error):
+            return None
+
+    def put_page(self, file_hash, page_index, text):
+        """Store one page's text; returns the number of bytes written"""
+        os.makedirs(self._file_dir(file_hash), exist_ok=True)
+        return _write_atomic(self._page_path(file_hash, page_index), zlib.compress((text or '').encode('utf-8')))
+
+    def get_pages(self, file_hash):
+        """Return the text of every page, or None unless the whole document is cached"""
+        manifest_path = self._manifest_path(file_hash)
+        try:
+            with open(manifest_path, 'r') as f:
+                page_count = json.load(f)['page_count']
+            # Touch the manifest so eviction treats the document as recently used
+            os.utime(manifest_path)
+        except (OSError, ValueError, KeyError):
+            return None
+
+        pages = []
+        for page_index in range(page_count):
+            text = self.get_page(file_hash, page_index)
+            if text is None:
+                return None
+            pages.append(text)
+        return pages
+
+    def put_pages(self, file_hash, page_texts):
+        """Store every page; the manifest is written last so partial writes are never read back"""
+        file_dir = self._file_dir(file_hash)
+        replaced = self._dir_size(file_dir)
+        os.makedirs(file_dir, exist_ok=True)
+        size = sum(self.put_page(file_hash, page_index, text) for page_index, text in enumerate(page_texts))
+        size += _write_atomic(self._manifest_path(file_hash),
+                              json.dumps({'page_count': len(page_texts)}).encode('utf-8'))
+        if self._total_size is None:
+            self.evict()
+        else:
+            self._total_size += size - replaced
+            if self._total_size > self.max_size_bytes:
+                self.evict()
+
+    def evict(self):
+        """Remove least recently used documents until the cache fits in max_size_bytes"""
+        entries = []
+        total_size = 0
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if not entry.is_dir():
+                    continue
+                size = self._dir_size(entry.path)
+                try:
+                    mtime = os.stat(os.path.join(entry.path, 'manifest.json')).st_mtime
+                except OSError:
+                    mtime = entry.stat().st_mtime  # Incomplete document
+                entries.append((mtime, size, entry.path))
+                total_size += size
+        self._total_size = _evict_lru(entries, total_size, self.max_size_bytes, shutil.rmtree)
+
+    def clear(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._total_size = 0
@@ -0,0 +1,128 @@
+"""
+Test script to verify checkpoint journaling, cancelling and resuming batch runs
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+from checkpoint_journal import CheckpointJournal
+from config_manager import ConfigManager
+from extractor_engine import SmartExtractor
+from output_generator import OutputGenerator
+from pdf_fixtures import write_text_pdf, soc_lines
+
+class CountingExtractor(SmartExtractor):
+    """Records which PDFs were actually parsed rather than reused"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.parsed = []
+
+    def extract_from_pdf(self, pdf_path, record_callback=None):
+        self.parsed.append(os.path.basename(pdf_path))
+        return super().extract_from_pdf(pdf_path, record_callback)
+
+def write_batch(folder, count):
+    return [
+        write_text_pdf(os.path.join(folder, f"SD{70 + n} WOB Report - August 2025.pdf"),
+                       [soc_lines(f"Student {n}")])
+        for n in range(count)
+    ]
+
+def test_journal_round_trip():
+    """Entries survive reopening, a truncated last line is skipped and changed files are not reused"""
+
+    print("=" * 60)
+    print("WOB Report Extractor - Checkpoint Journal Test")
+    print("=" * 60)
+
+    folder = tempfile.mkdtemp()
+    try:
+        pdf_a, pdf_b = write_batch(folder, 2)
+        journal = CheckpointJournal(folder, "August 2025")
+        journal.record(pdf_a, 'v1', {'file_name': 'a', 'records': []}, {'total_records': 0})
+        with open(journal.path, 'a', encoding='utf-8') as f:
+            f.write('{"path": "cut short by a cra')
+
+        reopened = CheckpointJournal(folder, "August 2025")
+        assert len(reopened) == 1
+        assert reopened.get(pdf_a, 'v1') == ({'file_name': 'a', 'records': []}, {'total_records': 0})
+        assert reopened.get(pdf_a, 'v2') is None, "Entry from other extraction rules was reused"
+        assert reopened.get(pdf_b, 'v1') is None
+
+        # Appending after the truncated line keeps the new entry readable
+        reopened.record(pdf_b, 'v1', {'file_name': 'b', 'records': []}, {})
+        assert CheckpointJournal(folder, "August 2025").get(pdf_b, 'v1') is not None
+
+        stat = os.stat(pdf_a)
+        os.utime(pdf_a, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert CheckpointJournal(folder, "August 2025").get(pdf_a, 'v1') is None, "Modified PDF was reused"
+
+        reopened.clear()
+        assert not os.path.exists(reopened.path)
+        print("\n✅ Journal entries reload, skip torn lines and reject changed files")
+    finally:
+        shutil.rmtree(folder)
+
+def test_cancel_and_resume():
+    """A cancelled batch resumes from the journal and produces the same reports as a full run"""
+
+    folder = tempfile.mkdtemp()
+    try:
+        pdf_files = write_batch(folder, 4)
+        config_manager = ConfigManager()
+        full = SmartExtractor(config_manager).extract_many(pdf_files, workers=1)
+
+        # Cancel as soon as the second file has finished
+        cancel_event = threading.Event()
+        def on_file_done(i, pdf_path, result):
+            if i == 1:
+                cancel_event.set()
+
+        journal = CheckpointJournal(folder, "August 2025")
+        first_run = CountingExtractor(config_manager)
+        partial = first_run.extract_many(pdf_files, workers=1, progress_callback=on_file_done,
+                                         journal=journal, cancel_event=cancel_event)
+        assert [result is not None for result in partial] == [True, True, False, False]
+        assert len(journal) == 2
+
+        resumed_run = CountingExtractor(config_manager)
+        resumed = resumed_run.extract_many(pdf_files, workers=1,
+                                           journal=CheckpointJournal(folder, "August 2025"))
+        print(f"\n📄 Resumed run parsed: {resumed_run.parsed}")
+        assert resumed_run.parsed == [os.path.basename(path) for path in pdf_files[2:]]
+        assert resumed == full, "Resumed results differ from an uninterrupted run"
+        assert resumed_run.extraction_stats['total_records'] == 4, "Journaled stats were not merged"
+
+        files_created, _ = OutputGenerator().generate_reports(resumed, folder, "August 2025")
+        assert files_created
+        print("✅ Cancelled batch resumed from the checkpoint journal")
+    finally:
+        shutil.rmtree(folder)
+
+def test_cancel_process_pool():
+    """Cancelling a pooled batch lets running files finish and skips the rest"""
+
+    folder = tempfile.mkdtemp()
+    try:
+        pdf_files = write_batch(folder, 6)
+        cancel_event = threading.Event()
+        journal = CheckpointJournal(folder, "August 2025")
+
+        results = SmartExtractor(ConfigManager()).extract_many(
+            pdf_files, workers=2, journal=journal, cancel_event=cancel_event,
+            progress_callback=lambda i, pdf_path, result: cancel_event.set()
+        )
+        completed = [result for result in results if result is not None]
+        print(f"\n📄 Pool finished {len(completed)} of {len(pdf_files)} files before stopping")
+        assert 1 <= len(completed) <= len(pdf_files)
+        assert len(journal) == len(completed)
+        print("✅ Pooled batch stopped on cancel")
+    finally:
+        shutil.rmtree(folder)
+
+if __name__ == "__main__":
+    test_journal_round_trip()
+    test_cancel_and_resume()
+    test_cancel_process_pool()
@@ -0,0 +1,122 @@
+"""
+Test script to verify the headless command line batch runner
+"""
+
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from contextlib import redirect_stdout
+import wob_cli
+from config_manager import ConfigManager
+from pdf_fixtures import write_text_pdf, soc_lines
+
+def run_cli(argv):
+    stdout = io.StringIO()
+    with redirect_stdout(stdout):
+        exit_code = wob_cli.main(argv)
+    return exit_code, json.loads(stdout.getvalue())
+
+def test_cli_batch_summary():
+    """A batch with one unreadable PDF writes the reports, reports the failure and exits 1"""
+
+    print("=" * 60)
+    print("WOB Report Extractor - Command Line Test")
+    print("=" * 60)
+
+    folder = tempfile.mkdtemp()
+    second_folder = tempfile.mkdtemp()
+    try:
+        write_text_pdf(os.path.join(folder, "SD73 WOB Report - August 2025.pdf"),
+                       [soc_lines("Student One"), soc_lines("Student Two")])
+        write_text_pdf(os.path.join(second_folder, "SD36 WOB Report - August 2025.pdf"),
+                       [soc_lines("Student Three", platform='TikTok')])
+        with open(os.path.join(second_folder, "SD99 WOB Report - August 2025.pdf"), 'wb') as f:
+            f.write(b"not a pdf")
+        output_dir = os.path.join(folder, "out")
+
+        exit_code, summary = run_cli([
+            folder, second_folder, '--month', 'aug', '--year', '2025', '--workers', '1',
+            '--output-dir', output_dir, '--no-cache'
+        ])
+
+        print(f"\n📄 Exit code {exit_code}: {summary['files_processed']} processed, "
+              f"{summary['files_failed']} failed, {summary['records']} records")
+        assert exit_code == wob_cli.EXIT_FILE_ERRORS
+        assert summary['month_year'] == "August 2025"
+        assert summary['files_found'] == 3
+        assert summary['files_processed'] == 2 and summary['files_failed'] == 1
+        assert summary['failures'][0]['file'].endswith("SD99 WOB Report - August 2025.pdf")
+        assert summary['records'] == 3
+        assert summary['platforms'] == {'Instagram': 2, 'TikTok': 1}
+        output_types = {output['type'] for output in summary['outputs']}
+        assert {'Social Media Data', 'Concerns Data', 'Extraction Quality Report'} <= output_types
+        assert all(os.path.exists(output['path']) for output in summary['outputs'])
+        print("✅ Reports written and failure reported in the JSON summary")
+    finally:
+        shutil.rmtree(folder)
+        shutil.rmtree(second_folder)
+
+def test_cli_exit_codes():
+    """No matching PDFs and bad arguments exit non-zero without a display"""
+
+    folder = tempfile.mkdtemp()
+    try:
+        exit_code, summary = run_cli([folder, '--month', 'March', '--year', '2024', '--no-cache'])
+        assert exit_code == wob_cli.EXIT_NO_INPUT, summary
+        assert 'No PDF files found' in summary['error']
+
+        # Runs as "python -m wob_cli" in a fresh process; argparse rejects the month
+        completed = subprocess.run(
+            [sys.executable, '-m', 'wob_cli', folder, '--month', 'Smarch'],
+            capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__))
+        )
+        assert completed.returncode == wob_cli.EXIT_USAGE
+        assert 'invalid month' in completed.stderr
+        print("✅ Exit codes for no input and invalid arguments")
+    finally:
+        shutil.rmtree(folder)
+
+def test_cli_paths_independent_of_working_directory():
+    """Run from another folder (as cron does), the CLI reads --config and writes only where told"""
+
+    repo_dir = os.path.dirname(os.path.abspath(__file__))
+    workdir = tempfile.mkdtemp()
+    folder = tempfile.mkdtemp()
+    try:
+        write_text_pdf(os.path.join(folder, "SD73 WOB Report - August 2025.pdf"), [soc_lines("Student One")])
+        config_file = os.path.join(folder, "edited_config.xlsx")
+        ConfigManager(config_file, os.path.join(folder, "config_cache.json"))  # Writes the default workbook
+        log_dir = os.path.join(folder, "logs")
+
+        completed = subprocess.run(
+            [sys.executable, os.path.join(repo_dir, 'wob_cli.py'), folder, '--month', 'aug', '--year', '2025',
+             '--workers', '1', '--output-dir', os.path.join(folder, "out"), '--config', config_file,
+             '--no-cache', '--log-dir', log_dir],
+            capture_output=True, text=True, cwd=workdir
+        )
+        assert completed.returncode == wob_cli.EXIT_OK, completed.stderr
+        assert json.loads(completed.stdout)['records'] == 1
+        assert os.listdir(workdir) == [], f"Wrote {os.listdir(workdir)} to the working directory"
+        assert os.listdir(log_dir), "No log written to --log-dir"
+        print("✅ Config, cache and log paths independent of the working directory")
+
+        completed = subprocess.run(
+            [sys.executable, os.path.join(repo_dir, 'wob_cli.py'), folder, '--month', 'aug', '--year', '2025',
+             '--config', os.path.join(folder, "missing.xlsx")],
+            capture_output=True, text=True, cwd=workdir
+        )
+        assert completed.returncode == wob_cli.EXIT_USAGE
+        assert 'config workbook not found' in completed.stderr
+        print("✅ Missing --config workbook rejected")
+    finally:
+        shutil.rmtree(workdir)
+        shutil.rmtree(folder)
+
+if __name__ == "__main__":
+    test_cli_batch_summary()
+    test_cli_exit_codes()
+    test_cli_paths_independent_of_working_directory()
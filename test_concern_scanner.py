@@ -0,0 +1,62 @@
+"""
+Test script to verify the single-pass concern checkbox scanner
+"""
+
+import random
+from config_manager import ConfigManager
+from extractor_engine import SmartExtractor
+
+def per_category_concerns(extractor, text):
+    """The previous approach: separate checked/unchecked searches for every category"""
+    concerns = {}
+    for concern in extractor.concern_categories:
+        if extractor.is_concern_checked(text, concern):
+            concerns[concern] = True
+        elif extractor.is_concern_unchecked(text, concern):
+            concerns[concern] = False
+    return concerns
+
+def test_scanner_matches_per_category_search():
+    """scan_concerns gives the same map as searching each category separately"""
+
+    print("=" * 60)
+    print("WOB Report Extractor - Concern Scanner Test")
+    print("=" * 60)
+
+    extractor = SmartExtractor(ConfigManager())
+    rng = random.Random(11)
+    markers = ['☒', '☐', '[X]', '[x]', '[ ]', '✓', '', '☒\n', 'x ']
+    suffixes = ['', ' | X', ' | | ', ' |  x', ' - see notes', ' |', ' | Next']
+
+    for trial in range(300):
+        lines = []
+        for _ in range(rng.randint(1, 25)):
+            concern = rng.choice(extractor.concern_categories)
+            if rng.random() < 0.2:
+                concern = concern.upper()
+            lines.append(f"{rng.choice(markers)} {concern}{rng.choice(suffixes)}")
+        text = "\n".join(lines)
+
+        expected = per_category_concerns(extractor, text)
+        assert extractor.scan_concerns(text) == expected, f"Mismatch on:\n{text}"
+
+    print("\n✅ Single-pass scan matches per-category searches on 300 random sections")
+
+def test_scanner_on_record():
+    """Records built from checkbox layouts keep their concern flags"""
+
+    extractor = SmartExtractor(ConfigManager())
+    record = extractor.extract_record_from_section(""" Alex Sample
+Location: Kamloops
+☒ Weapons
+☐ Firearms
+[X] Suicidal Ideation
+""")
+    assert record['concerns'] == {
+        'Firearms': False, 'Weapons': True, 'Suicidal Ideation': True
+    }, record['concerns']
+    print("✅ Record concerns extracted in one pass")
+
+if __name__ == "__main__":
+    test_scanner_matches_per_category_search()
+    test_scanner_on_record()
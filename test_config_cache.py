@@ -0,0 +1,86 @@
+"""
+Test script to verify the compiled configuration cache
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import pandas as pd
+from config_manager import ConfigManager
+from pattern_registry import CONCERN_CATEGORIES, PatternRegistry
+
+def report_format(config, district):
+    return PatternRegistry(CONCERN_CATEGORIES, config=config).report_format(district)
+
+class CountingConfigManager(ConfigManager):
+    compiled = 0
+
+    def compile_config(self):
+        CountingConfigManager.compiled += 1
+        return super().compile_config()
+
+def test_workbook_parsed_once():
+    """The workbook is only parsed again when its contents change"""
+
+    print("=" * 60)
+    print("WOB Report Extractor - Config Cache Test")
+    print("=" * 60)
+
+    folder = tempfile.mkdtemp()
+    try:
+        config_file = os.path.join(folder, "extraction_config.xlsx")
+        cache_file = os.path.join(folder, "cache", "extraction_config.json")
+
+        first = CountingConfigManager(config_file, cache_file)
+        assert CountingConfigManager.compiled == 1
+        second = CountingConfigManager(config_file, cache_file)
+        assert CountingConfigManager.compiled == 1, "The workbook was parsed again"
+        assert second.config_hash == first.config_hash
+        assert report_format(second, "Dodge County") == 'table'
+        assert report_format(second, "Somewhere New") == 'checkbox'
+
+        # The lazy DataFrames match the sheets
+        sheet = pd.read_excel(config_file, sheet_name='Patterns')
+        assert list(second.patterns_df.columns) == list(sheet.columns)
+        assert list(second.patterns_df['Pattern_Text']) == list(sheet['Pattern_Text'])
+        print("\n✅ Second start used the compiled cache")
+
+        # Touching the workbook without changing it is recognised by its hash
+        stat = os.stat(config_file)
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+        CountingConfigManager(config_file, cache_file)
+        assert CountingConfigManager.compiled == 1, "An unchanged workbook was parsed again"
+
+        # Editing the workbook recompiles it and changes the config hash
+        districts = pd.read_excel(config_file, sheet_name='Districts')
+        districts = pd.concat([districts, pd.DataFrame(
+            [{'District_Name': 'SD36', 'Report_Format': 'table', 'Special_Rules': 'none'}])], ignore_index=True)
+        with pd.ExcelWriter(config_file) as writer:
+            sheet.to_excel(writer, sheet_name='Patterns', index=False)
+            districts.to_excel(writer, sheet_name='Districts', index=False)
+        edited = CountingConfigManager(config_file, cache_file)
+        assert CountingConfigManager.compiled == 2
+        assert edited.config_hash != first.config_hash
+        assert report_format(edited, "SD36") == 'table'
+        print("✅ Unchanged workbook reused, edited workbook recompiled")
+    finally:
+        shutil.rmtree(folder)
+
+def test_startup_skips_openpyxl():
+    """With a warm cache, loading the config imports neither pandas nor openpyxl"""
+
+    ConfigManager()  # Make sure the cache is warm
+    output = subprocess.run(
+        [sys.executable, "-c",
+         "import sys; from config_manager import ConfigManager; ConfigManager(); "
+         "print(sorted(name for name in ('pandas', 'openpyxl') if name in sys.modules))"],
+        capture_output=True, text=True, check=True, cwd=os.path.dirname(os.path.abspath(__file__))
+    ).stdout.strip()
+    assert output == "[]", output
+    print("✅ Warm start loaded the config without pandas or openpyxl")
+
+if __name__ == "__main__":
+    test_workbook_parsed_once()
+    test_startup_skips_openpyxl()
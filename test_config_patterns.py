@@ -0,0 +1,145 @@
+"""
+Test script to verify extraction patterns and district rules come from the config workbook
+"""
+
+import os
+import shutil
+import tempfile
+import pandas as pd
+from config_manager import ConfigManager
+from extractor_engine import SmartExtractor
+from pdf_fixtures import write_text_pdf
+from result_cache import ResultCache
+
+def write_config(config_file, extra_patterns=(), districts=(), district_columns=()):
+    """The default workbook plus extra Patterns rows and Districts rows (with values for district_columns)"""
+    patterns = pd.DataFrame({
+        'Pattern_Name': ['SOC_Header', 'Social_Media', 'Checkbox_Checked', 'Checkbox_Unchecked'],
+        'Pattern_Text': ['Subject of Concern', 'Information & Activity', '☒', '☐'],
+        'Alternative_1': ['SOC:', 'Username:', '[X]', '[ ]'],
+        'Alternative_2': ['Subject:', 'Display Name:', '✓', '']
+    })
+    for row in extra_patterns:
+        patterns.loc[len(patterns)] = row
+    district_rows = [['SD73', 'checkbox', 'none'], ['Dodge County', 'table', 'concerns_in_table']]
+    district_rows += list(districts) + [['Default', 'checkbox', 'none']]
+    columns = ['District_Name', 'Report_Format', 'Special_Rules'] + list(district_columns)
+    district_rows = [list(row) + [None] * (len(columns) - len(row)) for row in district_rows]
+    with pd.ExcelWriter(config_file) as writer:
+        patterns.to_excel(writer, sheet_name='Patterns', index=False)
+        pd.DataFrame(district_rows, columns=columns).to_excel(
+            writer, sheet_name='Districts', index=False)
+    # Make sure the edit is visible even on filesystems with coarse timestamps
+    stat = os.stat(config_file)
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+
+TABLE_REPORT = [
+    "Subject of Concern: Riley Example",
+    "Location: Chilliwack",
+    "School: Valley Secondary",
+    "Concern | Yes | No",
+    "Weapons | X |",
+    "Firearms | | X",
+]
+
+def test_patterns_from_config():
+    """A new SOC header, checkbox marker and table-format district need only config rows"""
+
+    print("=" * 60)
+    print("WOB Report Extractor - Config Patterns Test")
+    print("=" * 60)
+
+    folder = tempfile.mkdtemp()
+    try:
+        config_file = os.path.join(folder, "extraction_config.xlsx")
+        write_config(config_file,
+                     extra_patterns=[['SOC_Header', 'Student of Concern', None, None],
+                                     ['Checkbox_Checked', '(Y)', None, None]],
+                     districts=[['SD36', 'table', 'none']])
+        config = ConfigManager(config_file, os.path.join(folder, "config.json"))
+        extractor = SmartExtractor(config)
+
+        records = extractor.extract_records(
+            "Student of Concern: Jamie Doe\nLocation: Hope\n(Y) Weapons\n☐ Firearms\n"
+            "Subject of Concern: Sam Roe\nLocation: Hope\n")
+        assert [record['name'] for record in records] == ['Jamie Doe', 'Sam Roe'], records
+        assert records[0]['concerns'] == {'Weapons': True, 'Firearms': False}, records[0]['concerns']
+
+        pdf_path = write_text_pdf(os.path.join(folder, "SD36 WOB Report - August 2025.pdf"), [TABLE_REPORT])
+        registry = extractor.patterns
+        result = extractor.extract_from_pdf(pdf_path)
+        assert result['records'][0]['concerns'] == {'Weapons': True, 'Firearms': False}, result
+        extractor.extract_from_pdf(pdf_path)
+        assert extractor.patterns is registry, "Patterns were rebuilt although the config did not change"
+        print("\n✅ SOC header, checkbox marker and district format taken from the config")
+
+        # Editing the workbook is picked up before the next file, without restarting
+        write_config(config_file, districts=[['SD36', 'checkbox', 'none']])
+        result = extractor.extract_from_pdf(pdf_path)
+        assert extractor.patterns is not registry, "Patterns were not recompiled after the workbook changed"
+        assert result['records'][0]['concerns'] == {}, "SD36 still parsed as a table after the config edit"
+        assert extractor.extract_records("Student of Concern: Jamie Doe\n") == [], \
+            "Removed SOC header still recognised"
+        print("✅ Workbook edits hot-reloaded before the next file")
+    finally:
+        shutil.rmtree(folder)
+
+def test_cached_batch_sees_config_edit():
+    """A workbook edit invalidates cached results in the same process"""
+
+    folder = tempfile.mkdtemp()
+    try:
+        config_file = os.path.join(folder, "extraction_config.xlsx")
+        write_config(config_file)
+        config = ConfigManager(config_file, os.path.join(folder, "config.json"))
+        extractor = SmartExtractor(config, cache=ResultCache(os.path.join(folder, "cache")))
+        pdf_path = write_text_pdf(os.path.join(folder, "SD73 WOB Report - August 2025.pdf"),
+                                  [["Student of Concern: Jamie Doe", "Location: Hope", "[X] Weapons"]])
+
+        assert extractor.extract_many([pdf_path], workers=1)[0]['records'] == []
+        old_hash = config.config_hash
+
+        write_config(config_file, extra_patterns=[['SOC_Header', 'Student of Concern', None, None]])
+        result = extractor.extract_many([pdf_path], workers=1)[0]
+        assert config.config_hash != old_hash, "The edit was not picked up"
+        assert [record['name'] for record in result['records']] == ['Jamie Doe'], "Stale cached result reused"
+        result, _ = extractor.extract_with_stats(pdf_path)
+        assert len(result['records']) == 1
+        print("✅ Cached batch re-extracted after the config edit")
+    finally:
+        shutil.rmtree(folder)
+
+def test_mid_batch_edit_waits_for_next_batch():
+    """A workbook edited while a batch runs is only used from the next batch"""
+
+    folder = tempfile.mkdtemp()
+    try:
+        config_file = os.path.join(folder, "extraction_config.xlsx")
+        write_config(config_file)
+        config = ConfigManager(config_file, os.path.join(folder, "config.json"))
+        extractor = SmartExtractor(config, cache=ResultCache(os.path.join(folder, "cache")))
+        pdf_paths = [write_text_pdf(os.path.join(folder, f"SD73 WOB Report {n} - August 2025.pdf"),
+                                    [TABLE_REPORT[:1] + [f"Location: Hope {n}"] + TABLE_REPORT[2:]])
+                     for n in range(2)]
+
+        def switch_to_table(i, pdf_path, result):
+            if i == 0:
+                write_config(config_file, districts=[['SD73', 'table', 'none']])
+
+        results = extractor.extract_many(pdf_paths, workers=1, progress_callback=switch_to_table)
+        assert [result['records'][0]['concerns'] for result in results] == [{}, {}], \
+            "Files after the edit were parsed with the new config"
+
+        # Reverting the edit returns to the first config's cache entries, which must hold checkbox parses
+        write_config(config_file)
+        results = extractor.extract_many(pdf_paths, workers=1)
+        assert [result['records'][0]['concerns'] for result in results] == [{}, {}], \
+            "A table parse was cached under the checkbox config's key"
+        print("✅ Config edited mid-batch applied to the next batch only")
+    finally:
+        shutil.rmtree(folder)
+
+if __name__ == "__main__":
+    test_patterns_from_config()
+    test_cached_batch_sees_config_edit()
+    test_mid_batch_edit_waits_for_next_batch()
@@ -6,7 +6,7 @@ import os
 import sys
 from datetime import datetime
 from config_manager import ConfigManager
-from extractor_engine import SmartExtractor
+from extractor_engine import SmartExtractor, flush_logs
 import json
 
 def create_test_scenarios():
@@ -256,6 +256,7 @@ def test_empty_cells_logging():
     print("📝 LOG FILE CHECK")
     print("=" * 70)
     
+    flush_logs()  # Records are written by a background thread
     log_file = f"logs/wob_extractor_{datetime.now().strftime('%Y%m%d')}.log"
     if os.path.exists(log_file):
         with open(log_file, 'r') as f:
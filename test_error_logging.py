@@ -6,7 +6,7 @@ import os
 import sys
 from datetime import datetime
 from config_manager import ConfigManager
-from extractor_engine import SmartExtractor
+from extractor_engine import SmartExtractor, flush_logs
 
 def test_error_logging():
     """Test the error logging functionality"""
@@ -56,6 +56,7 @@ def test_error_logging():
     print("\n" + "-" * 40)
     
     # Check if log file was created
+    flush_logs()  # Records are written by a background thread
     log_file = f"logs/wob_extractor_{datetime.now().strftime('%Y%m%d')}.log"
     if os.path.exists(log_file):
         print(f"\n✅ Log file created successfully: {log_file}")
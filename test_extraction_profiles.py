@@ -0,0 +1,105 @@
+"""
+Test script to verify per-district extraction profiles
+"""
+
+import os
+import shutil
+import tempfile
+from config_manager import ConfigManager
+from extractor_engine import SmartExtractor
+from pdf_fixtures import write_text_pdf, soc_lines
+from test_config_patterns import write_config
+
+CITY_TOWN_REPORT = [
+    "Subject of Concern: Alex Sample",
+    "City/Town: Merritt",
+    "Institution: Merritt Secondary",
+    "Gang Affiliation: None",
+    "Subject of Concern: Blair Sample",
+    "City/Town: Logan Lake",
+    "Institution: Logan Lake Secondary",
+]
+
+# Both labels present: the registry's priority order decides which one is used
+BOTH_LABELS_REPORT = [
+    "Subject of Concern: Casey Sample",
+    "Location: Van",
+    "City/Town: Merritt",
+    "School: Valley Secondary",
+    "Institution: Merritt Secondary",
+]
+
+def test_output_independent_of_history():
+    """A record extracts the same values whatever the district's earlier files contained"""
+
+    print("=" * 60)
+    print("WOB Report Extractor - Extraction Profiles Test")
+    print("=" * 60)
+
+    folder = tempfile.mkdtemp()
+    try:
+        city_town = write_text_pdf(os.path.join(folder, "SD58 WOB Report - August 2025.pdf"), [CITY_TOWN_REPORT])
+        both = write_text_pdf(os.path.join(folder, "SD58 WOB Report - July 2025.pdf"), [BOTH_LABELS_REPORT])
+
+        fresh = SmartExtractor(ConfigManager()).extract_from_pdf(both)
+        assert [(r['location'], r['school']) for r in fresh['records']] == [('Van', 'Valley Secondary')]
+
+        extractor = SmartExtractor(ConfigManager())
+        for _ in range(3):
+            result = extractor.extract_from_pdf(city_town)
+            assert [(r['location'], r['school'], r['soc_affiliation']) for r in result['records']] == [
+                ('Merritt', 'Merritt Secondary', 'None'), ('Logan Lake', 'Logan Lake Secondary', '')]
+        assert extractor.extract_from_pdf(both) == fresh, "Earlier files changed which label was used"
+
+        profile = extractor.patterns.profile_for('SD58')
+        assert profile.patterns('location') == extractor.patterns.location
+        print("\n✅ Unconfigured fields keep the registry's priority order")
+    finally:
+        shutil.rmtree(folder)
+
+def test_configured_profile_narrows():
+    """Labels named in the Districts sheet are the only variants run for that district"""
+
+    folder = tempfile.mkdtemp()
+    try:
+        config_file = os.path.join(folder, "extraction_config.xlsx")
+        write_config(config_file, districts=[['SD58', 'checkbox', 'none', 'City/Town']],
+                     district_columns=['Location_Labels'])
+        registry = SmartExtractor(ConfigManager(config_file, os.path.join(folder, "config.json"))).patterns
+
+        profile = registry.profile_for('SD58')
+        assert profile.configured_fields == {'location'}
+        assert [p.pattern for p in profile.patterns('location')] == [r'City/Town:\s*(.+?)(?:\n|$)']
+        assert len(profile.patterns('school')) == len(registry.school), "Unconfigured field was narrowed"
+
+        text = "Location: Kamloops\n"
+        assert profile.search('location', text, 0, len(text)) == (None, None), "Unlisted label still searched"
+        assert registry.profile_for('SD73').search('location', text, 0, len(text))[0].group(1) == 'Kamloops'
+        print("✅ Configured labels narrow the district's field variants")
+    finally:
+        shutil.rmtree(folder)
+
+def test_default_config_labels():
+    """A new workbook names the SD73 and Dodge County labels and leaves the rest unconfigured"""
+
+    folder = tempfile.mkdtemp()
+    try:
+        config = ConfigManager(os.path.join(folder, "extraction_config.xlsx"), os.path.join(folder, "config.json"))
+        assert {'Affiliation_Labels', 'Location_Labels', 'School_Labels'} <= set(config.districts_columns)
+        registry = SmartExtractor(config).patterns
+        for district in ('SD73', 'Dodge County'):
+            assert registry.profile_for(district).configured_fields == {'location', 'school'}
+        assert registry.profile_for('SD58').configured_fields == set()
+
+        report = write_text_pdf(os.path.join(folder, "SD73 WOB Report - August 2025.pdf"),
+                                [soc_lines("Student One", location='Kamloops', school='Valleyview Secondary')])
+        records = SmartExtractor(config).extract_from_pdf(report)['records']
+        assert [(r['location'], r['school']) for r in records] == [('Kamloops', 'Valleyview Secondary')]
+        print("✅ Default workbook configures SD73 and Dodge County labels")
+    finally:
+        shutil.rmtree(folder)
+
+if __name__ == "__main__":
+    test_output_independent_of_history()
+    test_configured_profile_narrows()
+    test_default_config_labels()
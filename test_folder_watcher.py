@@ -0,0 +1,162 @@
+"""
+Test script to verify the watch-folder mode extracts reports incrementally
+"""
+
+import io
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from contextlib import redirect_stdout
+import pandas as pd
+import wob_cli
+from config_manager import ConfigManager
+from extractor_engine import SmartExtractor
+from folder_watcher import FolderWatcher
+from pdf_fixtures import write_text_pdf, soc_lines
+from test_config_patterns import write_config
+
+class CountingExtractor(SmartExtractor):
+    """Records which PDFs were actually parsed"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.parsed = []
+
+    def extract_from_pdf(self, pdf_path, record_callback=None):
+        self.parsed.append(os.path.basename(pdf_path))
+        return super().extract_from_pdf(pdf_path, record_callback)
+
+def write_report(folder, district, names, age_seconds=60):
+    """Write a report whose mtime is age_seconds in the past"""
+    path = write_text_pdf(os.path.join(folder, f"{district} WOB Report - August 2025.pdf"),
+                          [soc_lines(name) for name in names])
+    mtime = time.time() - age_seconds
+    os.utime(path, (mtime, mtime))
+    return path
+
+def concern_rows(folder):
+    files = [name for name in os.listdir(folder) if 'WOB Concerns Data' in name]
+    assert len(files) == 1, files
+    return len(pd.read_csv(os.path.join(folder, files[0])))
+
+def test_incremental_extraction():
+    """New and changed PDFs are extracted once they settle and reports regenerate without re-parsing"""
+
+    print("=" * 60)
+    print("WOB Report Extractor - Watch Folder Test")
+    print("=" * 60)
+
+    folder = tempfile.mkdtemp()
+    try:
+        write_report(folder, "SD73", ["Student A", "Student B"])
+        write_report(folder, "SD36", ["Student C"])
+        extractor = CountingExtractor(ConfigManager())
+        watcher = FolderWatcher(folder, "August 2025", extractor, workers=1)
+
+        assert len(watcher.poll_once()) == 2
+        assert watcher.poll_once() == [], "Unchanged files were extracted again"
+
+        # A file that is still being written is only read once its size/mtime stop changing
+        fresh = write_report(folder, "SD41", ["Student D"], age_seconds=0)
+        assert watcher.poll_once() == []
+        assert watcher.poll_once() == [fresh]
+
+        # A changed file is extracted again
+        write_report(folder, "SD36", ["Student C", "Student E"], age_seconds=30)
+        assert [os.path.basename(path) for path in watcher.poll_once()] == ["SD36 WOB Report - August 2025.pdf"]
+        print(f"\n📄 Parsed so far: {extractor.parsed}")
+
+        parsed_before = len(extractor.parsed)
+        watcher.regenerate()
+        assert len(extractor.parsed) == parsed_before, "Regenerating re-parsed PDFs"
+        assert concern_rows(folder) == 5
+        assert extractor.extraction_stats['total_records'] == 5
+
+        # A fresh watcher picks the journaled results back up after a restart
+        os.remove(os.path.join(folder, "SD41 WOB Report - August 2025.pdf"))
+        restarted = CountingExtractor(ConfigManager())
+        watcher = FolderWatcher(folder, "August 2025", restarted, workers=1)
+        watcher.poll_once()
+        assert restarted.parsed == [], "Journaled files were parsed again after a restart"
+        for name in os.listdir(folder):
+            if name.endswith('.csv'):
+                os.remove(os.path.join(folder, name))
+        watcher.regenerate()
+        assert concern_rows(folder) == 4
+        print("✅ Incremental extraction, restart and regeneration from the journal")
+    finally:
+        shutil.rmtree(folder)
+
+def test_run_until_stopped():
+    """run() keeps polling until stop() and regenerates when asked"""
+
+    folder = tempfile.mkdtemp()
+    try:
+        events = []
+        watcher = FolderWatcher(folder, "August 2025", SmartExtractor(ConfigManager()), poll_interval=0.05,
+                                settle_seconds=0, workers=1, auto_regenerate=True, event_callback=events.append)
+        thread = threading.Thread(target=watcher.run)
+        thread.start()
+        try:
+            write_report(folder, "SD73", ["Student A"])
+            deadline = time.monotonic() + 10
+            while not any(event['event'] == 'regenerated' for event in events) and time.monotonic() < deadline:
+                time.sleep(0.05)
+        finally:
+            watcher.stop()
+            thread.join(5)
+        assert not thread.is_alive(), "Watcher did not stop"
+        assert [event['event'] for event in events][:2] == ['extracted', 'regenerated'], events
+        print("✅ Watcher extracted a new report, regenerated and stopped")
+    finally:
+        shutil.rmtree(folder)
+
+def test_regenerate_after_config_edit():
+    """Journaled results from before a workbook edit are re-extracted, not dropped"""
+
+    folder = tempfile.mkdtemp()
+    try:
+        config_file = os.path.join(folder, "extraction_config.xlsx")
+        write_config(config_file)
+        extractor = CountingExtractor(ConfigManager(config_file, os.path.join(folder, "config.json")))
+        write_report(folder, "SD73", ["Student A", "Student B"])
+        write_report(folder, "SD36", ["Student C"])
+        watcher = FolderWatcher(folder, "August 2025", extractor, workers=1)
+        watcher.poll_once()
+        assert len(extractor.parsed) == 2
+
+        write_config(config_file, districts=[['SD36', 'table', 'none']])
+        watcher.regenerate()
+        assert len(extractor.parsed) == 4, "Files were not re-extracted under the new config"
+        assert concern_rows(folder) == 3
+        assert extractor.extraction_stats['total_records'] == 3
+        print("✅ Regeneration after a config edit re-extracted the journaled files")
+    finally:
+        shutil.rmtree(folder)
+
+def test_cli_watch_once():
+    """python -m wob_cli --watch --once extracts new files and regenerates the reports"""
+
+    folder = tempfile.mkdtemp()
+    try:
+        write_report(folder, "SD73", ["Student A", "Student B"])
+        stdout = io.StringIO()
+        with redirect_stdout(stdout):
+            exit_code = wob_cli.main([folder, '--month', 'August', '--year', '2025', '--watch', '--once',
+                                      '--workers', '1', '--no-cache'])
+        events = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        assert exit_code == wob_cli.EXIT_OK
+        assert [event['event'] for event in events] == ['extracted', 'regenerated']
+        assert events[1]['records'] == 2
+        print("✅ One-off watch run regenerated the reports")
+    finally:
+        shutil.rmtree(folder)
+
+if __name__ == "__main__":
+    test_incremental_extraction()
+    test_run_until_stopped()
+    test_regenerate_after_config_edit()
+    test_cli_watch_once()
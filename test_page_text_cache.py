@@ -0,0 +1,76 @@
+"""
+Test script to verify that cached page text lets a pattern change skip PDF parsing
+"""
+
+import os
+import shutil
+import tempfile
+import time
+import pdfplumber
+from config_manager import ConfigManager
+from extractor_engine import SmartExtractor
+from result_cache import PageTextCache
+from pdf_fixtures import write_text_pdf, soc_lines
+
+def test_page_text_cache():
+    """A second extraction should re-parse records from cached page text only"""
+
+    print("=" * 60)
+    print("WOB Report Extractor - Page Text Cache Test")
+    print("=" * 60)
+
+    folder = tempfile.mkdtemp()
+    original_open = pdfplumber.open
+    try:
+        pdf_path = write_text_pdf(
+            os.path.join(folder, "SD73 WOB Report - August 2025.pdf"),
+            [soc_lines("John Doe"), [], soc_lines("Jane Roe", platform='TikTok')]
+        )
+        page_cache = PageTextCache(os.path.join(folder, 'cache'))
+        extractor = SmartExtractor(ConfigManager(), page_cache=page_cache)
+
+        first = extractor.extract_from_pdf(pdf_path)
+        assert len(first['records']) == 2
+
+        file_hash = extractor._file_hash(pdf_path)
+        cached_pages = page_cache.get_pages(file_hash)
+        assert cached_pages is not None and len(cached_pages) == 3, "Pages were not cached"
+        assert cached_pages[1] == '', "Empty page should be cached as empty text"
+
+        # Simulate a pattern change: records are re-parsed but the PDF must not be opened
+        def fail_open(*args, **kwargs):
+            raise AssertionError("PDF was re-opened despite cached page text")
+        pdfplumber.open = fail_open
+
+        second = extractor.extract_from_pdf(pdf_path)
+        assert second == first, "Re-parse from cached text differs from the original extraction"
+
+        print("\n✅ Records re-parsed from cached page text without opening the PDF")
+    finally:
+        pdfplumber.open = original_open
+        shutil.rmtree(folder)
+
+def test_page_text_cache_eviction():
+    """Least recently used documents are evicted beyond the size bound"""
+
+    folder = tempfile.mkdtemp()
+    try:
+        page_cache = PageTextCache(folder, max_size_mb=0.003)  # ~3 KB
+        pages = [os.urandom(600).hex() for _ in range(2)]  # ~0.65 KB compressed per page
+        for n in range(3):
+            page_cache.put_pages(f"doc{n}", pages)
+            time.sleep(0.01)
+            page_cache.get_pages("doc0")  # keep the first document hot
+
+        assert page_cache.get_pages("doc0") == pages, "Recently used document was evicted"
+        assert page_cache.get_pages("doc1") is None, "Least recently used document was not evicted"
+        assert page_cache.get_pages("doc2") == pages
+        assert not [name for root, _, names in os.walk(page_cache.cache_dir)
+                    for name in names if name.endswith('.tmp')]
+        print("✅ Page text cache stays within its size bound")
+    finally:
+        shutil.rmtree(folder)
+
+if __name__ == "__main__":
+    test_page_text_cache()
+    test_page_text_cache_eviction()
@@ -0,0 +1,68 @@
+"""
+Test script to verify parallel batch extraction with SmartExtractor.extract_many
+"""
+
+import os
+import shutil
+import tempfile
+from config_manager import ConfigManager
+from extractor_engine import SmartExtractor
+from pdf_fixtures import write_text_pdf, soc_lines
+
+def create_test_pdfs(folder):
+    """Write a handful of small reports with a known number of SOCs each"""
+    pdf_paths = []
+    for i in range(6):
+        pages = [soc_lines(f"Student {i} {n}", platform='TikTok' if n % 2 else 'Instagram')
+                 for n in range(i + 1)]
+        pdf_path = os.path.join(folder, f"SD{70 + i} WOB Report - August 2025.pdf")
+        pdf_paths.append(write_text_pdf(pdf_path, pages))
+
+    # A file that cannot be opened should still come back in its slot
+    pdf_paths.insert(3, os.path.join(folder, "missing WOB Report - August 2025.pdf"))
+    return pdf_paths
+
+def test_parallel_extraction():
+    """Parallel results should match the serial ones, in input order, with merged stats"""
+
+    print("=" * 60)
+    print("WOB Report Extractor - Parallel Extraction Test")
+    print("=" * 60)
+
+    folder = tempfile.mkdtemp()
+    try:
+        pdf_paths = create_test_pdfs(folder)
+        config_manager = ConfigManager()
+
+        serial = SmartExtractor(config_manager)
+        serial_results = [serial.extract_from_pdf(pdf) for pdf in pdf_paths]
+
+        parallel = SmartExtractor(config_manager)
+        progress = []
+        parallel_results = parallel.extract_many(
+            pdf_paths, workers=3,
+            progress_callback=lambda i, pdf, result: progress.append(i)
+        )
+
+        print(f"\n📄 Extracted {len(parallel_results)} files with 3 workers")
+
+        assert [r['file_name'] for r in parallel_results] == [os.path.basename(p) for p in pdf_paths], \
+            "Results are not in input order"
+        assert parallel_results == serial_results, "Parallel results differ from serial extraction"
+        assert 'error' in parallel_results[3], "Missing file should come back as an error result"
+        assert sorted(progress) == list(range(len(pdf_paths))), "Progress callback not called once per file"
+
+        serial_report = serial.get_extraction_quality_report()
+        parallel_report = parallel.get_extraction_quality_report()
+        print(f"📊 Records processed: {parallel_report['total_records_processed']}")
+
+        assert parallel_report['total_records_processed'] == 21
+        assert parallel_report['field_success_rates'] == serial_report['field_success_rates'], \
+            "Worker statistics were not merged back into the parent extractor"
+
+        print("\n✅ Parallel extraction matches serial extraction")
+    finally:
+        shutil.rmtree(folder)
+
+if __name__ == "__main__":
+    test_parallel_extraction()
@@ -0,0 +1,112 @@
+"""
+Test script to verify the Parquet output datasets
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+import pandas as pd
+from output_generator import OutputGenerator
+from parquet_output import PARQUET_FOLDER, import_pyarrow, month_partition
+from pattern_registry import CONCERN_CATEGORIES
+from test_streaming_csv import make_results
+
+def pyarrow_installed():
+    try:
+        import_pyarrow()
+        return True
+    except ImportError:
+        return False
+
+def test_month_partition():
+    """Month partitions sort by date"""
+
+    print("=" * 60)
+    print("WOB Report Extractor - Parquet Output Test")
+    print("=" * 60)
+
+    assert month_partition("August 2025") == "2025-08"
+    assert month_partition("january 2024") == "2024-01"
+    assert month_partition("Test 2025") == "Test 2025"
+    print("\n✅ Month partitions named YYYY-MM")
+
+def test_missing_pyarrow_is_reported():
+    """Without pyarrow, asking for Parquet fails up front with an install hint"""
+
+    saved = {name: sys.modules.pop(name) for name in list(sys.modules) if name.split('.')[0] == 'pyarrow'}
+    sys.modules['pyarrow'] = None  # Makes "import pyarrow" raise ImportError
+    try:
+        folder = tempfile.mkdtemp()
+        try:
+            OutputGenerator().generate_reports(make_results(1, 3), folder, "August 2025", formats=['csv', 'parquet'])
+            assert False, "Parquet output without pyarrow did not fail"
+        except ImportError as e:
+            assert "pip install pyarrow" in str(e)
+            assert os.listdir(folder) == [], "Outputs were written before the failure"
+        finally:
+            shutil.rmtree(folder)
+    finally:
+        del sys.modules['pyarrow']
+        sys.modules.update(saved)
+    print("✅ Missing pyarrow reported before any output is written")
+
+def test_typed_partitioned_datasets():
+    """Concern flags load as booleans, categories as dictionaries, partitioned by month and district"""
+
+    if not pyarrow_installed():
+        print("⚠️ pyarrow is not installed; skipping the Parquet round trip")
+        return
+
+    folder = tempfile.mkdtemp()
+    try:
+        generator = OutputGenerator()
+        files_created, platform_stats = generator.generate_reports(make_results(3, 20), folder, "August 2025",
+                                                                   formats=['parquet'])
+        assert [name for name, _, _ in files_created] == ['Social Media Data (Parquet)', 'Concerns Data (Parquet)']
+        assert platform_stats['TikTok'] == 3 * (7 + 6 * 2), "Platform stats are still counted without CSVs"
+        assert not [name for name in os.listdir(folder) if name.endswith('.csv')]
+
+        concerns_root = os.path.join(folder, PARQUET_FOLDER, 'concerns')
+        assert sorted(os.listdir(os.path.join(concerns_root, "Month=2025-08"))) == [
+            'District=SD0', 'District=SD1', 'District=SD2']
+        concerns = pd.read_parquet(concerns_root)
+        assert len(concerns) == 60
+        assert str(concerns['District'].dtype) == 'category'
+        assert str(concerns['School'].dtype) == 'category'
+        assert list(concerns.columns[4:4 + len(CONCERN_CATEGORIES)]) == CONCERN_CATEGORIES
+        assert concerns['Other'].dtype == bool
+        # Listed concerns are True/False; categories the report did not list are null
+        first = concerns[(concerns['District'] == 'SD0') & (concerns['SOC_Name'] == 'Student 1')].iloc[0]
+        assert first['Firearms'] == False and first['Bullying/Cyberbullying'] == False
+        assert pd.isna(first['Weapons'])
+
+        social_media = pd.read_parquet(os.path.join(folder, PARQUET_FOLDER, 'social_media'))
+        assert len(social_media) == (7 + 7 + 6 * 2) * 3
+        assert str(social_media['Platform'].dtype) == 'category'
+        assert social_media['Platform'].isna().sum() == 7 * 3, "SOCs without accounts should have a null platform"
+
+        # Re-running a month replaces its partitions instead of adding to them
+        generator.generate_reports(make_results(2, 5), folder, "August 2025", formats=['parquet'])
+        assert len(pd.read_parquet(concerns_root)) == 10
+        assert not [name for name in os.listdir(os.path.join(folder, PARQUET_FOLDER)) if name.startswith('.')]
+        print("✅ Typed, partitioned Parquet datasets written and replaced on re-run")
+
+        # A year of reports loads in one call
+        for month in ["January", "February", "March", "April", "May", "June", "July",
+                      "September", "October", "November", "December"]:
+            generator.generate_reports(make_results(20, 50), folder, f"{month} 2025", formats=['parquet'])
+        started = time.perf_counter()
+        year = pd.read_parquet(concerns_root)
+        elapsed = time.perf_counter() - started
+        print(f"📈 Loaded {len(year):,} concern rows for 12 months in {elapsed * 1000:.0f} ms")
+        assert len(year) == 10 + 11 * 20 * 50
+        assert elapsed < 5
+    finally:
+        shutil.rmtree(folder)
+
+if __name__ == "__main__":
+    test_month_partition()
+    test_missing_pyarrow_is_reported()
+    test_typed_partitioned_datasets()
@@ -0,0 +1,41 @@
+"""
+Test script to verify the precompiled pattern registry used by SmartExtractor
+"""
+
+from config_manager import ConfigManager
+from extractor_engine import SmartExtractor
+
+def test_pattern_registry():
+    """Patterns are compiled once and rebuilt only when the config changes"""
+
+    print("=" * 60)
+    print("WOB Report Extractor - Pattern Registry Test")
+    print("=" * 60)
+
+    config_manager = ConfigManager()
+    extractor = SmartExtractor(config_manager)
+    registry = extractor.patterns
+
+    assert set(registry.concern_checked) == set(extractor.concern_categories)
+    assert extractor.is_concern_checked("☒ Weapons", "Weapons")
+    assert extractor.is_concern_checked("[X] Firearms", "Firearms")
+    assert extractor.is_concern_unchecked("☐ Firearms", "Firearms")
+    assert not extractor.is_concern_checked("☐ Firearms", "Firearms")
+
+    # Platform labels are taken from the report text, so other spellings compile on first use
+    data = extractor.extract_platform_data("INSTAGRAM Username: someone\n", "INSTAGRAM")
+    assert data == {'platform': 'INSTAGRAM', 'username': 'someone'}, data
+    assert registry.platform_fields("INSTAGRAM") is registry.platform_fields("INSTAGRAM")
+
+    extractor._ensure_current_patterns()
+    assert extractor.patterns is registry, "Registry rebuilt although the config did not change"
+
+    config_manager.config_hash = 'changed'
+    extractor._ensure_current_patterns()
+    assert extractor.patterns is not registry, "Registry not rebuilt after a config change"
+    assert extractor.patterns.config_hash == 'changed'
+
+    print("\n✅ Pattern registry compiled once and rebuilt on config change")
+
+if __name__ == "__main__":
+    test_pattern_registry()
@@ -0,0 +1,131 @@
+"""
+Test script to verify recursive PDF discovery and the cached filename index
+"""
+
+import os
+import shutil
+import tempfile
+from pdf_discovery import PdfIndex, find_pdfs, parse_month_years, parse_report_name, scan_pdfs
+
+def touch(path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(b"%PDF-1.4\n")
+    return path
+
+def build_archive(root):
+    return {
+        'sd73_aug': touch(os.path.join(root, "SD73", "SD73 WOB Report - August 2025.pdf")),
+        'sd73_jul': touch(os.path.join(root, "SD73", "SD73 WOB Report - July 2025.pdf")),
+        'sd36_aug': touch(os.path.join(root, "SD36", "2025", "SD36 WOB Report - august 2025.pdf")),
+        'dodge_aug24': touch(os.path.join(root, "Dodge County", "Dodge County WOB Report - August 2024.pdf")),
+        'sd73_underscore': touch(os.path.join(root, "SD73", "SD73 WOB Report_August 2025.pdf")),
+        'sd73_final': touch(os.path.join(root, "SD73", "SD73 WOB August 2025_final.pdf")),
+        'sd5_two_months': touch(os.path.join(root, "SD5", "July 2025 - August 2025 SD5 WOB.pdf")),
+        'notes': touch(os.path.join(root, "notes.pdf")),
+        'csv': touch(os.path.join(root, "SD73", "20250901 - WOB Concerns Data (August 2025).csv")),
+    }
+
+def test_parse_report_name():
+    """District, month and year come from the file name"""
+
+    print("=" * 60)
+    print("WOB Report Extractor - PDF Discovery Test")
+    print("=" * 60)
+
+    assert parse_report_name("SD73 WOB Report - August 2025.pdf") == ('SD73', 'August', 2025)
+    assert parse_report_name("Dodge County WOB Report - march 2024.pdf") == ('Dodge County', 'March', 2024)
+    assert parse_report_name("notes.pdf")[1:] == (None, None)
+    # Underscores next to the month or year, as the old substring match allowed
+    assert parse_report_name("SD73 WOB Report_August 2025.pdf")[1:] == ('August', 2025)
+    assert parse_report_name("SD73 WOB August 2025_final.pdf")[1:] == ('August', 2025)
+    assert parse_month_years("July 2025 - August 2025 SD5 WOB.pdf") == [('July', 2025), ('August', 2025)]
+    assert parse_month_years("SD73 WOB Report - August 20251.pdf") == []
+    print("\n✅ File names parsed")
+
+def test_recursive_find():
+    """Reports in nested district folders are found for the selected month only"""
+
+    root = tempfile.mkdtemp()
+    try:
+        files = build_archive(root)
+        found = find_pdfs(root, "August 2025")
+        assert found == sorted([files['sd73_aug'], files['sd36_aug'], files['sd73_underscore'],
+                                files['sd73_final'], files['sd5_two_months']]), found
+        assert files['sd5_two_months'] in find_pdfs(root, "July 2025")
+        assert set(scan_pdfs(root, "August 2025")) == set(found)
+        print("✅ Recursive discovery found both August 2025 reports")
+    finally:
+        shutil.rmtree(root)
+
+def test_index_reuses_unchanged_directories():
+    """A refresh only re-lists directories that changed, and the index survives a restart"""
+
+    root = tempfile.mkdtemp()
+    cache_dir = tempfile.mkdtemp()
+    index_path = os.path.join(cache_dir, "pdf_index.json")
+    try:
+        files = build_archive(root)
+        listed = []
+
+        class CountingIndex(PdfIndex):
+            def _list_dir(self, path, mtime_ns):
+                listed.append(os.path.relpath(path, root))
+                return super()._list_dir(path, mtime_ns)
+
+        index = CountingIndex(index_path)
+        index.refresh([root])
+        first_listing = len(listed)
+
+        listed.clear()
+        index = CountingIndex(index_path)
+        index.refresh([root])
+        assert listed == [], f"Unchanged directories were listed again: {listed}"
+
+        # Multi-month and multi-year selections come straight from the index
+        august_2025 = [files['sd73_aug'], files['sd36_aug'], files['sd73_underscore'], files['sd73_final'],
+                       files['sd5_two_months']]
+        assert index.select(months=['July', 'August'], years=[2025]) == sorted(august_2025 + [files['sd73_jul']])
+        assert index.select(months=['August'], years=[2024, 2025]) == sorted(august_2025 + [files['dodge_aug24']])
+        assert index.select(districts=['Dodge County']) == [files['dodge_aug24']]
+
+        # Adding a report only re-lists its own directory
+        new_report = touch(os.path.join(root, "SD36", "2025", "SD36 WOB Report - September 2025.pdf"))
+        folder_stat = os.stat(os.path.dirname(new_report))
+        os.utime(os.path.dirname(new_report), ns=(folder_stat.st_atime_ns, folder_stat.st_mtime_ns + 1_000_000))
+        index.refresh([root])
+        assert listed == [os.path.join("SD36", "2025")], listed
+        assert index.select(months=['September'], years=[2025]) == [new_report]
+
+        # Removed folders drop out of the index
+        shutil.rmtree(os.path.join(root, "Dodge County"))
+        index.refresh([root])
+        assert index.select(years=[2024]) == []
+        print(f"✅ First refresh listed {first_listing} folders, unchanged refresh listed none")
+    finally:
+        shutil.rmtree(root)
+        shutil.rmtree(cache_dir)
+
+def test_symlinked_folders_listed_once():
+    """Folder links neither loop nor return the same report twice"""
+
+    root = tempfile.mkdtemp()
+    try:
+        report = touch(os.path.join(root, "SD73", "2025", "SD73 WOB Report - August 2025.pdf"))
+        os.symlink(root, os.path.join(root, "SD73", "up"))  # Link back up the tree
+        os.symlink(os.path.join(root, "SD73", "2025"), os.path.join(root, "SD73", "current"))
+
+        # Either path to the report is fine, as long as there is only one
+        found = find_pdfs(root, "August 2025")
+        assert [os.path.realpath(path) for path in found] == [os.path.realpath(report)], found
+        scanned = scan_pdfs(root, "August 2025")
+        assert [os.path.realpath(path) for path in scanned] == [os.path.realpath(report)], scanned
+        print("✅ Symlinked folders listed once")
+    finally:
+        shutil.rmtree(root)
+
+if __name__ == "__main__":
+    test_parse_report_name()
+    test_recursive_find()
+    test_index_reuses_unchanged_directories()
+    test_symlinked_folders_listed_once()
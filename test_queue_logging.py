@@ -0,0 +1,129 @@
+"""
+Test script to verify log records are written off the extracting thread
+"""
+
+import logging
+import os
+import threading
+from datetime import datetime
+from logging.handlers import QueueHandler
+import extractor_engine
+from config_manager import ConfigManager
+from extractor_engine import SmartExtractor, flush_logs
+
+class StalledShareHandler(logging.Handler):
+    """A log file on a network share that stops responding until released"""
+
+    def __init__(self):
+        super().__init__()
+        self.released = threading.Event()
+        self.messages = []
+        self.threads = set()
+
+    def emit(self, record):
+        self.released.wait(10)
+        self.messages.append(record.getMessage())
+        self.threads.add(threading.current_thread().name)
+
+def test_logging_does_not_block_extraction():
+    """Extraction only queues its records; the listener thread writes them"""
+
+    print("=" * 60)
+    print("WOB Report Extractor - Queue Logging Test")
+    print("=" * 60)
+
+    extractor = SmartExtractor(ConfigManager())
+    assert len(extractor.logger.handlers) == 1 and isinstance(extractor.logger.handlers[0], QueueHandler)
+
+    listener = extractor_engine._log_listener
+    stalled = StalledShareHandler()
+    listener.handlers = listener.handlers + (stalled,)
+    try:
+        # Every record is missing its location and school, so each logs a warning
+        text = "".join(f"Subject of Concern: Student {n}\n☒ Weapons\n" for n in range(30))
+        records = extractor.extract_records(text)
+        assert len(records) == 30
+        assert stalled.messages == [], "A record was written before the stalled handler was released"
+        print("\n✅ Extraction finished while the log handler was stalled")
+
+        stalled.released.set()
+        flush_logs()
+        assert sum('has missing fields' in message for message in stalled.messages) == 30
+        assert threading.current_thread().name not in stalled.threads
+        print("✅ Records written by the listener thread, all of them after flush_logs()")
+    finally:
+        stalled.released.set()
+        listener.handlers = tuple(handler for handler in listener.handlers if handler is not stalled)
+
+class ThreadRecordingFormatter(logging.Formatter):
+    """Remembers which threads formatted records"""
+
+    def __init__(self):
+        super().__init__('%(levelname)s - %(message)s')
+        self.threads = set()
+
+    def format(self, record):
+        self.threads.add(threading.current_thread().name)
+        return super().format(record)
+
+class CollectingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+        self.lines = []
+
+    def emit(self, record):
+        self.records.append(record)
+        self.lines.append(self.format(record))
+
+def test_records_formatted_by_listener():
+    """Messages and tracebacks are formatted on the listener thread, not the extracting one"""
+
+    extractor = SmartExtractor(ConfigManager())
+    listener = extractor_engine._log_listener
+    collecting = CollectingHandler()
+    formatter = ThreadRecordingFormatter()
+    collecting.setFormatter(formatter)
+    listener.handlers = listener.handlers + (collecting,)
+    try:
+        try:
+            raise ValueError("bad page")
+        except ValueError:
+            extractor.logger.error("Failed on %s", "Report.pdf", exc_info=True)
+        flush_logs()
+    finally:
+        listener.handlers = tuple(handler for handler in listener.handlers if handler is not collecting)
+
+    record = collecting.records[-1]
+    assert record.args == ("Report.pdf",) and record.exc_info is not None, "Record was formatted before queueing"
+    assert "Failed on Report.pdf" in collecting.lines[-1] and "ValueError: bad page" in collecting.lines[-1]
+    assert threading.current_thread().name not in formatter.threads
+    print("✅ Messages and tracebacks formatted by the listener thread")
+
+def test_debug_mode_sets_log_level():
+    """Debug messages reach the log file only while debug mode is on"""
+
+    extractor = SmartExtractor(ConfigManager())
+    log_file = os.path.join('logs', f"wob_extractor_{datetime.now().strftime('%Y%m%d')}.log")
+    section = "Subject of Concern: Debug Probe {}\nLocation: Kamloops\n☒ Weapons\n"
+
+    try:
+        assert not extractor.debug_mode
+        extractor.extract_records(section.format("Off"))
+        extractor.debug_mode = True
+        assert extractor.logger.isEnabledFor(logging.DEBUG)
+        extractor.extract_records(section.format("On"))
+    finally:
+        extractor.debug_mode = False
+    flush_logs()
+
+    with open(log_file, 'r') as f:
+        log_content = f.read()
+    assert "Extracted name: Debug Probe On" in log_content
+    assert "Extracted name: Debug Probe Off" not in log_content
+    print("✅ Debug records filtered by the logger level")
+
+if __name__ == "__main__":
+    test_logging_does_not_block_extraction()
+    test_records_formatted_by_listener()
+    test_debug_mode_sets_log_level()
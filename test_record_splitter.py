@@ -0,0 +1,99 @@
+"""
+Test script to verify incremental SOC record splitting across page chunks
+"""
+
+import random
+import re
+from config_manager import ConfigManager
+from extractor_engine import SmartExtractor
+from record_splitter import SOCRecordSplitter, SectionView, SOC_HEADER_PATTERN
+from pdf_fixtures import soc_lines
+
+def build_report_text(num_records):
+    lines = ["District WOB Report - August 2025", "Summary page"]
+    for n in range(num_records):
+        lines.extend(soc_lines(f"Student {n}"))
+        lines.append("SOC: " + f"Alias {n}" if n % 3 == 0 else "Notes: none")
+    return "\n".join(lines) + "\n"
+
+def test_splitter_matches_re_split():
+    """Any chunking of the text should produce the same sections as re.split"""
+
+    print("=" * 60)
+    print("WOB Report Extractor - Incremental Record Splitter Test")
+    print("=" * 60)
+
+    text = build_report_text(25)
+    expected = re.split(SOC_HEADER_PATTERN, text)[1:]
+    rng = random.Random(7)
+
+    for trial in range(50):
+        splitter = SOCRecordSplitter()
+        sections = []
+        pos = 0
+        while pos < len(text):
+            step = rng.randint(1, 80)
+            sections.extend(splitter.feed(text[pos:pos + step]))
+            pos += step
+        sections.extend(splitter.close())
+        assert sections == expected, f"Chunked split differs from re.split on trial {trial}"
+
+    print(f"\n✅ {len(expected)} sections identical to re.split across 50 random chunkings")
+
+def test_header_across_page_break():
+    """A header whose line is split between two chunks is still detected"""
+
+    splitter = SOCRecordSplitter()
+    assert splitter.feed("Subject of Concern: A\nLocation: X\nSubject of") == []
+    completed = splitter.feed(" Concern: B\nLocation: Y\n")
+    assert completed == [" A\nLocation: X\n"], completed
+    assert splitter.close() == [" B\nLocation: Y\n"]
+    print("✅ Header split across chunks detected")
+
+def test_records_emitted_before_end():
+    """Records come out as soon as the next SOC header has been seen"""
+
+    extractor = SmartExtractor(ConfigManager())
+    pages = ["\n".join(soc_lines(f"Student {n}")) + "\n" for n in range(4)]
+
+    fed = []
+    def page_source():
+        for page in pages:
+            fed.append(page)
+            yield page
+
+    emitted_after = []
+    for record in extractor.iter_records(page_source()):
+        emitted_after.append((record['name'], len(fed)))
+
+    print(f"✅ Records emitted after pages: {emitted_after}")
+    assert [name for name, _ in emitted_after] == [f"Student {n}" for n in range(4)]
+    assert emitted_after[0][1] == 2, "First record should be complete once page 2 is read"
+    assert extractor.extract_records("".join(pages)) == [r for r in extractor.iter_records(pages)]
+
+def test_views_parse_like_strings():
+    """Parsing a section through its view gives the same record as parsing a copy"""
+
+    extractor = SmartExtractor(ConfigManager())
+    lines = []
+    for n in range(6):
+        lines.extend(soc_lines(f"Student {n}", concerns=('Weapons', 'Bullying/Cyberbullying'), username=f"@user{n}"))
+        lines.extend(["Concern | Yes | No", "Firearms | X |", "| Sexual Assault | | X |", "Other: graffiti tags"])
+    text = "\n".join(lines)
+
+    splitter = SOCRecordSplitter()
+    sections = splitter.feed(text) + splitter.close()
+    assert len(sections) == 6 and all(isinstance(section, SectionView) for section in sections)
+    for section in sections:
+        for report_format in ('checkbox', 'table'):
+            from_view = extractor.extract_record_from_section(section, report_format)
+            from_copy = extractor.extract_record_from_section(str(section), report_format)
+            assert from_view == from_copy, (from_view, from_copy)
+            assert from_view['concerns'].get('Firearms') is (True if report_format == 'table' else None)
+    print(f"✅ {len(sections)} section views parsed identically to copied sections")
+
+if __name__ == "__main__":
+    test_splitter_matches_re_split()
+    test_header_across_page_break()
+    test_records_emitted_before_end()
+    test_views_parse_like_strings()
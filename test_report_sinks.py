@@ -0,0 +1,129 @@
+"""
+Test script to verify report outputs are fed from a single pass through pluggable sinks
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+from csv_writers import StreamingCsvWriter
+from output_generator import OutputGenerator, QualityReportSink, ReportSink
+from test_streaming_csv import make_results
+
+class DistrictCountSink(ReportSink):
+    """Example extra output: SOCs per district"""
+
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self.counts = {}
+
+    def add_record(self, record, district):
+        self.counts[district] = self.counts.get(district, 0) + 1
+
+    def close(self):
+        with open(self.filepath, 'w') as f:
+            for district, count in sorted(self.counts.items()):
+                f.write(f"{district}: {count}\n")
+        return [('District Counts', len(self.counts), self.filepath)]
+
+class SlowShareSink(ReportSink):
+    """Finishing the file waits on a slow network share until every output is being finished"""
+
+    def __init__(self, barrier, intervals):
+        self.barrier = barrier
+        self.intervals = intervals
+
+    def add_record(self, record, district):
+        pass
+
+    def close(self):
+        started = time.perf_counter()
+        self.barrier.wait()  # Raises BrokenBarrierError if the outputs are finished one at a time
+        self.intervals.append((started, time.perf_counter()))
+        return []
+
+class BrokenSink(ReportSink):
+    def add_record(self, record, district):
+        raise RuntimeError("disk full")
+
+def test_extra_sink_shares_the_pass():
+    """An extra sink sees every record in the same traversal as the standard outputs"""
+
+    print("=" * 60)
+    print("WOB Report Extractor - Report Sinks Test")
+    print("=" * 60)
+
+    folder = tempfile.mkdtemp()
+    try:
+        reads = []
+
+        def results():
+            for result in make_results(3, 10):
+                reads.append(result['file_name'])
+                yield result
+
+        extra = DistrictCountSink(os.path.join(folder, "district counts.txt"))
+        files_created, platform_stats = OutputGenerator().generate_reports(results(), folder, "August 2025",
+                                                                           extra_sinks=[extra])
+        assert len(reads) == 3, "Extraction results were traversed more than once"
+        assert extra.counts == {'SD0': 10, 'SD1': 10, 'SD2': 10}
+        assert [name for name, _, _ in files_created] == [
+            'Social Media Data', 'Concerns Data', 'Analytics Summary', 'Account Tracker (Legacy)', 'District Counts']
+        assert platform_stats['TikTok'] == 3 * (3 + 3 * 2)
+        print("\n✅ Standard and extra outputs written from one pass")
+    finally:
+        shutil.rmtree(folder)
+
+def test_failed_generation_leaves_no_partial_csvs():
+    """A sink failing part way discards the CSVs already started"""
+
+    folder = tempfile.mkdtemp()
+    try:
+        try:
+            OutputGenerator().generate_reports(make_results(2, 5), folder, "August 2025", extra_sinks=[BrokenSink()])
+            assert False, "The sink error was swallowed"
+        except RuntimeError:
+            pass
+        assert os.listdir(folder) == [], os.listdir(folder)
+        print("✅ Partial outputs removed after a failure")
+    finally:
+        shutil.rmtree(folder)
+
+def test_outputs_finish_concurrently():
+    """Slow outputs are finished in parallel and every file appears complete under its final name"""
+
+    folder = tempfile.mkdtemp()
+    try:
+        path = os.path.join(folder, "rows.csv")
+        writer = StreamingCsvWriter(path, ['a'])
+        writer.write({'a': 1})
+        assert not os.path.exists(path), "The CSV was visible before it was complete"
+        writer.close()
+        assert os.listdir(folder) == ["rows.csv"]
+
+        barrier = threading.Barrier(3, timeout=10)
+        intervals = []
+
+        class Extractor:
+            def save_extraction_quality_report(self, output_folder, month_year):
+                SlowShareSink(barrier, intervals).close()
+                return os.path.join(output_folder, "quality.csv")
+
+        files_created, _ = OutputGenerator().generate_reports(
+            make_results(2, 5), folder, "August 2025",
+            extra_sinks=[SlowShareSink(barrier, intervals), SlowShareSink(barrier, intervals),
+                         QualityReportSink(Extractor(), folder, "August 2025")])
+        assert len(intervals) == 3
+        assert max(start for start, _ in intervals) < min(end for _, end in intervals), \
+            "Outputs were not being finished at the same time"
+        assert files_created[-1][0] == 'Extraction Quality Report'
+        assert not [name for name in os.listdir(folder) if name.endswith('.tmp')]
+        print("✅ Outputs written concurrently and renamed into place")
+    finally:
+        shutil.rmtree(folder)
+
+if __name__ == "__main__":
+    test_extra_sink_shares_the_pass()
+    test_failed_generation_leaves_no_partial_csvs()
+    test_outputs_finish_concurrently()
@@ -0,0 +1,133 @@
+"""
+Test script to verify the content-hash result cache for extracted PDFs
+"""
+
+import os
+import shutil
+import tempfile
+import time
+from config_manager import ConfigManager
+from extractor_engine import SmartExtractor
+from result_cache import ResultCache
+from pdf_fixtures import write_text_pdf, soc_lines
+from test_config_patterns import TABLE_REPORT
+
+def test_result_cache():
+    """A rerun should only re-parse files whose content changed"""
+
+    print("=" * 60)
+    print("WOB Report Extractor - Result Cache Test")
+    print("=" * 60)
+
+    folder = tempfile.mkdtemp()
+    try:
+        pdf_paths = [
+            write_text_pdf(os.path.join(folder, f"SD{n} WOB Report - August 2025.pdf"),
+                           [soc_lines(f"Student {n}")])
+            for n in range(3)
+        ]
+        cache = ResultCache(os.path.join(folder, 'cache'))
+        extractor = SmartExtractor(ConfigManager(), cache=cache)
+
+        parsed = []
+        original_extract = extractor.extract_from_pdf
+        def counting_extract(pdf_path):
+            parsed.append(os.path.basename(pdf_path))
+            return original_extract(pdf_path)
+        extractor.extract_from_pdf = counting_extract
+
+        first_run = extractor.extract_many(pdf_paths, workers=1)
+        first_report = extractor.get_extraction_quality_report()
+        assert len(parsed) == 3, f"First run should parse every file, parsed {parsed}"
+
+        # Rerun with one file changed
+        write_text_pdf(pdf_paths[1], [soc_lines("Student 1"), soc_lines("Student 1b")])
+        parsed.clear()
+        extractor.reset_extraction_stats()
+        second_run = extractor.extract_many(pdf_paths, workers=1)
+
+        print(f"\n📄 Re-parsed on rerun: {parsed}")
+        assert parsed == [os.path.basename(pdf_paths[1])], "Unchanged files were re-parsed"
+        assert second_run[0] == first_run[0] and second_run[2] == first_run[2]
+        assert len(second_run[1]['records']) == 2
+
+        # Cached files still count towards the quality report
+        second_report = extractor.get_extraction_quality_report()
+        assert second_report['total_records_processed'] == first_report['total_records_processed'] + 1
+
+        print("✅ Unchanged files served from cache")
+    finally:
+        shutil.rmtree(folder)
+
+def test_result_cache_eviction():
+    """The cache should evict least recently used entries beyond its size bound"""
+
+    folder = tempfile.mkdtemp()
+    try:
+        cache = ResultCache(folder, max_size_mb=0.001)  # ~1 KB
+        payload = {'file_name': 'x.pdf', 'records': [{'name': 'n' * 300}]}
+        for n in range(3):
+            cache.put(f"key{n}", payload, {})
+            time.sleep(0.01)
+            cache.get("key0")  # keep the first entry hot
+
+        assert cache.get("key0") is not None, "Recently used entry was evicted"
+        assert cache.get("key1") is None, "Least recently used entry was not evicted"
+        print("✅ LRU eviction keeps the cache within its size bound")
+    finally:
+        shutil.rmtree(folder)
+
+class CountingResultCache(ResultCache):
+    scans = 0
+
+    def evict(self):
+        self.scans += 1
+        super().evict()
+
+def test_put_keeps_running_size():
+    """Puts under the size bound do not rescan the cache directory"""
+
+    folder = tempfile.mkdtemp()
+    try:
+        cache = CountingResultCache(folder, max_size_mb=0.01)  # ~10 KB
+        payload = {'file_name': 'x.pdf', 'records': [{'name': 'n' * 300}]}
+        for n in range(10):
+            cache.put(f"key{n}", payload, {})
+        cache.put("key0", payload, {})  # Replacing an entry does not count it twice
+        assert cache.scans == 1, f"Cache scanned on {cache.scans} puts"
+        on_disk = sum(os.path.getsize(os.path.join(cache.cache_dir, name)) for name in os.listdir(cache.cache_dir))
+        assert cache._total_size == on_disk
+
+        for n in range(10, 40):
+            cache.put(f"key{n}", payload, {})
+        assert 1 < cache.scans < 31, cache.scans
+        assert sum(os.path.getsize(os.path.join(cache.cache_dir, name))
+                   for name in os.listdir(cache.cache_dir)) <= cache.max_size_bytes
+        print("✅ Cache directory only rescanned when the size bound is exceeded")
+    finally:
+        shutil.rmtree(folder)
+
+def test_copied_report_parsed_for_its_district():
+    """A report copied to another district's name is parsed with that district's format"""
+
+    folder = tempfile.mkdtemp()
+    try:
+        checkbox_path = write_text_pdf(os.path.join(folder, "SD73 WOB Report - August 2025.pdf"), [TABLE_REPORT])
+        table_path = os.path.join(folder, "Dodge County WOB Report - August 2025.pdf")
+        shutil.copyfile(checkbox_path, table_path)
+        extractor = SmartExtractor(ConfigManager(), cache=ResultCache(os.path.join(folder, 'cache')))
+
+        checkbox_result, = extractor.extract_many([checkbox_path], workers=1)
+        table_result, = extractor.extract_many([table_path], workers=1)
+        assert checkbox_result['records'][0]['concerns'] == {}
+        assert table_result['records'][0]['concerns'] == {'Weapons': True, 'Firearms': False}, \
+            "Cached result of the other district was reused"
+        print("✅ Cache entries are kept apart per district")
+    finally:
+        shutil.rmtree(folder)
+
+if __name__ == "__main__":
+    test_result_cache()
+    test_result_cache_eviction()
+    test_put_keeps_running_size()
+    test_copied_report_parsed_for_its_district()
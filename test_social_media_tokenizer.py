@@ -0,0 +1,81 @@
+"""
+Test script to verify the single-pass social media account tokenizer
+"""
+
+from config_manager import ConfigManager
+from extractor_engine import SmartExtractor
+from pattern_registry import SOCIAL_MEDIA_PLATFORMS
+
+def test_many_accounts():
+    """Every account block in a long section is extracted with all of its fields"""
+
+    print("=" * 60)
+    print("WOB Report Extractor - Social Media Tokenizer Test")
+    print("=" * 60)
+
+    extractor = SmartExtractor(ConfigManager())
+    lines = []
+    expected = []
+    for n in range(14):
+        platform = SOCIAL_MEDIA_PLATFORMS[n % len(SOCIAL_MEDIA_PLATFORMS)]
+        lines.extend([
+            f"{platform} Information & Activity",
+            f"{platform} Display Name: Display {n} ........",
+            f"{platform} Username: @user_{n}",
+            f"{platform} ID: {1000 + n}",
+            f"{platform} URL: https://www.{platform.lower()}.com/user_{n}/",
+            "Activity: posts about weekend plans",
+        ])
+        expected.append({
+            'platform': platform,
+            'display_name': f"Display {n}",
+            'username': f"user_{n}",
+            'user_id': str(1000 + n),
+            'url': f"https://www.{platform.lower()}.com/user_{n}/"
+        })
+
+    accounts = extractor.extract_social_media("\n".join(lines))
+    print(f"\n📱 Extracted {len(accounts)} accounts")
+    assert accounts == expected, accounts
+    print("✅ All 14 accounts extracted in order")
+
+def test_mixed_formats():
+    """Headers, platform-prefixed fields, mentions, bare URLs and @handles"""
+
+    extractor = SmartExtractor(ConfigManager())
+
+    # Prefixed fields without headers, with a second account on the same platform
+    accounts = extractor.extract_social_media("""Instagram Display Name: first
+Instagram Username: first_user
+Instagram Username: second_user
+TIKTOK Username: loud
+""")
+    assert accounts == [
+        {'platform': 'Instagram', 'display_name': 'first', 'username': 'first_user'},
+        {'platform': 'Instagram', 'username': 'second_user'},
+        {'platform': 'TikTok', 'username': 'loud'},
+    ], accounts
+
+    # Header followed by unprefixed fields, a bare profile URL and an @handle
+    accounts = extractor.extract_social_media("""Snapchat Information Activity
+Seen messaging from https://www.snapchat.com/add/snappy
+Known as @snappy_handle, contact snappy@example.com
+Discord Information & Activity
+ID: 8812-77
+""")
+    assert accounts == [
+        {'platform': 'Snapchat', 'url': 'https://www.snapchat.com/add/snappy', 'username': 'snappy_handle'},
+        {'platform': 'Discord', 'user_id': '8812-77'},
+    ], accounts
+
+    # A platform named on the same line as a field
+    accounts = extractor.extract_social_media("Contact via Instagram: Username: zz\n")
+    assert accounts == [{'platform': 'Instagram', 'username': 'zz'}], accounts
+
+    # No account data at all
+    assert extractor.extract_social_media("Instagram Information & Activity\nNo activity found\n") == []
+    print("✅ Mixed account formats tokenized correctly")
+
+if __name__ == "__main__":
+    test_many_accounts()
+    test_mixed_formats()
@@ -0,0 +1,85 @@
+"""
+Test script to verify start-up stays fast: heavy libraries are imported on first use
+"""
+
+import os
+import subprocess
+import sys
+from config_manager import ConfigManager
+
+# Only needed once a PDF is parsed or a workbook/Parquet file is written
+HEAVY_MODULES = ('pandas', 'numpy', 'openpyxl', 'pdfplumber', 'pdfminer', 'pyarrow')
+# Importing the GUI or CLI module (measured at about 0.1 s; the budget leaves room for slow machines)
+IMPORT_BUDGET_SECONDS = 0.5
+# From interpreter start to the main window drawn with a warm config cache
+STARTUP_BUDGET_SECONDS = 1.5
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def import_times(module):
+    """{module name: cumulative import seconds} from `python -X importtime -c "import <module>"`"""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True, cwd=REPO_DIR
+    ).stderr
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative) / 1_000_000
+    return times
+
+def test_heavy_imports_deferred():
+    """Importing the GUI and CLI pulls in none of pandas, pdfplumber or pyarrow"""
+
+    print("=" * 60)
+    print("WOB Report Extractor - Startup Imports Test")
+    print("=" * 60)
+
+    for module in ('wob_extractor_app', 'wob_cli'):
+        times = import_times(module)
+        heavy = sorted(name for name in times if name.split('.')[0] in HEAVY_MODULES)
+        assert not heavy, f"{module} imports {heavy[:5]} at start-up"
+        print(f"⏱️ import {module}: {times[module]:.3f} s")
+        assert times[module] < IMPORT_BUDGET_SECONDS, f"{module} took {times[module]:.3f} s to import"
+    print("\n✅ Heavy libraries deferred to first use")
+
+STARTUP_SCRIPT = """
+import time
+started = time.perf_counter()
+import tkinter as tk
+import wob_extractor_app
+try:
+    root = tk.Tk()
+except tk.TclError:
+    # No display: time the same start-up work as WOBExtractorApp.__init__ without the widgets
+    import os
+    from config_manager import ConfigManager
+    from extractor_engine import SmartExtractor
+    from result_cache import ResultCache, PageTextCache
+    from pdf_discovery import PdfIndex
+    SmartExtractor(ConfigManager(), cache=ResultCache(), page_cache=PageTextCache())
+    PdfIndex(os.path.join('cache', 'pdf_index.json'))
+    print('components', time.perf_counter() - started)
+else:
+    wob_extractor_app.WOBExtractorApp(root)
+    root.update()
+    print('window', time.perf_counter() - started)
+    root.destroy()
+"""
+
+def test_main_window_within_budget():
+    """The main window is up within the start-up budget"""
+
+    ConfigManager()  # Make sure the cache is warm, as on every start after the first
+    output = subprocess.run([sys.executable, "-c", STARTUP_SCRIPT], capture_output=True, text=True,
+                            check=True, cwd=REPO_DIR).stdout.split()
+    measured, seconds = output[-2], float(output[-1])
+    print(f"⏱️ Start-up ({measured}): {seconds:.3f} s")
+    assert seconds < STARTUP_BUDGET_SECONDS, f"Start-up took {seconds:.3f} s"
+    print("✅ Start-up within budget")
+
+if __name__ == "__main__":
+    test_heavy_imports_deferred()
+    test_main_window_within_budget()
@@ -0,0 +1,106 @@
+"""
+Test script to verify the streaming CSV writers match the pandas output
+"""
+
+import os
+import shutil
+import tempfile
+import tracemalloc
+import pandas as pd
+from csv_writers import StreamingCsvWriter
+from output_generator import OutputGenerator
+
+def read_bytes(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+def write_both(folder, rows, columns=None):
+    """Write rows with the streaming writer and with pandas; returns both files' bytes"""
+    streamed = os.path.join(folder, "streamed.csv")
+    expected = os.path.join(folder, "pandas.csv")
+    writer = StreamingCsvWriter(streamed, columns)
+    for row in rows:
+        writer.write(row)
+    assert writer.close() == len(rows)
+    pd.DataFrame(rows).to_csv(expected, index=False)
+    return read_bytes(streamed), read_bytes(expected)
+
+def test_matches_pandas():
+    """Fixed and record-dependent columns are written exactly as DataFrame.to_csv writes them"""
+
+    print("=" * 60)
+    print("WOB Report Extractor - Streaming CSV Test")
+    print("=" * 60)
+
+    folder = tempfile.mkdtemp()
+    try:
+        fixed = [
+            {'SOC_Name': 'Doe, Jane', 'Platform': 'TikTok', 'URL': 'https://tiktok.com/@jane'},
+            {'SOC_Name': 'Say "hi"', 'Platform': '', 'URL': 'line\nbreak'},
+        ]
+        streamed, expected = write_both(folder, fixed, ['SOC_Name', 'Platform', 'URL'])
+        assert streamed == expected
+        print("\n✅ Fixed columns match")
+
+        # Concern columns vary per record: new columns are appended in order of first appearance and
+        # an integer column missing from some rows is written as floats, as pandas does
+        concerns = [
+            {'SOC_Name': 'A', 'Firearms': 1, 'Other': 0, 'Other_Text': ''},
+            {'SOC_Name': 'B', 'Sexual Assault': 0, 'Firearms': 0, 'Other': 1, 'Other_Text': 'Vaping'},
+            {'SOC_Name': 'C', 'Other': 0, 'Other_Text': 'ok, "quoted"'},
+            {'SOC_Name': 'D', 'Bullying/Cyberbullying': 1, 'Other': 0, 'Other_Text': None},
+        ]
+        streamed, expected = write_both(folder, concerns)
+        assert streamed == expected, f"\n{streamed.decode()}\n!=\n{expected.decode()}"
+        print("✅ Record-dependent concern columns match")
+    finally:
+        shutil.rmtree(folder)
+
+def make_results(files, records_per_file):
+    """Yield extraction results one file at a time"""
+    for i in range(files):
+        records = []
+        for j in range(records_per_file):
+            records.append({
+                'name': f"Student {j}",  # The same SOCs recur in each month's report
+                'school': "Central High",
+                'location': "Kamloops",
+                'soc_affiliation': "Student",
+                'concerns': {'Firearms': j % 2 == 0, 'Bullying/Cyberbullying': j % 3 == 0} if j % 5 else {},
+                'other_concern': j % 7 == 0,
+                'other_concern_text': "Vaping" if j % 7 == 0 else "",
+                'social_media': [{'platform': 'TikTok', 'username': f"user{j}", 'display_name': f"User {j}",
+                                  'user_id': '', 'url': f"https://tiktok.com/@user{j}"}] * (j % 3)
+            })
+        yield {'file_name': f"SD{i} WOB Report - August 2025.pdf", 'records': records}
+
+def test_generate_reports_streams():
+    """generate_reports consumes a generator once and its memory does not grow with the SOC count"""
+
+    folder = tempfile.mkdtemp()
+    try:
+        generator = OutputGenerator()
+        files_created, _ = generator.generate_reports(make_results(3, 20), folder, "August 2025")
+        counts = {name: count for name, count, _ in files_created}
+        assert counts['Concerns Data'] == 60
+        # Per file: 7 SOCs without accounts still get a row, 7 have one account, 6 have two
+        assert counts['Social Media Data'] == (7 + 7 + 6 * 2) * 3
+        concerns_file = [path for name, _, path in files_created if name == 'Concerns Data'][0]
+        assert len(pd.read_csv(concerns_file)) == 60
+
+        peaks = []
+        for files in (5, 50):
+            tracemalloc.start()
+            generator.generate_reports(make_results(files, 200), folder, "August 2025")
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+        print(f"📈 Peak memory: {peaks[0] / 1024:.0f} KB for 1,000 SOCs, {peaks[1] / 1024:.0f} KB for 10,000 SOCs")
+        # Only one file's results are alive at a time and the written rows are not kept
+        assert peaks[1] < peaks[0] * 1.5, peaks
+        print("✅ Output memory stays flat as the SOC count grows")
+    finally:
+        shutil.rmtree(folder)
+
+if __name__ == "__main__":
+    test_matches_pandas()
+    test_generate_reports_streams()
@@ -0,0 +1,74 @@
+"""
+Test script to verify bounded-memory page streaming in extract_from_pdf
+"""
+
+import os
+import shutil
+import tempfile
+from config_manager import ConfigManager
+from extractor_engine import SmartExtractor
+from pdf_fixtures import write_text_pdf, soc_lines
+
+class FakePage:
+    """Stands in for a pdfplumber page and records whether its cache was flushed"""
+
+    def __init__(self, text, tracker):
+        self.text = text
+        self.tracker = tracker
+        self.flushed = False
+
+    def extract_text(self):
+        self.tracker['live'] += 1
+        self.tracker['peak'] = max(self.tracker['peak'], self.tracker['live'])
+        return self.text
+
+    def flush_cache(self):
+        if not self.flushed:
+            self.flushed = True
+            self.tracker['live'] -= 1
+
+class FakePdf:
+    def __init__(self, texts):
+        self.tracker = {'live': 0, 'peak': 0}
+        self.pages = [FakePage(text, self.tracker) for text in texts]
+
+def test_resident_page_limit():
+    """No more than max_resident_pages pages should hold layout objects at once"""
+
+    print("=" * 60)
+    print("WOB Report Extractor - Streaming Page Test")
+    print("=" * 60)
+
+    extractor = SmartExtractor(ConfigManager(), max_resident_pages=2)
+    fake_pdf = FakePdf([f"page {n}" for n in range(50)])
+
+    texts = [text for _, text, _ in extractor.iter_page_text(fake_pdf, 'fake.pdf')]
+
+    print(f"\n📄 Streamed {len(texts)} pages, peak resident pages: {fake_pdf.tracker['peak']}")
+    assert texts == [f"page {n}" for n in range(50)]
+    assert fake_pdf.tracker['peak'] <= 3, "Pages were not released while streaming"
+    assert all(page.flushed for page in fake_pdf.pages), "Remaining pages were not released at the end"
+    print("✅ Page layout objects released while streaming")
+
+def test_streaming_matches_full_document():
+    """Streaming with a single resident page gives the same records as keeping every page"""
+
+    folder = tempfile.mkdtemp()
+    try:
+        pdf_path = write_text_pdf(
+            os.path.join(folder, "SD73 WOB Report - August 2025.pdf"),
+            [soc_lines(f"Student {n}") for n in range(5)]
+        )
+        config_manager = ConfigManager()
+        streamed = SmartExtractor(config_manager, max_resident_pages=1).extract_from_pdf(pdf_path)
+        resident = SmartExtractor(config_manager, max_resident_pages=None).extract_from_pdf(pdf_path)
+
+        assert len(streamed['records']) == 5
+        assert streamed == resident, "Streaming changed the extracted records"
+        print("✅ Streaming extraction matches whole-document extraction")
+    finally:
+        shutil.rmtree(folder)
+
+if __name__ == "__main__":
+    test_resident_page_limit()
+    test_streaming_matches_full_document()
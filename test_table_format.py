@@ -0,0 +1,86 @@
+"""
+Test script to verify table-format concern parsing for table-format districts
+"""
+
+import os
+import shutil
+import tempfile
+import time
+from config_manager import ConfigManager
+from extractor_engine import SmartExtractor
+from output_generator import OutputGenerator
+from test_config_patterns import write_config
+
+TABLE_SECTION = """ Casey Sample
+Location: Juneau
+School: Dodge County High School
+Concern | Yes | No
+| Weapons | X | |
+Firearms | | X
+Physical Violence|x|
+Substance Use Concerns | Xavier mentioned in notes
+Notes: Firearms | X appears in a quoted message
+"""
+
+def test_report_format_lookup():
+    """Districts sheet drives which report format a file uses"""
+
+    print("=" * 60)
+    print("WOB Report Extractor - Table Format Test")
+    print("=" * 60)
+
+    registry = SmartExtractor(ConfigManager()).patterns
+    output_gen = OutputGenerator()
+    assert registry.report_format(
+        output_gen.extract_district("Dodge County WOB Report - August 2025.pdf")) == 'table'
+    assert registry.report_format(
+        output_gen.extract_district("SD73 WOB Report - August 2025.pdf")) == 'checkbox'
+    assert registry.report_format("Somewhere New") == 'checkbox', "Default row not used"
+
+    # Special_Rules=concerns_in_table overrides the Report_Format column
+    folder = tempfile.mkdtemp()
+    try:
+        config_file = os.path.join(folder, "extraction_config.xlsx")
+        write_config(config_file, districts=[['SD36', 'checkbox', 'concerns_in_table']])
+        registry = SmartExtractor(ConfigManager(config_file, os.path.join(folder, "config.json"))).patterns
+        assert registry.report_format('SD36') == 'table', "concerns_in_table rule ignored"
+    finally:
+        shutil.rmtree(folder)
+    print("\n✅ Report format looked up from the Districts sheet")
+
+def test_table_rows_parsed():
+    """Only rows whose first cell is a concern count, and only an X cell checks it"""
+
+    extractor = SmartExtractor(ConfigManager())
+
+    table_record = extractor.extract_record_from_section(TABLE_SECTION, 'table')
+    print(f"  Table concerns: {table_record['concerns']}")
+    assert table_record['concerns'] == {
+        'Firearms': False,
+        'Weapons': True,
+        'Physical Violence': True,
+        'Substance Use Concerns': False
+    }, table_record['concerns']
+
+    checkbox_record = extractor.extract_record_from_section(TABLE_SECTION, 'checkbox')
+    assert checkbox_record['concerns'] == {}, "Table rows parsed for a checkbox-format district"
+    print("✅ Table rows parsed only for table-format districts")
+
+def test_table_parsing_is_linear():
+    """A long row full of separators and no X must not cause a slow scan"""
+
+    extractor = SmartExtractor(ConfigManager())
+    long_section = " Name\n" + ("Weapons" + " |" * 20000 + "\n") * 20
+
+    start = time.perf_counter()
+    concerns = extractor.scan_concerns(long_section, 'table')
+    elapsed = time.perf_counter() - start
+
+    print(f"✅ Parsed {len(long_section)} characters of table rows in {elapsed * 1000:.1f} ms")
+    assert concerns == {'Weapons': False}
+    assert elapsed < 1.0
+
+if __name__ == "__main__":
+    test_report_format_lookup()
+    test_table_rows_parsed()
+    test_table_parsing_is_linear()
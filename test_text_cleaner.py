@@ -0,0 +1,58 @@
+"""
+Test script to verify the fused text cleaner matches the original five-pass implementation
+"""
+
+import random
+import re
+from text_cleaner import clean_text, clean_texts
+from test_text_cleaning import CLEANING_CASES
+
+def reference_clean(text):
+    """The original clean_extracted_text: five re.sub passes"""
+    if not text:
+        return text
+    cleaned = re.sub(r'[\.\·_\-\s]+$', '', text)
+    cleaned = re.sub(r'[\.\·]{3,}', '', cleaned)
+    cleaned = re.sub(r'[_]{3,}', '', cleaned)
+    cleaned = re.sub(r'[-]{3,}', '', cleaned)
+    cleaned = re.sub(r'\s+', ' ', cleaned)
+    return cleaned.strip()
+
+# Cases where removing one leader exposes another, plus non-space whitespace
+EDGE_CASES = [
+    "__...__", "..---.", "a_._._b", "A\t\tB\n", "Name  ....　", "-.-...-_-", ". . .", None,
+]
+
+def test_fused_cleaner_equivalence():
+    """clean_text gives the same output as the five-pass reference on every case"""
+
+    print("=" * 60)
+    print("WOB Report Extractor - Fused Text Cleaner Test")
+    print("=" * 60)
+
+    inputs = [case[0] for case in CLEANING_CASES] + EDGE_CASES
+    for text in inputs:
+        assert clean_text(text) == reference_clean(text), f"Mismatch for {text!r}"
+    for text, expected, description in CLEANING_CASES:
+        assert clean_text(text) == expected, description
+
+    rng = random.Random(11)
+    alphabet = list("ab .·_-\t\n X")
+    for _ in range(20000):
+        text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+        assert clean_text(text) == reference_clean(text), f"Mismatch for {text!r}"
+
+    print(f"\n✅ {len(inputs)} listed cases and 20000 random strings match the reference")
+
+def test_batched_cleaner():
+    """clean_texts cleans a list of fields exactly like cleaning each one"""
+
+    fields = [case[0] for case in CLEANING_CASES] + EDGE_CASES
+    assert clean_texts(fields) == [reference_clean(text) for text in fields]
+    assert clean_texts([]) == []
+    assert clean_texts(["A\x00B ....", "C ...."]) == ["A\x00B", "C"]
+    print("✅ Batched cleaning matches per-field cleaning")
+
+if __name__ == "__main__":
+    test_fused_cleaner_equivalence()
+    test_batched_cleaner()
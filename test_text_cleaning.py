@@ -9,6 +9,53 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from extractor_engine import SmartExtractor
 from config_manager import ConfigManager
 
+# Test cases with different formatting patterns
+CLEANING_CASES = [
+    # (input, expected_output, description)
+    ("Kiera Triplett ....................", "Kiera Triplett", "Name with dots"),
+    ("Central High School ...............", "Central High School", "School with dots"),
+    ("Vancouver .........................", "Vancouver", "Location with dots"),
+    ("Gang ABC ..........................", "Gang ABC", "SOC affiliation with dots"),
+
+    # Test with middle dots (unicode)
+    ("John Smith ···················", "John Smith", "Name with middle dots"),
+
+    # Test with underscores
+    ("Jane Doe ____________________", "Jane Doe", "Name with underscores"),
+
+    # Test with dashes
+    ("Oak Ridge School -------------", "Oak Ridge School", "School with dashes"),
+
+    # Test with mixed formatting
+    ("Test Name ....___....", "Test Name", "Mixed dots and underscores"),
+
+    # Test with sequences in the middle
+    ("Part1.......Part2", "Part1Part2", "Dots in the middle"),
+    ("Part1_______Part2", "Part1Part2", "Underscores in the middle"),
+    ("Part1-------Part2", "Part1Part2", "Dashes in the middle"),
+
+    # Test with normal text (shouldn't change)
+    ("Normal Name", "Normal Name", "Normal text without formatting"),
+    ("Dr. John Smith", "Dr. John Smith", "Name with period (should keep)"),
+    ("St. Mary's School", "St. Mary's School", "School with apostrophe and period"),
+
+    # Test with multiple spaces
+    ("Name    with    spaces", "Name with spaces", "Multiple spaces"),
+
+    # Test edge cases
+    ("", "", "Empty string"),
+    ("...", "", "Only dots"),
+    ("___", "", "Only underscores"),
+    ("---", "", "Only dashes"),
+    ("   ", "", "Only spaces"),
+
+    # Real-world examples from PDFs
+    ("Kiera Triplett .................................................................................. 5", 
+     "Kiera Triplett 5", "Name with dots and page number"),
+    ("Central High School ................................................ Vancouver", 
+     "Central High School Vancouver", "School and location with dots"),
+]
+
 def test_text_cleaning():
     """Test the clean_extracted_text method with various formatting scenarios"""
     
@@ -16,52 +63,7 @@ def test_text_cleaning():
     config = ConfigManager()
     extractor = SmartExtractor(config, debug_mode=True)
     
-    # Test cases with different formatting patterns
-    test_cases = [
-        # (input, expected_output, description)
-        ("Kiera Triplett ....................", "Kiera Triplett", "Name with dots"),
-        ("Central High School ...............", "Central High School", "School with dots"),
-        ("Vancouver .........................", "Vancouver", "Location with dots"),
-        ("Gang ABC ..........................", "Gang ABC", "SOC affiliation with dots"),
-        
-        # Test with middle dots (unicode)
-        ("John Smith ···················", "John Smith", "Name with middle dots"),
-        
-        # Test with underscores
-        ("Jane Doe ____________________", "Jane Doe", "Name with underscores"),
-        
-        # Test with dashes
-        ("Oak Ridge School -------------", "Oak Ridge School", "School with dashes"),
-        
-        # Test with mixed formatting
-        ("Test Name ....___....", "Test Name", "Mixed dots and underscores"),
-        
-        # Test with sequences in the middle
-        ("Part1.......Part2", "Part1Part2", "Dots in the middle"),
-        ("Part1_______Part2", "Part1Part2", "Underscores in the middle"),
-        ("Part1-------Part2", "Part1Part2", "Dashes in the middle"),
-        
-        # Test with normal text (shouldn't change)
-        ("Normal Name", "Normal Name", "Normal text without formatting"),
-        ("Dr. John Smith", "Dr. John Smith", "Name with period (should keep)"),
-        ("St. Mary's School", "St. Mary's School", "School with apostrophe and period"),
-        
-        # Test with multiple spaces
-        ("Name    with    spaces", "Name with spaces", "Multiple spaces"),
-        
-        # Test edge cases
-        ("", "", "Empty string"),
-        ("...", "", "Only dots"),
-        ("___", "", "Only underscores"),
-        ("---", "", "Only dashes"),
-        ("   ", "", "Only spaces"),
-        
-        # Real-world examples from PDFs
-        ("Kiera Triplett .................................................................................. 5", 
-         "Kiera Triplett 5", "Name with dots and page number"),
-        ("Central High School ................................................ Vancouver", 
-         "Central High School Vancouver", "School and location with dots"),
-    ]
+    test_cases = CLEANING_CASES
     
     print("Testing Text Cleaning Functionality")
     print("=" * 80)
@@ -0,0 +1,77 @@
+import re
+
+# Characters PDF text uses as leaders and fill lines ("Name ........ 5", "School ____")
+SEPARATOR_CHARS = frozenset('.·_-')
+_TRAILING_CHARS = '.·_- '
+
+# Every whitespace character folded to a space, so trailing formatting is one
+# rstrip (U+3000 is the last codepoint str.isspace() and \s accept)
+_WHITESPACE_TO_SPACE = {
+    codepoint: ' ' for codepoint in range(0x3001)
+    if chr(codepoint).isspace() and codepoint != ord(' ')
+}
+
+# Runs of separator characters long enough to contain a leader to remove
+_SEPARATOR_RUN = re.compile(r'[.·_\-]{3,}')
+_CLASS_RUNS = [re.compile(r'[.·]{3,}'), re.compile(r'_{3,}'), re.compile(r'-{3,}')]
+
+# Joins fields for clean_texts; it is neither whitespace nor a separator, so
+# no run or strip crosses from one field into the next
+_FIELD_SEPARATOR = '\x00'
+
+
+def _drop_separator_run(match):
+    run = match.group()
+    if not run.strip('.·') or not run.strip('_') or not run.strip('-'):
+        return ''
+    # A mixed run such as "__...__": remove dot, underscore and dash leaders in
+    # that order, so a run exposed by an earlier removal goes too
+    for class_run in _CLASS_RUNS:
+        run = class_run.sub('', run)
+    return run
+
+
+def _is_clean(text):
+    """True when text has no formatting characters and only single interior spaces"""
+    return (text.isprintable() and SEPARATOR_CHARS.isdisjoint(text) and '  ' not in text
+            and text[0] != ' ' and text[-1] != ' ')
+
+
+def clean_text(text):
+    """Remove PDF formatting characters (leaders, fill lines, repeated whitespace) from a field.
+
+    Gives the same result as stripping trailing [.·_-\\s] characters, then
+    removing runs of three or more dots, underscores and dashes (in that order),
+    collapsing whitespace and stripping.
+    """
+    if not text or _is_clean(text):
+        return text
+
+    cleaned = text.translate(_WHITESPACE_TO_SPACE).rstrip(_TRAILING_CHARS)
+    if not SEPARATOR_CHARS.isdisjoint(cleaned):
+        cleaned = _SEPARATOR_RUN.sub(_drop_separator_run, cleaned)
+    return ' '.join(cleaned.split())
+
+
+def clean_texts(texts):
+    """Clean a list of fields at once; returns a list in the same order.
+
+    Fields that are already clean are passed through and the rest are joined,
+    so the whitespace fold and leader removal run once over all of them
+    instead of once per field.
+    """
+    cleaned = list(texts)
+    dirty = [index for index, text in enumerate(cleaned) if text and not _is_clean(text)]
+    if len(dirty) < 2 or any(_FIELD_SEPARATOR in cleaned[index] for index in dirty):
+        for index in dirty:
+            cleaned[index] = clean_text(cleaned[index])
+        return cleaned
+
+    joined = _FIELD_SEPARATOR.join(cleaned[index] for index in dirty).translate(_WHITESPACE_TO_SPACE)
+    fields = [field.rstrip(_TRAILING_CHARS) for field in joined.split(_FIELD_SEPARATOR)]
+    joined = _FIELD_SEPARATOR.join(fields)
+    if not SEPARATOR_CHARS.isdisjoint(joined):
+        fields = _SEPARATOR_RUN.sub(_drop_separator_run, joined).split(_FIELD_SEPARATOR)
+    for index, field in zip(dirty, fields):
+        cleaned[index] = ' '.join(field.split())
+    return cleaned
@@ -0,0 +1,311 @@
+"""
+Headless command line entry point for scheduled (cron / server) runs.
+
+Usage:
+    python -m wob_cli FOLDER [FOLDER ...] --month August --year 2025 [options]
+    python -m wob_cli FOLDER --month August --year 2025 --watch [--auto-regenerate]
+
+Extracts every PDF for the month from the input folders, writes the reports
+to the output folder and prints a JSON summary on stdout (log messages go to
+stderr and the log file).
+
+With --watch the folders are watched for new or changed reports, which are
+extracted as they arrive; each event is printed as one JSON line. The reports
+are regenerated from the stored results on SIGUSR1, after every change with
+--auto-regenerate, or by a one-off "--watch --once" run. Exit codes:
+    0  every PDF was processed
+    1  one or more PDFs could not be processed (reports still written)
+    2  invalid arguments
+    3  no PDFs found for the month
+    4  unexpected error
+    130 cancelled (SIGINT/SIGTERM); completed files are kept in the checkpoint journal
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import signal
+import sys
+import threading
+import time
+from datetime import datetime
+from checkpoint_journal import CheckpointJournal
+from config_manager import ConfigManager
+from extractor_engine import SmartExtractor
+from folder_watcher import FolderWatcher
+from output_generator import OutputGenerator, QualityReportSink
+from parquet_output import import_pyarrow
+from pdf_discovery import PdfIndex, find_pdfs
+from result_cache import ResultCache, PageTextCache
+
+EXIT_OK = 0
+EXIT_FILE_ERRORS = 1
+EXIT_USAGE = 2
+EXIT_NO_INPUT = 3
+EXIT_FAILED = 4
+EXIT_CANCELLED = 130
+
+MONTHS = [
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December"
+]
+
+# Defaults are resolved from the install folder, not the working directory (cron runs elsewhere)
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CONFIG = os.path.join(APP_DIR, 'extraction_config.xlsx')
+
+OUTPUT_FORMATS = ['csv', 'parquet', 'quality']
+DEFAULT_FORMATS = ['csv', 'quality']
+
+
+def parse_month(value):
+    """Accept a month name, abbreviation or number and return the full name"""
+    for month in MONTHS:
+        if value.strip().lower() in (month.lower(), month[:3].lower()):
+            return month
+    if value.strip().isdigit() and 1 <= int(value) <= 12:
+        return MONTHS[int(value) - 1]
+    raise argparse.ArgumentTypeError(f"invalid month: {value!r}")
+
+
+def parse_formats(value):
+    formats = [fmt.strip().lower() for fmt in value.split(',') if fmt.strip()]
+    unknown = [fmt for fmt in formats if fmt not in OUTPUT_FORMATS]
+    if unknown or not formats:
+        raise argparse.ArgumentTypeError(
+            f"unknown output format(s): {', '.join(unknown) or value!r} (choose from {', '.join(OUTPUT_FORMATS)})"
+        )
+    return formats
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m wob_cli",
+        description="Extract WOB PDF reports without the GUI and print a JSON summary."
+    )
+    parser.add_argument('folders', nargs='+', help="folder(s) containing the WOB PDF reports (subfolders are searched too)")
+    parser.add_argument('--month', type=parse_month, default=datetime.now().strftime("%B"),
+                        help="report month, e.g. August, Aug or 8 (default: current month)")
+    parser.add_argument('--year', type=int, default=datetime.now().year,
+                        help="report year (default: current year)")
+    parser.add_argument('--output-dir', help="where reports are written (default: the first input folder)")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="extraction worker processes (default: one per CPU core)")
+    parser.add_argument('--config', help="extraction config workbook (default: extraction_config.xlsx in the install folder)")
+    parser.add_argument('--cache-dir', default=os.path.join(APP_DIR, 'cache'),
+                        help="result, page text and config cache folder (default: cache in the install folder)")
+    parser.add_argument('--no-cache', action='store_true', help="do not read or write any cache")
+    parser.add_argument('--log-dir', default=os.path.join(APP_DIR, 'logs'),
+                        help="log file folder (default: logs in the install folder)")
+    parser.add_argument('--formats', type=parse_formats, default=list(DEFAULT_FORMATS),
+                        help=f"comma-separated outputs to write: {', '.join(OUTPUT_FORMATS)} "
+                             f"(default: {','.join(DEFAULT_FORMATS)}; parquet needs pyarrow)")
+    parser.add_argument('--resume', action='store_true',
+                        help="reuse files completed by an interrupted run of the same month")
+    parser.add_argument('--debug', action='store_true', help="detailed extraction logging")
+
+    watch = parser.add_argument_group("watch mode")
+    watch.add_argument('--watch', action='store_true',
+                       help="keep running and extract reports as they arrive in the folders")
+    watch.add_argument('--poll-interval', type=float, default=30,
+                       help="seconds between folder scans (default: 30)")
+    watch.add_argument('--auto-regenerate', action='store_true',
+                       help="rewrite the reports after every batch of new files")
+    watch.add_argument('--once', action='store_true',
+                       help="with --watch: extract anything new, regenerate the reports and exit")
+    return parser
+
+
+def build_extractor(args):
+    cache = None if args.no_cache else ResultCache(args.cache_dir)
+    page_cache = None if args.no_cache else PageTextCache(args.cache_dir)
+    config = ConfigManager(args.config or DEFAULT_CONFIG, os.path.join(args.cache_dir, 'extraction_config.json'),
+                           use_cache=not args.no_cache)
+    return SmartExtractor(config, debug_mode=args.debug, cache=cache, page_cache=page_cache, log_dir=args.log_dir)
+
+
+def install_signal_handlers(handlers):
+    """Install {signum: handler} and return the previous handlers for restore_signal_handlers"""
+    previous_handlers = {}
+    for signum, handler in handlers.items():
+        try:
+            previous_handlers[signum] = signal.signal(signum, handler)
+        except ValueError:
+            pass  # Not the main thread (e.g. called from a test runner thread)
+    return previous_handlers
+
+
+def restore_signal_handlers(previous_handlers):
+    for signum, handler in previous_handlers.items():
+        signal.signal(signum, handler)
+
+
+def run(args, cancel_event=None):
+    """Run one batch and return (exit_code, summary dict)"""
+    started = time.monotonic()
+    month_year = f"{args.month} {args.year}"
+    output_dir = args.output_dir or args.folders[0]
+    summary = {
+        'month_year': month_year,
+        'input_folders': args.folders,
+        'output_dir': output_dir,
+        'files_found': 0,
+        'files_processed': 0,
+        'files_failed': 0,
+        'failures': [],
+        'records': 0,
+        'social_media_accounts': 0,
+        'outputs': [],
+        'cancelled': False
+    }
+
+    pdf_index = None if args.no_cache else PdfIndex(os.path.join(args.cache_dir, 'pdf_index.json'))
+    pdf_files = []
+    for folder in args.folders:
+        if not os.path.isdir(folder):
+            summary['error'] = f"Input folder not found: {folder}"
+            return EXIT_USAGE, summary
+        pdf_files.extend(find_pdfs(folder, month_year, index=pdf_index))
+    pdf_files = list(dict.fromkeys(pdf_files))  # Nested input folders list the same files twice
+    summary['files_found'] = len(pdf_files)
+    if not pdf_files:
+        summary['error'] = f"No PDF files found for {month_year}"
+        return EXIT_NO_INPUT, summary
+
+    os.makedirs(output_dir, exist_ok=True)
+    extractor = build_extractor(args)
+
+    journal = CheckpointJournal(output_dir, month_year)
+    if not args.resume:
+        journal.clear()
+
+    results = extractor.extract_many(pdf_files, workers=args.workers, journal=journal,
+                                     cancel_event=cancel_event)
+
+    for pdf_path, result in zip(pdf_files, results):
+        if result is None:
+            continue
+        if 'error' in result:
+            summary['files_failed'] += 1
+            summary['failures'].append({
+                'file': pdf_path,
+                'error_type': result.get('error_type', 'general_error'),
+                'error': result['error']
+            })
+        else:
+            summary['files_processed'] += 1
+            summary['records'] += len(result.get('records', []))
+
+    if cancel_event is not None and cancel_event.is_set():
+        summary['cancelled'] = True
+        summary['elapsed_seconds'] = round(time.monotonic() - started, 2)
+        return EXIT_CANCELLED, summary
+
+    # The quality report is written concurrently with the other outputs
+    quality_sinks = [QualityReportSink(extractor, output_dir, month_year)] if 'quality' in args.formats else []
+    files_created, platform_stats = OutputGenerator().generate_reports(
+        results, output_dir, month_year, extra_sinks=quality_sinks,
+        formats=[fmt for fmt in args.formats if fmt in ('csv', 'parquet')]
+    )
+    summary['social_media_accounts'] = sum(platform_stats.values())
+    summary['platforms'] = dict(platform_stats)
+    for file_type, count, filepath in files_created:
+        summary['outputs'].append({'type': file_type, 'count': count, 'path': filepath})
+
+    quality_report = extractor.get_extraction_quality_report()
+    summary['field_success_rates'] = {
+        field: stats['success_rate'] for field, stats in quality_report['field_success_rates'].items()
+    }
+    summary['extraction_warnings'] = len(quality_report['extraction_warnings'])
+
+    # The run is complete, so there is nothing left to resume
+    journal.clear()
+    summary['elapsed_seconds'] = round(time.monotonic() - started, 2)
+    return (EXIT_FILE_ERRORS if summary['files_failed'] else EXIT_OK), summary
+
+
+def watch(args):
+    """Run the watch-folder mode and return the exit code"""
+    month_year = f"{args.month} {args.year}"
+    for folder in args.folders:
+        if not os.path.isdir(folder):
+            print_event({'event': 'error', 'error': f"Input folder not found: {folder}"})
+            return EXIT_USAGE
+    output_dir = args.output_dir or args.folders[0]
+    os.makedirs(output_dir, exist_ok=True)
+
+    watcher = FolderWatcher(
+        args.folders, month_year, build_extractor(args), output_folder=output_dir,
+        poll_interval=args.poll_interval, settle_seconds=0 if args.once else 2, workers=args.workers,
+        auto_regenerate=args.auto_regenerate, event_callback=print_event, formats=args.formats
+    )
+    if args.once:
+        watcher.poll_once()
+        watcher.regenerate()
+        return EXIT_FILE_ERRORS if watcher.failures else EXIT_OK
+
+    handlers = {signal.SIGINT: lambda signum, frame: watcher.stop(),
+                signal.SIGTERM: lambda signum, frame: watcher.stop()}
+    if hasattr(signal, 'SIGUSR1'):
+        handlers[signal.SIGUSR1] = lambda signum, frame: watcher.request_regenerate()
+    previous_handlers = install_signal_handlers(handlers)
+    try:
+        print_event({'event': 'watching', 'folders': watcher.folders, 'month_year': month_year,
+                     'output_dir': output_dir, 'pid': os.getpid()})
+        watcher.run()
+    finally:
+        restore_signal_handlers(previous_handlers)
+    print_event({'event': 'stopped', 'files': len(watcher.processed), 'failed': len(watcher.failures)})
+    return EXIT_OK
+
+
+def print_event(event):
+    """Watch-mode output: one JSON object per line, flushed so log collectors see it immediately"""
+    print(json.dumps(event), flush=True)
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.workers is not None and args.workers < 1:
+        print("error: --workers must be at least 1", file=sys.stderr)
+        return EXIT_USAGE
+    # Only the default workbook is created when missing; a mistyped --config must not run on defaults
+    if args.config and not os.path.isfile(args.config):
+        print(f"error: config workbook not found: {args.config}", file=sys.stderr)
+        return EXIT_USAGE
+    if 'parquet' in args.formats:
+        try:
+            import_pyarrow()
+        except ImportError as e:
+            print(f"error: {e}", file=sys.stderr)
+            return EXIT_USAGE
+
+    if args.watch:
+        try:
+            return watch(args)
+        except Exception as e:
+            print_event({'event': 'error', 'error': f"{type(e).__name__}: {e}"})
+            return EXIT_FAILED
+
+    # SIGINT/SIGTERM (e.g. a scheduler timeout) stop the batch after the files in progress
+    cancel_event = threading.Event()
+    previous_handlers = install_signal_handlers({
+        signal.SIGINT: lambda signum, frame: cancel_event.set(),
+        signal.SIGTERM: lambda signum, frame: cancel_event.set()
+    })
+    try:
+        exit_code, summary = run(args, cancel_event)
+    except Exception as e:
+        exit_code, summary = EXIT_FAILED, {'error': f"{type(e).__name__}: {e}"}
+    finally:
+        restore_signal_handlers(previous_handlers)
+
+    summary['exit_code'] = exit_code
+    print(json.dumps(summary, indent=2))
+    return exit_code
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
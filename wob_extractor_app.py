@@ -1,10 +1,19 @@
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
+import multiprocessing
 import os
+import queue
+import threading
 from datetime import datetime
 from config_manager import ConfigManager
 from extractor_engine import SmartExtractor
-from output_generator import OutputGenerator
+from output_generator import OutputGenerator, QualityReportSink
+from result_cache import ResultCache, PageTextCache
+from checkpoint_journal import CheckpointJournal
+from pdf_discovery import PdfIndex, find_pdfs
+
+# How often the UI drains events posted by the processing thread (about 20 frames/second)
+UI_REFRESH_MS = 50
 
 class WOBExtractorApp:
     def __init__(self, root):
@@ -15,13 +24,24 @@ class WOBExtractorApp:
         # Initialize components
         self.config_manager = ConfigManager()
         self.debug_mode = False  # Can be toggled via UI
-        self.extractor = SmartExtractor(self.config_manager, debug_mode=self.debug_mode)
+        self.result_cache = ResultCache()  # Reruns of a month skip PDFs that haven't changed
+        self.page_cache = PageTextCache()  # Pattern changes re-parse cached page text
+        self.pdf_index = PdfIndex(os.path.join('cache', 'pdf_index.json'))  # Only changed folders are re-listed
+        self.extractor = SmartExtractor(self.config_manager, debug_mode=self.debug_mode,
+                                        cache=self.result_cache, page_cache=self.page_cache)
         self.output_gen = OutputGenerator()
         
         self.selected_folder = None
         
+        # Processing runs on a worker thread; it posts log lines, progress and
+        # dialogs to this queue and the Tk main loop applies them in batches
+        self.events = queue.Queue()
+        self.worker = None
+        self.cancel_event = threading.Event()
+        
         # Create UI
         self.create_widgets()
+        self.root.after(UI_REFRESH_MS, self.drain_events)
         
     def create_widgets(self):
         # Title
@@ -94,15 +114,37 @@ class WOBExtractorApp:
         )
         debug_checkbox.pack(pady=5)
         
-        self.process_btn = tk.Button(
+        # Resume reuses the files an interrupted run already finished
+        self.resume_var = tk.BooleanVar(value=True)
+        resume_checkbox = tk.Checkbutton(
             step3_frame,
+            text="Resume interrupted run (skip files already processed)",
+            variable=self.resume_var
+        )
+        resume_checkbox.pack(pady=5)
+        
+        button_frame = tk.Frame(step3_frame)
+        button_frame.pack()
+        
+        self.process_btn = tk.Button(
+            button_frame,
             text="🚀 Extract Data from Reports",
             command=self.process_reports,
             bg="#2196F3", fg="white", font=("Arial", 11, "bold"),
             padx=20, pady=10, cursor="hand2",
             state="disabled"
         )
-        self.process_btn.pack(pady=5)
+        self.process_btn.pack(side='left', padx=5, pady=5)
+        
+        self.cancel_btn = tk.Button(
+            button_frame,
+            text="⏹ Cancel",
+            command=self.cancel_processing,
+            font=("Arial", 11),
+            padx=20, pady=10,
+            state="disabled"
+        )
+        self.cancel_btn.pack(side='left', padx=5, pady=5)
         
         # Progress bar
         self.progress = ttk.Progressbar(self.root, length=500, mode='determinate')
@@ -134,9 +176,52 @@ class WOBExtractorApp:
             self.log(f"Folder selected: {folder}")
     
     def log(self, message):
-        self.status_text.insert(tk.END, f"{message}\n")
-        self.status_text.see(tk.END)
-        self.root.update()
+        """Queue a status line; safe to call from the processing thread"""
+        self.events.put(('log', message))
+    
+    def post(self, event, *args):
+        """Queue a UI update for the main thread"""
+        self.events.put((event, *args))
+    
+    def drain_events(self):
+        """Apply every queued UI update, inserting all pending log lines at once"""
+        lines = []
+        try:
+            while True:
+                event, *args = self.events.get_nowait()
+                if event == 'log':
+                    lines.append(args[0])
+                    continue
+                # Dialogs and state changes come after the lines logged before them
+                self.flush_log(lines)
+                lines = []
+                self.handle_event(event, *args)
+        except queue.Empty:
+            pass
+        self.flush_log(lines)
+        self.root.after(UI_REFRESH_MS, self.drain_events)
+    
+    def flush_log(self, lines):
+        if lines:
+            self.status_text.insert(tk.END, "\n".join(lines) + "\n")
+            self.status_text.see(tk.END)
+    
+    def handle_event(self, event, *args):
+        if event == 'progress':
+            self.progress['value'] = args[0]
+        elif event == 'progress_maximum':
+            self.progress['maximum'] = args[0]
+            self.progress['value'] = 0
+        elif event == 'warning':
+            messagebox.showwarning(*args)
+        elif event == 'info':
+            messagebox.showinfo(*args)
+        elif event == 'error':
+            messagebox.showerror(*args)
+        elif event == 'done':
+            self.worker = None
+            self.process_btn.config(state="normal")
+            self.cancel_btn.config(state="disabled")
     
     def toggle_debug_mode(self):
         """Toggle debug mode for detailed extraction logging"""
@@ -148,45 +233,66 @@ class WOBExtractorApp:
             self.log("Debug mode disabled")
     
     def find_pdfs(self, folder, month_year):
-        pdf_files = []
-        for file in os.listdir(folder):
-            if file.endswith('.pdf') and month_year in file:
-                pdf_files.append(os.path.join(folder, file))
-        return pdf_files
+        """PDFs for month_year in folder and its subfolders (e.g. one folder per district)"""
+        return find_pdfs(folder, month_year, index=self.pdf_index)
     
     def process_reports(self):
+        if self.worker is not None:
+            return
+        
+        # Clear previous status
+        self.status_text.delete(1.0, tk.END)
+        self.process_btn.config(state="disabled")
+        self.cancel_btn.config(state="normal")
+        self.cancel_event.clear()
+        
+        # Get selected month/year (Tk widgets are only read on the main thread)
+        month_year = f"{self.month_var.get()} {self.year_var.get()}"
+        resume = self.resume_var.get()
+        
+        self.worker = threading.Thread(target=self.run_batch, args=(self.selected_folder, month_year, resume),
+                                       daemon=True)
+        self.worker.start()
+    
+    def cancel_processing(self):
+        """Stop the running batch after the files currently being extracted"""
+        if self.worker is not None and not self.cancel_event.is_set():
+            self.cancel_event.set()
+            self.cancel_btn.config(state="disabled")
+            self.log("\n⏹ Cancelling - finishing the files already in progress...")
+    
+    def run_batch(self, folder, month_year, resume=True):
+        """Extract and write the reports for month_year; runs on the worker thread"""
         try:
-            # Clear previous status
-            self.status_text.delete(1.0, tk.END)
-            self.process_btn.config(state="disabled")
-            
             # Reset extraction statistics for new batch
             self.extractor.reset_extraction_stats()
             
-            # Get selected month/year
-            month_year = f"{self.month_var.get()} {self.year_var.get()}"
-            
             # Find PDFs
             self.log(f"🔍 Looking for {month_year} reports...")
-            pdf_files = self.find_pdfs(self.selected_folder, month_year)
+            pdf_files = self.find_pdfs(folder, month_year)
             
             if not pdf_files:
-                messagebox.showwarning("No Files", f"No PDF files found for {month_year}")
-                self.process_btn.config(state="normal")
+                self.post('warning', "No Files", f"No PDF files found for {month_year}")
                 return
                 
             self.log(f"📄 Found {len(pdf_files)} PDF files")
             
+            # Completed files are journaled in the output folder as the batch runs
+            journal = CheckpointJournal(folder, month_year)
+            if resume and len(journal):
+                self.log(f"♻️ Resuming: {len(journal)} files completed by a previous run will be reused")
+            else:
+                journal.clear()
+            
             # Process each PDF
-            self.progress['maximum'] = len(pdf_files)
-            self.progress['value'] = 0
-            results = []
+            self.post('progress_maximum', len(pdf_files))
+            files_done = 0
             locked_pdfs = []
             other_errors = []
             
-            for i, pdf in enumerate(pdf_files):
-                self.log(f"\n📖 Processing: {os.path.basename(pdf)}")
-                result = self.extractor.extract_from_pdf(pdf)
+            def on_file_done(i, pdf, result):
+                nonlocal files_done
+                self.log(f"\n📖 Processed: {os.path.basename(pdf)}")
                 
                 if 'error' in result:
                     error_type = result.get('error_type', 'general_error')
@@ -206,19 +312,35 @@ class WOBExtractorApp:
                     num_records = len(result.get('records', []))
                     self.log(f"  ✓ Found {num_records} subjects of concern")
                 
-                results.append(result)
-                self.progress['value'] = i + 1
-                self.root.update()
+                files_done += 1
+                self.post('progress', files_done)
+            
+            # Fan the PDFs out across all CPU cores; results come back in input order
+            results = self.extractor.extract_many(pdf_files, progress_callback=on_file_done,
+                                                  journal=journal, cancel_event=self.cancel_event)
+            
+            if self.cancel_event.is_set():
+                completed = sum(1 for result in results if result is not None)
+                self.log(f"\n⏹ Cancelled after {completed} of {len(pdf_files)} files.")
+                self.log("Completed files are saved - run again with 'Resume' ticked to continue.")
+                return
             
             # Generate output files
             self.log("\n📊 Generating output files...")
+            # The extraction quality report is written alongside the other outputs
+            self.log("\n📈 Generating extraction quality report...")
             files_created, platform_stats = self.output_gen.generate_reports(
-                results, self.selected_folder, month_year
+                results, folder, month_year,
+                extra_sinks=[QualityReportSink(self.extractor, folder, month_year)]
             )
+            quality_file = None
+            for file_type, count, filepath in files_created:
+                if file_type == 'Extraction Quality Report':
+                    quality_file = filepath
+            files_created = [entry for entry in files_created if entry[0] != 'Extraction Quality Report']
             
-            # Generate and save extraction quality report
-            self.log("\n📈 Generating extraction quality report...")
-            quality_file = self.extractor.save_extraction_quality_report(self.selected_folder, month_year)
+            # The run is complete, so there is nothing left to resume
+            journal.clear()
             
             # Get extraction quality summary
             quality_report = self.extractor.get_extraction_quality_report()
@@ -268,7 +390,7 @@ class WOBExtractorApp:
                 for pdf, error in other_errors:
                     self.log(f"  - {pdf}: {error}")
             
-            self.log(f"\n📁 Files saved to: {self.selected_folder}")
+            self.log(f"\n📁 Files saved to: {folder}")
             self.log(f"📝 Error log saved to: logs/wob_extractor_{datetime.now().strftime('%Y%m%d')}.log")
             if quality_file:
                 self.log(f"📈 Quality report saved to: {os.path.basename(quality_file)}")
@@ -311,15 +433,17 @@ class WOBExtractorApp:
             success_msg += "• Extraction Quality Report\n"
             success_msg += "• Detailed logs"
             
-            messagebox.showinfo("Processing Complete", success_msg)
+            self.post('info', "Processing Complete", success_msg)
             
         except Exception as e:
             self.log(f"\n❌ Error: {str(e)}")
-            messagebox.showerror("Error", f"An error occurred:\n\n{str(e)}")
+            self.post('error', "Error", f"An error occurred:\n\n{str(e)}")
         finally:
-            self.process_btn.config(state="normal")
+            self.post('done')
 
 def main():
+    # Needed for the worker processes of the PyInstaller one-file build
+    multiprocessing.freeze_support()
     root = tk.Tk()
     app = WOBExtractorApp(root)
     root.mainloop()